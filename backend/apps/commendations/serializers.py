@@ -38,6 +38,8 @@ class CommendationTypeSerializer(MediaURLMixin, serializers.ModelSerializer):
         return obj.medal_image_url
 
     def get_awards_count(self, obj):
+        if hasattr(obj, 'awards_total'):
+            return obj.awards_total
         return obj.commendation_set.count()
 
 
@@ -0,0 +1,42 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.core.testing import QueryBudgetTestMixin
+from apps.units.models import Branch, Rank
+from apps.users.models import User
+
+from .models import Commendation, CommendationType
+from .views import CommendationTypeViewSet
+
+
+class CommendationTypeQueryBudgetTests(QueryBudgetTestMixin, TestCase):
+
+    def setUp(self):
+        cache.clear()
+        army = Branch.objects.create(name='Army', abbreviation='A')
+        navy = Branch.objects.create(name='Navy', abbreviation='N')
+        rank = Rank.objects.create(name='Sergeant', abbreviation='SGT', branch=army, tier=4)
+        user = User.objects.create_user(discord_id='1', username='soldier')
+        self.client.force_login(user)
+        for i in range(8):
+            commendation_type = CommendationType.objects.create(
+                name=f'Medal {i}', abbreviation=f'M{i}', category='service', precedence=i,
+                min_rank_requirement=rank
+            )
+            commendation_type.allowed_branches.set([army, navy])
+            for award_number in range(1, i % 3 + 1):
+                Commendation.objects.create(
+                    user=user, commendation_type=commendation_type, award_number=award_number,
+                    awarded_date=timezone.now(), citation='For service', short_citation='Service'
+                )
+
+    def test_list_is_within_budget(self):
+        with self.assertWithinQueryBudget(CommendationTypeViewSet, 'list'):
+            response = self.client.get('/api/commendations/types/')
+        self.assertEqual(response.status_code, 200)
+
+        types = response.json()['results']
+        self.assertEqual([commendation_type['awards_count'] for commendation_type in types], [0, 1, 2, 0, 1, 2, 0, 1])
+        self.assertEqual(len(types[0]['allowed_branches']), 2)
+        self.assertEqual(types[0]['min_rank_name'], 'Sergeant')
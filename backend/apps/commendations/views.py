@@ -14,6 +14,8 @@ from .serializers import (
 )
 from apps.users.views import IsAdminOrReadOnly
 from django.contrib.auth import get_user_model
+from apps.core.cache import cached_response
+from apps.units.models import Branch, Rank
 from apps.core.views import MediaContextMixin
 
 User = get_user_model()
@@ -28,12 +30,30 @@ class CommendationTypeViewSet(MediaContextMixin, viewsets.ModelViewSet):
     search_fields = ['name', 'abbreviation', 'description', 'eligibility_criteria']
     ordering_fields = ['precedence', 'name', 'category']
     ordering = ['precedence']
+    # Queries per request, authentication included (see apps.core.instrumentation)
+    query_budgets = {'list': 5}
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ['list', 'retrieve']:
+            queryset = queryset.select_related('min_rank_requirement').prefetch_related(
+                'allowed_branches'
+            ).annotate(awards_total=Count('commendation'))
+        return queryset
 
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
             return CreateCommendationTypeSerializer
         return CommendationTypeSerializer
 
+    @cached_response(tags=[CommendationType, Commendation, Rank, Branch])
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cached_response(tags=[CommendationType, Commendation, Rank, Branch])
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     @action(detail=False, methods=['get'])
     def by_category(self, request):
         """Get commendation types grouped by category"""
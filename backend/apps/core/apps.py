@@ -0,0 +1,11 @@
+# backend/apps/core/apps.py
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.core'
+
+    def ready(self):
+        # Register model signal handlers
+        from . import signals  # noqa: F401
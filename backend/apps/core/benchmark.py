@@ -0,0 +1,216 @@
+# backend/apps/core/benchmark.py
+"""
+Endpoint benchmarks against the synthetic organisation
+
+Each benchmark is a GET through the Django test client, logged in as the
+synthetic admin, so it runs the full middleware, auth and serializer stack
+without a web server. For every endpoint the runner reports latency
+percentiles, query counts (with repeated statements) and the peak memory
+allocated while serving one request. compare() flags regressions against a
+stored baseline report.
+
+run_renderers() times the JSON renderers alone on the largest payloads, as
+the views hand them over for rendering.
+"""
+import statistics
+import time
+import tracemalloc
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+
+from .instrumentation import fingerprint, percentile
+from .renderers import ORJSONRenderer
+from .synthetic import SYNTHETIC_ADMIN_USERNAME, SYNTHETIC_PREFIX
+
+# Extra milliseconds a slower p50 must also exceed before it counts, so
+# sub-millisecond noise on fast endpoints is not reported
+LATENCY_NOISE_MS = 2.0
+
+
+def find_targets():
+    """The synthetic admin plus the objects the benchmarks request, or None if there is no synthetic org"""
+    from apps.commendations.models import CommendationType
+    from apps.units.models import Branch, Unit, UnitHierarchyView, UserPosition
+    from apps.users.models import User
+
+    admin = User.objects.filter(username=SYNTHETIC_ADMIN_USERNAME).first()
+    branch = Branch.objects.filter(name__startswith=SYNTHETIC_PREFIX).order_by('name').first()
+    if admin is None or branch is None:
+        return None
+
+    root = Unit.objects.filter(branch=branch, parent_unit__isnull=True).first()
+    # A mid-tree unit: the size of ORBAT most members actually open
+    middle = Unit.objects.filter(branch=branch, unit_level='task_force').order_by('abbreviation').first()
+    member = UserPosition.objects.filter(
+        position__unit__branch=branch, status='active', user__rank_history__isnull=False
+    ).order_by('user__username').values_list('user_id', flat=True).first()
+
+    return {
+        'admin': admin,
+        'branch': branch.id,
+        'root_unit': root.id,
+        'middle_unit': middle.id if middle else root.id,
+        'member': member,
+        'commendation_type': CommendationType.objects.filter(
+            name__startswith=SYNTHETIC_PREFIX
+        ).order_by('precedence').values_list('id', flat=True).first(),
+        'hierarchy_view': UnitHierarchyView.objects.filter(
+            name__startswith=SYNTHETIC_PREFIX
+        ).values_list('id', flat=True).first(),
+    }
+
+
+# name -> function of the targets returning (path, query params)
+ENDPOINTS = {
+    'unit_orbat': lambda t: ('/api/units/orbat/unit_orbat/', {'unit_id': t['root_unit']}),
+    'unit_orbat_task_force': lambda t: ('/api/units/orbat/unit_orbat/', {'unit_id': t['middle_unit']}),
+    'units_list': lambda t: ('/api/units/', {}),
+    'ranks_list': lambda t: ('/api/units/ranks/', {}),
+    'hierarchy_data': lambda t: (f"/api/units/hierarchy/{t['hierarchy_view']}/data/", {}),
+    'profile_detail': lambda t: (f"/api/users/profile/{t['member']}/", {}),
+    'promotion_progress': lambda t: (f"/api/promotions/progress/{t['member']}/", {}),
+    'get_units': lambda t: ('/api/onboarding/applications/get-units/', {'branch_id': t['branch']}),
+    'commendation_statistics': lambda t: (
+        f"/api/commendations/types/{t['commendation_type']}/statistics/", {}
+    ),
+}
+
+
+def run_endpoint(client, path, params, iterations, warmup, cold):
+    """Benchmark one endpoint; returns its report entry"""
+    for _ in range(warmup):
+        client.get(path, params)
+
+    timings, query_counts, repeated_counts = [], [], []
+    status_code = None
+    for _ in range(iterations):
+        if cold:
+            cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = client.get(path, params)
+            timings.append((time.perf_counter() - start) * 1000)
+        status_code = response.status_code
+
+        seen = {}
+        for query in queries.captured_queries:
+            key = fingerprint(query['sql'])
+            seen[key] = seen.get(key, 0) + 1
+        query_counts.append(len(queries))
+        repeated_counts.append(sum(count - 1 for count in seen.values()))
+
+    # Allocation tracing slows everything down, so it gets a request of its own
+    if cold:
+        cache.clear()
+    tracemalloc.start()
+    try:
+        client.get(path, params)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'path': path,
+        'params': {key: str(value) for key, value in params.items()},
+        'status': status_code,
+        'iterations': iterations,
+        'p50_ms': round(percentile(timings, 50), 2),
+        'p95_ms': round(percentile(timings, 95), 2),
+        'mean_ms': round(statistics.mean(timings), 2),
+        'max_ms': round(timings[-1], 2),
+        'queries': max(query_counts),
+        'repeated_queries': max(repeated_counts),
+        'alloc_peak_kb': round(peak / 1024, 1),
+    }
+
+
+def run(targets, names=None, iterations=20, warmup=2, cold=False, log=None):
+    """Run the named benchmarks (all by default); returns {name: report entry}"""
+    log = log or (lambda message: None)
+    client = Client()
+    client.force_login(targets['admin'])
+
+    results = {}
+    for name, endpoint in ENDPOINTS.items():
+        if names and name not in names:
+            continue
+        path, params = endpoint(targets)
+        log(f'{name}: {path}')
+        results[name] = run_endpoint(client, path, params, iterations, warmup, cold)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Regressions of results against a baseline report's results: a p50 or
+    allocation peak more than threshold (a fraction) above the baseline, or
+    any extra query.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        if current['queries'] > previous['queries']:
+            regressions.append({'endpoint': name, 'metric': 'queries',
+                                'baseline': previous['queries'], 'current': current['queries']})
+        if (current['p50_ms'] > previous['p50_ms'] * (1 + threshold)
+                and current['p50_ms'] - previous['p50_ms'] > LATENCY_NOISE_MS):
+            regressions.append({'endpoint': name, 'metric': 'p50_ms',
+                                'baseline': previous['p50_ms'], 'current': current['p50_ms']})
+        if current['alloc_peak_kb'] > previous['alloc_peak_kb'] * (1 + threshold):
+            regressions.append({'endpoint': name, 'metric': 'alloc_peak_kb',
+                                'baseline': previous['alloc_peak_kb'], 'current': current['alloc_peak_kb']})
+    return regressions
+
+
+RENDERERS = {
+    'drf': JSONRenderer,
+    'orjson': ORJSONRenderer,
+}
+
+# Benchmarks whose responses make the largest payloads
+RENDER_PAYLOADS = ['hierarchy_data', 'profile_detail', 'ranks_list']
+
+
+def collect_payloads(targets):
+    """{name: data} of the largest payloads, as the views pass them to the renderer"""
+    from apps.units.models import Unit
+    from apps.units.views_orbat import ORBATViewSet
+
+    # unit_orbat renders its payload itself, into a cached snapshot
+    root = Unit.objects.select_related('branch').get(id=targets['root_unit'])
+    payloads = {'unit_orbat': ORBATViewSet()._build_unit_orbat(root, True)}
+
+    client = Client()
+    client.force_login(targets['admin'])
+    for name in RENDER_PAYLOADS:
+        path, params = ENDPOINTS[name](targets)
+        payloads[name] = client.get(path, params).data
+    return payloads
+
+
+def run_renderers(payloads, iterations=50):
+    """Time every renderer on every payload; returns {payload: {renderer: stats}}"""
+    results = {}
+    for name, data in payloads.items():
+        results[name] = {}
+        for renderer_name, renderer_class in RENDERERS.items():
+            renderer = renderer_class()
+            size = len(renderer.render(data))
+            start = time.perf_counter()
+            for _ in range(iterations):
+                renderer.render(data)
+            elapsed = time.perf_counter() - start
+            results[name][renderer_name] = {
+                'bytes': size,
+                'ms': round(elapsed / iterations * 1000, 3),
+                'mb_per_s': round(size * iterations / elapsed / 1_000_000, 1),
+            }
+    return results
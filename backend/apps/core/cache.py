@@ -0,0 +1,178 @@
+# backend/apps/core/cache.py
+"""
+Project cache layer
+
+Namespaced keys, tag-based invalidation and single-flight recomputation on top
+of Django's cache framework, so it behaves the same on the locmem and file
+backends used locally and on Redis in production.
+
+Tags are versioned rather than enumerated: each tag has a version token in the
+cache, every entry remembers the tokens of its tags from when it was built, and
+invalidating a tag replaces its token, which makes all of its entries stale at
+once without having to find them. Each model in TAGGED_MODELS is a tag
+("units.rank"); the handlers in apps/core/signals.py invalidate it whenever
+one of its rows is saved or deleted.
+
+ViewSets opt in per read action:
+
+    @cached_response(tags=[Rank, Branch])
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+"""
+import functools
+import hashlib
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.response import Response
+
+CACHE_DEFAULT_TIMEOUT = getattr(settings, 'CACHE_DEFAULT_TIMEOUT', 60 * 15)
+# A builder holding the lock longer than this is presumed dead
+CACHE_LOCK_TIMEOUT = getattr(settings, 'CACHE_LOCK_TIMEOUT', 30)
+# How long other callers wait for the builder before building themselves
+CACHE_LOCK_WAIT = getattr(settings, 'CACHE_LOCK_WAIT', 5)
+CACHE_POLL_INTERVAL = 0.05
+
+# Models whose saves and deletes invalidate their tag
+TAGGED_MODELS = [
+    'units.Branch',
+    'units.Rank',
+    'units.Role',
+    'units.MOS',
+    'units.Unit',
+    'units.Position',
+    'units.UserPosition',
+    'units.RecruitmentSlot',
+    'commendations.CommendationType',
+    'commendations.Commendation',
+]
+
+
+def model_tag(model):
+    """The tag of a model class or "app_label.ModelName" label"""
+    if isinstance(model, str):
+        return model.lower()
+    return model._meta.label_lower
+
+
+def make_key(namespace, *parts):
+    """A cache key within namespace; parts of any length are hashed to keep keys short"""
+    digest = hashlib.md5(':'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'{namespace}:{digest}'
+
+
+def _tag_key(tag):
+    return f'tag:{tag}'
+
+
+def tag_versions(tags):
+    """Current version tokens of the tags, creating tokens for new tags"""
+    keys = [_tag_key(tag) for tag in sorted(tags)]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, uuid.uuid4().hex, None)
+            versions[key] = cache.get(key)
+    return tuple(versions[key] for key in keys)
+
+
+def invalidate_tags(*tags):
+    """Make every entry stored under any of the tags stale"""
+    cache.set_many({_tag_key(model_tag(tag)): uuid.uuid4().hex for tag in tags}, None)
+
+
+def invalidate_tags_on_commit(*tags):
+    """invalidate_tags once the surrounding transaction commits"""
+    transaction.on_commit(lambda: invalidate_tags(*tags))
+
+
+def get_or_set(namespace, parts, build, tags=(), timeout=CACHE_DEFAULT_TIMEOUT):
+    """
+    The cached value for (namespace, *parts), or build() stored under the tags.
+
+    Only one caller at a time builds a missing value; the others wait up to
+    CACHE_LOCK_WAIT seconds for it to appear before building it themselves.
+    build() may raise Uncacheable(value) to return a value without storing it.
+    """
+    key = make_key(namespace, *parts)
+    tags = [model_tag(tag) for tag in tags]
+    versions = tag_versions(tags)
+
+    entry = cache.get(key)
+    if entry is not None and entry[0] == versions:
+        return entry[1]
+
+    lock_key = f'lock:{key}'
+    token = uuid.uuid4().hex
+    if cache.add(lock_key, token, CACHE_LOCK_TIMEOUT):
+        try:
+            return _build_and_store(key, build, tags, versions, timeout)
+        finally:
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+
+    deadline = time.monotonic() + CACHE_LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(CACHE_POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None and entry[0] == versions:
+            return entry[1]
+        if cache.get(lock_key) is None:
+            # The builder finished without storing (or died); do not wait any longer
+            break
+    return _build_and_store(key, build, tags, versions, timeout)
+
+
+def _build_and_store(key, build, tags, versions, timeout):
+    try:
+        value = build()
+    except Uncacheable as e:
+        return e.value
+    # A tag invalidated while building means the value may already be out of date
+    if tag_versions(tags) == versions:
+        cache.set(key, (versions, value), timeout)
+    return value
+
+
+class Uncacheable(Exception):
+    """Raised by a get_or_set builder to return value without caching it"""
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+
+def cached_response(tags, timeout=CACHE_DEFAULT_TIMEOUT, vary_on_user=False):
+    """
+    Cache the data of a ViewSet read action's successful responses.
+
+    Entries are keyed by the view, the action and the full request URL, and go
+    stale when any of the tags (models or labels) is invalidated. View-level
+    permissions are still checked on every request, but a cache hit never
+    calls get_object(), so object-level permission checks do not run: only
+    cache retrieve actions whose objects need none. Set vary_on_user for
+    actions whose output depends on who is asking.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            namespace = f'view:{type(self).__name__}.{method.__name__}'
+            parts = [request.build_absolute_uri()]
+            if vary_on_user:
+                parts.append(request.user.pk)
+
+            def build():
+                response = method(self, request, *args, **kwargs)
+                if response.status_code != 200:
+                    raise Uncacheable(response)
+                return response.data
+
+            data = get_or_set(namespace, parts, build, tags=tags, timeout=timeout)
+            if isinstance(data, Response):
+                return data
+            return Response(data)
+        return wrapper
+    return decorator
@@ -0,0 +1,214 @@
+# backend/apps/core/instrumentation.py
+"""
+Per-endpoint query and latency instrumentation
+
+RequestStatsMiddleware measures every request that reaches a view: SQL query
+count, total DB time, repeated queries (the same SQL run more than once,
+usually an N+1), render time and total time. Each measurement is filed under
+the view and action, e.g. "EventViewSet.list", and then:
+
+- added to the response as X-* and Server-Timing headers when
+  REQUEST_STATS_HEADERS is on (default: DEBUG),
+- logged as one JSON line when REQUEST_STATS_LOG is on (default: not DEBUG),
+- kept in a bounded in-process sample window that RequestStatsView reports
+  as p50/p95. Each worker process keeps its own window.
+
+ViewSets can declare the most queries an action may run, counting
+authentication, as `query_budgets = {'list': 4}`. Requests over budget are
+logged as warnings, and apps.core.testing.QueryBudgetTestMixin fails tests
+that exceed them.
+"""
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+REQUEST_STATS_ENABLED = getattr(settings, 'REQUEST_STATS_ENABLED', True)
+REQUEST_STATS_HEADERS = getattr(settings, 'REQUEST_STATS_HEADERS', settings.DEBUG)
+REQUEST_STATS_LOG = getattr(settings, 'REQUEST_STATS_LOG', not settings.DEBUG)
+# Measurements kept per endpoint for the percentiles
+REQUEST_STATS_SAMPLES = getattr(settings, 'REQUEST_STATS_SAMPLES', 1000)
+
+# IN (%s, %s, ...) lists vary in length with the data, not with the code path
+IN_LIST_RE = re.compile(r'\(\s*%s(?:\s*,\s*%s)*\s*\)')
+
+
+def fingerprint(sql):
+    """The query's SQL with parameter lists collapsed, so repeats of one statement compare equal"""
+    return IN_LIST_RE.sub('(...)', sql)
+
+
+def resolve_endpoint(view_func, method):
+    """(endpoint name, view class, action) for a resolved view function"""
+    view_class = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+    if view_class is None:
+        return f'{view_func.__module__}.{view_func.__name__}', None, None
+
+    actions = getattr(view_func, 'actions', None)
+    action = actions.get(method.lower()) if actions else method.lower()
+    return f'{view_class.__name__}.{action}', view_class, action
+
+
+def get_query_budget(view_class, action):
+    """The query budget the view declares for an action, or None"""
+    return (getattr(view_class, 'query_budgets', None) or {}).get(action)
+
+
+class QueryRecorder:
+    """execute_wrapper that counts and times every query run through it"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    def duplicates(self):
+        """{fingerprint: times run} for statements run more than once, most repeated first"""
+        return {sql: count for sql, count in self.fingerprints.most_common() if count > 1}
+
+
+class RequestStats:
+    """Bounded windows of recent measurements, one per endpoint"""
+
+    def __init__(self, size):
+        self.size = size
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    def add(self, endpoint, sample):
+        with self.lock:
+            if endpoint not in self.samples:
+                self.samples[endpoint] = deque(maxlen=self.size)
+            self.samples[endpoint].append(sample)
+
+    def clear(self):
+        with self.lock:
+            self.samples.clear()
+
+    def summary(self):
+        """{endpoint: {requests, budget, over_budget, <metric>: {p50, p95, max}}}"""
+        with self.lock:
+            snapshot = {endpoint: list(samples) for endpoint, samples in self.samples.items()}
+
+        summary = {}
+        for endpoint, samples in sorted(snapshot.items()):
+            budget = samples[-1]['budget']
+            summary[endpoint] = {
+                'requests': len(samples),
+                'budget': budget,
+                'over_budget': sum(1 for sample in samples if sample['over_budget']),
+            }
+            for metric in ('queries', 'duplicate_queries', 'db_ms', 'render_ms', 'total_ms'):
+                values = sorted(sample[metric] for sample in samples)
+                summary[endpoint][metric] = {
+                    'p50': percentile(values, 50),
+                    'p95': percentile(values, 95),
+                    'max': values[-1],
+                }
+        return summary
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of sorted values"""
+    index = max(0, -(-len(values) * pct // 100) - 1)
+    return values[int(index)]
+
+
+request_stats = RequestStats(REQUEST_STATS_SAMPLES)
+
+
+class RequestStatsMiddleware:
+    """Measures each request that reaches a view; see the module docstring"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not REQUEST_STATS_ENABLED:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        request._request_stats = {'endpoint': None, 'render_start': None, 'render_end': None}
+        start = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+        total = time.perf_counter() - start
+
+        stats = request._request_stats
+        if stats['endpoint'] is not None:
+            self.record(request, response, recorder, total, stats)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if hasattr(request, '_request_stats'):
+            request._request_stats.update(zip(
+                ('endpoint', 'view_class', 'action'),
+                resolve_endpoint(view_func, request.method)
+            ))
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered right after this hook returns
+        stats = getattr(request, '_request_stats', None)
+        if stats is not None:
+            stats['render_start'] = time.perf_counter()
+            response.add_post_render_callback(
+                lambda rendered: stats.update(render_end=time.perf_counter())
+            )
+        return response
+
+    def record(self, request, response, recorder, total, stats):
+        render = 0.0
+        if stats['render_start'] is not None and stats['render_end'] is not None:
+            render = stats['render_end'] - stats['render_start']
+
+        duplicates = recorder.duplicates()
+        budget = get_query_budget(stats['view_class'], stats['action'])
+        sample = {
+            'queries': recorder.count,
+            'duplicate_queries': sum(duplicates.values()) - len(duplicates),
+            'db_ms': round(recorder.duration * 1000, 2),
+            'render_ms': round(render * 1000, 2),
+            'total_ms': round(total * 1000, 2),
+            'budget': budget,
+            'over_budget': budget is not None and recorder.count > budget,
+        }
+        request_stats.add(stats['endpoint'], sample)
+
+        if REQUEST_STATS_HEADERS:
+            response['X-DB-Query-Count'] = sample['queries']
+            response['X-DB-Duplicate-Queries'] = sample['duplicate_queries']
+            response['X-DB-Time-Ms'] = sample['db_ms']
+            response['X-Render-Time-Ms'] = sample['render_ms']
+            response['X-Response-Time-Ms'] = sample['total_ms']
+            response['Server-Timing'] = (
+                f"db;dur={sample['db_ms']}, render;dur={sample['render_ms']}, total;dur={sample['total_ms']}"
+            )
+
+        if REQUEST_STATS_LOG or sample['over_budget']:
+            line = dict(
+                sample,
+                endpoint=stats['endpoint'],
+                method=request.method,
+                path=request.path,
+                status=response.status_code,
+                # The worst offenders are enough to find the N+1
+                repeated=[{'sql': sql[:300], 'count': count} for sql, count in list(duplicates.items())[:3]],
+            )
+            level = logging.WARNING if sample['over_budget'] else logging.INFO
+            logger.log(level, 'request_stats %s', json.dumps(line))
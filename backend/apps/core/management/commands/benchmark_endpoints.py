@@ -0,0 +1,87 @@
+# backend/apps/core/management/commands/benchmark_endpoints.py
+"""
+Benchmark the heavy endpoints against the synthetic organisation.
+
+    python manage.py generate_synthetic_org --scale medium
+    python manage.py benchmark_endpoints --output bench.json
+    python manage.py benchmark_endpoints --baseline bench.json --fail-on-regression
+
+Prints (or writes) a JSON report with latency percentiles, query counts and
+allocation peaks per endpoint. With --baseline, regressions against that
+earlier report are listed too.
+"""
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from apps.core import benchmark
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks heavy API endpoints against the synthetic organisation and reports JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Timed requests per endpoint')
+        parser.add_argument('--warmup', type=int, default=2, help='Untimed requests per endpoint first')
+        parser.add_argument('--cold', action='store_true',
+                            help='Clear the cache before every request (clears the whole configured cache)')
+        parser.add_argument('--endpoint', action='append', choices=sorted(benchmark.ENDPOINTS),
+                            help='Only run this benchmark (repeatable)')
+        parser.add_argument('--output', help='Write the report to this file instead of stdout')
+        parser.add_argument('--baseline', help='Earlier report to compare against')
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help='Allowed slowdown or allocation growth over the baseline, as a fraction')
+        parser.add_argument('--fail-on-regression', action='store_true',
+                            help='Exit with an error when any regression is found')
+
+    def handle(self, *args, **options):
+        targets = benchmark.find_targets()
+        if targets is None:
+            raise CommandError('No synthetic organisation found; run generate_synthetic_org first')
+
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline']) as f:
+                baseline = json.load(f)
+
+        self.stderr.write('Benchmarking endpoints...')
+        # The test client talks to the app directly as "testserver"
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            results = benchmark.run(
+                targets, names=options['endpoint'], iterations=options['iterations'],
+                warmup=options['warmup'], cold=options['cold'], log=self.stderr.write
+            )
+
+        report = {
+            'generated_at': timezone.now().isoformat(),
+            'iterations': options['iterations'],
+            'cold': options['cold'],
+            'results': results,
+        }
+        if baseline is not None:
+            report['regressions'] = benchmark.compare(results, baseline['results'], options['threshold'])
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+        else:
+            self.stdout.write(output)
+
+        failed = [name for name, result in results.items() if result['status'] != 200]
+        if failed:
+            self.stderr.write(self.style.WARNING(f"Non-200 responses from: {', '.join(failed)}"))
+
+        regressions = report.get('regressions', [])
+        for regression in regressions:
+            self.stderr.write(self.style.ERROR(
+                f"Regression in {regression['endpoint']}: {regression['metric']} "
+                f"{regression['baseline']} -> {regression['current']}"
+            ))
+        if regressions and options['fail_on_regression']:
+            raise CommandError(f'{len(regressions)} regression(s) against {options["baseline"]}')
+
+        self.stderr.write(self.style.SUCCESS(f'Successfully benchmarked {len(results)} endpoints'))
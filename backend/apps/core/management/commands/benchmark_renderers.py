@@ -0,0 +1,51 @@
+# backend/apps/core/management/commands/benchmark_renderers.py
+"""
+Compare the JSON renderers on the largest payloads of the synthetic organisation.
+
+    python manage.py generate_synthetic_org --scale large
+    python manage.py benchmark_renderers --iterations 100
+
+Reports payload size, time per render and throughput for DRF's stock
+JSONRenderer and the orjson renderer the API is configured with.
+"""
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from apps.core import benchmark
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks the JSON renderers on the largest synthetic payloads and reports bytes/sec'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=50, help='Timed renders per payload and renderer')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON instead of a table')
+
+    def handle(self, *args, **options):
+        targets = benchmark.find_targets()
+        if targets is None:
+            raise CommandError('No synthetic organisation found; run generate_synthetic_org first')
+
+        self.stderr.write('Collecting payloads...')
+        # The test client talks to the app directly as "testserver"
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            payloads = benchmark.collect_payloads(targets)
+
+        self.stderr.write('Benchmarking renderers...')
+        results = benchmark.run_renderers(payloads, iterations=options['iterations'])
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+        else:
+            self.stdout.write(f"{'payload':<16}{'renderer':<10}{'bytes':>12}{'ms':>10}{'MB/s':>10}")
+            for name, renderers in results.items():
+                for renderer_name, result in renderers.items():
+                    self.stdout.write(
+                        f"{name:<16}{renderer_name:<10}{result['bytes']:>12}"
+                        f"{result['ms']:>10}{result['mb_per_s']:>10}"
+                    )
+
+        self.stderr.write(self.style.SUCCESS(f'Successfully benchmarked {len(payloads)} payloads'))
@@ -0,0 +1,62 @@
+# backend/apps/core/management/commands/generate_synthetic_org.py
+"""
+Generate a seeded synthetic organisation for local performance work.
+
+    python manage.py generate_synthetic_org --scale medium --seed 42
+    python manage.py generate_synthetic_org --clear
+
+Never run this against production data; --clear deletes everything whose
+name starts with the synthetic prefix.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.synthetic import SCALES, SYNTHETIC_ADMIN_USERNAME, SyntheticOrg, clear
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Generates a synthetic organisation (units, members, events, forums, ...) for benchmarking'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=sorted(SCALES), default='small',
+                            help='Preset size of the organisation')
+        parser.add_argument('--seed', type=int, default=0,
+                            help='Random seed; the same seed and sizes give the same organisation')
+        parser.add_argument('--branches', type=int, help='Override the number of branches')
+        parser.add_argument('--fanout', type=int, help='Override the subunits per unit')
+        parser.add_argument('--troopers', type=int, help='Override the trooper positions per unit')
+        parser.add_argument('--fill-rate', type=float, default=0.75,
+                            help='Share of positions with an active assignment')
+        parser.add_argument('--events', type=int, help='Override the number of events')
+        parser.add_argument('--threads', type=int, help='Override the number of forum threads')
+        parser.add_argument('--applications', type=int, help='Override the number of applications')
+        parser.add_argument('--clear', action='store_true',
+                            help='Delete the existing synthetic organisation first (or only, with --no-generate)')
+        parser.add_argument('--no-generate', action='store_true',
+                            help='With --clear, only delete')
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            self.stdout.write('Deleting the synthetic organisation...')
+            deleted = clear()
+            self.stdout.write(self.style.SUCCESS(f'Successfully deleted {deleted} synthetic rows'))
+            if options['no_generate']:
+                return
+
+        if User.objects.filter(username=SYNTHETIC_ADMIN_USERNAME).exists():
+            raise CommandError('A synthetic organisation already exists; run with --clear to replace it')
+
+        sizes = dict(SCALES[options['scale']])
+        for name in sizes:
+            if options[name] is not None:
+                sizes[name] = options[name]
+
+        self.stdout.write(f"Generating a {options['scale']} synthetic organisation (seed {options['seed']})...")
+        org = SyntheticOrg(seed=options['seed'], fill_rate=options['fill_rate'], log=self.stdout.write, **sizes)
+        counts = org.generate()
+
+        for name, count in sorted(counts.items()):
+            self.stdout.write(f'  {name}: {count}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Successfully generated the synthetic organisation; log in as {SYNTHETIC_ADMIN_USERNAME} to explore it'
+        ))
@@ -0,0 +1,62 @@
+# backend/apps/core/pagination.py
+"""
+Opt-in keyset (cursor) pagination
+
+Page-number pagination stays the default. A client that wants keyset pages
+asks for them with ?pagination=cursor and then follows the next/previous
+links, which carry ?cursor=... . Keyset pages cost the same however deep
+they go and skip the COUNT(*).
+"""
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class KeysetPagination(CursorPagination):
+    """Cursor pagination over a fixed ordering supplied by the view"""
+
+    def __init__(self, ordering):
+        self.ordering = ordering
+
+    def get_ordering(self, request, queryset, view):
+        # Ignore ?ordering=; keyset pages only work on the indexed ordering
+        return self.ordering
+
+
+class OptionalCursorPagination(PageNumberPagination):
+    """
+    Page-number pagination that switches to keyset pagination on request.
+
+    Views opt in by setting `cursor_ordering`, e.g. ('created_at', 'id'),
+    backed by a matching composite index. The last field should be unique so
+    rows sharing a timestamp keep a stable order.
+    """
+    mode_query_param = 'pagination'
+    cursor_query_param = 'cursor'
+
+    keyset = None
+
+    def use_cursor(self, request, view):
+        return (
+            getattr(view, 'cursor_ordering', None)
+            and (request.query_params.get(self.mode_query_param) == 'cursor'
+                 or self.cursor_query_param in request.query_params)
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_cursor(request, view):
+            self.keyset = KeysetPagination(view.cursor_ordering)
+            page = self.keyset.paginate_queryset(queryset, request, view)
+            self.display_page_controls = self.keyset.display_page_controls
+            return page
+
+        self.keyset = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.keyset is not None:
+            return self.keyset.to_html()
+        return super().to_html()
@@ -0,0 +1,80 @@
+# backend/apps/core/renderers.py
+"""
+orjson-backed JSON renderer and parser
+
+Drop-in replacements for DRF's JSONRenderer and JSONParser, selected in
+REST_FRAMEWORK. orjson encodes dicts, lists, strings, numbers and UUIDs in C;
+anything else (Decimal, timedelta, lazy translations, querysets, datetimes)
+goes through DRF's own encoder. Compact responses match the stock renderer
+byte for byte except for floats:
+
+- exponents are written without a plus sign or leading zeros (1e16, 1.5e-7
+  where DRF writes 1e+16, 1.5e-07); the values are the same;
+- NaN and infinities are written as null, where DRF raises.
+
+Data orjson cannot encode, such as integers wider than 64 bits, is rendered
+by DRF's JSONRenderer instead. Request bodies with integers of 19 or more
+digits, which orjson would read as floats, and bodies in encodings other
+than UTF-8 are parsed by DRF's JSONParser.
+"""
+import re
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import json
+from rest_framework.utils.encoders import JSONEncoder
+
+# Datetimes are handed to DRF's encoder so they keep its millisecond "Z" format
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+# Any integer literal that may not fit in 64 bits
+LONG_INTEGER = re.compile(rb'[0-9]{19,}')
+
+_encoder = JSONEncoder()
+
+
+def dumps(data, indent=False):
+    """Encode data to JSON bytes the way ORJSONRenderer does"""
+    options = ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else ORJSON_OPTIONS
+    return orjson.dumps(data, default=_encoder.default, option=options)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson; always UTF-8 and compact unless an indent is asked for"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        try:
+            ret = dumps(data, indent=bool(indent))
+        except orjson.JSONEncodeError:
+            # DRF encodes what it can (big integers) and raises for the rest
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same escaping as JSONRenderer: these are valid JSON but end a line in JavaScript
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class ORJSONParser(JSONParser):
+    """JSONParser that decodes with orjson"""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if encoding.lower().replace('-', '') != 'utf8':
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            body = stream.read()
+            if LONG_INTEGER.search(body):
+                # Keep big integers exact, as json does
+                return json.loads(body, parse_constant=json.strict_constant if self.strict else None)
+            return orjson.loads(body)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError(f'JSON parse error - {exc}')
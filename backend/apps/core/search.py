@@ -0,0 +1,19 @@
+# backend/apps/core/search.py
+"""
+Helpers for PostgreSQL full-text search
+"""
+import re
+
+from django.contrib.postgres.search import SearchQuery
+
+
+def prefix_query(text, config, operator='&'):
+    """
+    A SearchQuery matching every word of text as a prefix (or any word, with
+    operator='|'). Returns None when text has no words to search for.
+    """
+    words = re.findall(r'\w+', text)
+    if not words:
+        return None
+    return SearchQuery(f' {operator} '.join(f'{word}:*' for word in words),
+                       search_type='raw', config=config)
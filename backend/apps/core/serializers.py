@@ -1,5 +1,6 @@
 # backend/apps/core/serializers.py
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
 from django.conf import settings
 
 
@@ -65,4 +66,59 @@ class MediaURLMixin:
 
 
 
+def parse_field_list(value):
+    """The names in a comma-separated query parameter, or None when it was not given"""
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+def requested_fields(request, names, expandable=()):
+    """
+    The subset of names a read request asks for.
+
+    ?fields=a,b keeps only the listed fields. ?expand=c,d chooses which of the
+    expandable (expensive) fields to include; without it all of them are, so
+    existing clients see no change, and a bare ?expand= leaves them all out.
+    Unknown names are ignored.
+    """
+    selected = set(names)
+    params = getattr(request, 'query_params', None)
+    if params is None or request.method not in SAFE_METHODS:
+        return selected
+
+    fields = parse_field_list(params.get('fields'))
+    if fields is not None:
+        selected &= fields
+
+    expand = parse_field_list(params.get('expand'))
+    if expand is not None:
+        selected -= set(expandable) - expand
+    return selected
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin that applies ?fields= and ?expand= (see requested_fields)
+    when the serializer is the one a view responds with. Omitted fields are
+    dropped before serialization, so their SerializerMethodFields never run.
+    Declare the expensive fields in Meta.expandable_fields.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        parent = getattr(self, 'parent', None)
+        if isinstance(parent, serializers.ListSerializer):
+            parent = getattr(parent, 'parent', None)
+        if parent is not None:
+            # Nested inside another serializer: not what the request is shaping
+            return fields
+
+        selected = requested_fields(
+            self.context.get('request'), fields, getattr(self.Meta, 'expandable_fields', ())
+        )
+        return {name: field for name, field in fields.items() if name in selected}
+
+
 # Common serializers can go here if needed
@@ -0,0 +1,21 @@
+# backend/apps/core/signals.py
+"""
+Signal handlers that invalidate the cache tags of changed models
+"""
+from django.apps import apps
+from django.db.models.signals import post_save, post_delete
+
+from .cache import TAGGED_MODELS, invalidate_tags_on_commit, model_tag
+
+
+def invalidate_model_tag(sender, instance, raw=False, **kwargs):
+    """Make everything cached under the model's tag stale once the write commits"""
+    if raw:
+        return
+    invalidate_tags_on_commit(model_tag(sender))
+
+
+for label in TAGGED_MODELS:
+    model = apps.get_model(label)
+    for signal in (post_save, post_delete):
+        signal.connect(invalidate_model_tag, sender=model, dispatch_uid=f'cache_tag:{label}')
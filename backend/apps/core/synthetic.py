@@ -0,0 +1,427 @@
+# backend/apps/core/synthetic.py
+"""
+Seeded synthetic organisation for local performance work
+
+SyntheticOrg fills the database with an organisation shaped like a real one:
+branches with a seven-level unit tree, ranks, positions and assignments,
+members with rank history, events with attendance, forums, commendations,
+recruitment slots and applications. The same seed and scale always produce
+the same shape.
+
+Rows are written with bulk_create, which skips model signals, so the unit
+closure index, strength counters, forum counters and search vectors are
+rebuilt once at the end instead of row by row.
+
+Everything created is named with SYNTHETIC_PREFIX so clear() can remove it.
+"""
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+SYNTHETIC_PREFIX = 'Synthetic'
+SYNTHETIC_USERNAME_PREFIX = 'synthetic_'
+SYNTHETIC_ADMIN_USERNAME = 'synthetic_admin'
+SYNTHETIC_APPLICATION_PREFIX = 'SYN-'
+
+BATCH_SIZE = 1000
+
+SCALES = {
+    # units per branch: 127 / 1093 / 5461
+    'small': {'branches': 1, 'fanout': 2, 'troopers': 2, 'events': 50, 'threads': 100, 'applications': 100},
+    'medium': {'branches': 2, 'fanout': 3, 'troopers': 3, 'events': 300, 'threads': 1000, 'applications': 1000},
+    'large': {'branches': 3, 'fanout': 4, 'troopers': 4, 'events': 1000, 'threads': 5000, 'applications': 5000},
+}
+
+# Top to bottom; one tree level each
+UNIT_LEVELS = [
+    ('expeditionary_force', 'Expeditionary Force'),
+    ('fleet', 'Fleet'),
+    ('battle_group', 'Battle Group'),
+    ('task_force', 'Task Force'),
+    ('squadron', 'Squadron'),
+    ('division', 'Division'),
+    ('flight', 'Flight'),
+]
+
+# (abbreviation, name, kind), lowest first
+RANKS = (
+    [(f'E-{n}', f'Enlisted Grade {n}', 'enlisted') for n in range(1, 10)]
+    + [(f'W-{n}', f'Warrant Grade {n}', 'warrant') for n in range(1, 4)]
+    + [(f'O-{n}', f'Officer Grade {n}', 'officer') for n in range(1, 9)]
+)
+
+# (key, name, category, role flags)
+ROLES = [
+    ('commander', 'Commander', 'command', {'is_command_role': True}),
+    ('executive', 'Executive Officer', 'staff', {'is_staff_role': True}),
+    ('nco', 'Senior NCO', 'nco', {'is_nco_role': True}),
+    ('trooper', 'Trooper', 'trooper', {}),
+]
+
+WORDS = (
+    'alpha bravo charlie delta echo foxtrot patrol escort convoy hangar fleet flight wing '
+    'sortie briefing debrief formation vector intercept rendezvous station outpost mining '
+    'cargo salvage recon boarding defense assault medical logistics engineering comms '
+    'radio quantum jump beacon sector system moon planet orbit landing zone training '
+    'qualification promotion roster schedule deployment rotation readiness inspection'
+).split()
+
+FIRST_NAMES = ['Alex', 'Sam', 'Jordan', 'Casey', 'Riley', 'Morgan', 'Taylor', 'Jamie', 'Avery', 'Quinn']
+LAST_NAMES = ['Reyes', 'Novak', 'Okafor', 'Lindqvist', 'Haddad', 'Moreau', 'Tanaka', 'Kowalski', 'Silva', 'Byrne']
+
+
+class SyntheticOrg:
+    """Generates one synthetic organisation; call generate() once per instance"""
+
+    def __init__(self, seed=0, branches=1, fanout=2, troopers=2, fill_rate=0.75,
+                 events=50, threads=100, applications=100, log=None):
+        self.random = random.Random(seed)
+        self.branches = branches
+        self.fanout = fanout
+        self.troopers = troopers
+        self.fill_rate = fill_rate
+        self.events = events
+        self.threads = threads
+        self.applications = applications
+        self.log = log or (lambda message: None)
+
+        self.now = timezone.now()
+        self.password = make_password(None)
+        self.counts = {}
+        self.user_count = 0
+
+        self.all_units = []
+        self.members_by_branch = {}
+        self.slots_by_branch = {}
+
+    # Helpers
+
+    def sentence(self, words=12):
+        return ' '.join(self.random.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+    def paragraph(self, sentences=4):
+        return ' '.join(self.sentence(self.random.randint(8, 16)) for _ in range(sentences))
+
+    def past(self, days):
+        return self.now - timedelta(days=self.random.uniform(0, days))
+
+    def bulk_create(self, model, objects):
+        model.objects.bulk_create(objects, batch_size=BATCH_SIZE)
+        name = model._meta.verbose_name_plural
+        self.counts[name] = self.counts.get(name, 0) + len(objects)
+        return objects
+
+    def new_user(self, branch, rank, unit=None, **fields):
+        from apps.users.models import User
+
+        self.user_count += 1
+        number = self.user_count
+        return User(
+            username=f'{SYNTHETIC_USERNAME_PREFIX}{number:06d}',
+            discord_id=f'synthetic-{number}',
+            password=self.password,
+            branch=branch,
+            current_rank=rank,
+            primary_unit=unit,
+            join_date=self.past(3 * 365),
+            onboarding_status='Active',
+            **fields
+        )
+
+    # Generation
+
+    def generate(self):
+        """Create the organisation and return {model verbose name: rows created}"""
+        with transaction.atomic():
+            roles = self.create_roles()
+            self.admin = self.create_admin()
+            for index in range(self.branches):
+                self.create_branch(index, roles)
+            self.create_events()
+            self.create_forums()
+            self.create_commendations()
+            self.create_applications()
+            self.create_hierarchy_view()
+            self.rebuild()
+        return self.counts
+
+    def create_roles(self):
+        from apps.units.models import Role
+
+        roles = {}
+        for key, name, category, flags in ROLES:
+            roles[key], _ = Role.objects.get_or_create(
+                name=f'{SYNTHETIC_PREFIX} {name}',
+                defaults=dict(category=category, abbreviation=name[:4].upper(), **flags)
+            )
+        return roles
+
+    def create_admin(self):
+        from apps.users.models import User
+
+        return User.objects.create(
+            username=SYNTHETIC_ADMIN_USERNAME,
+            discord_id='synthetic-admin',
+            password=self.password,
+            is_staff=True,
+            is_admin=True,
+        )
+
+    def create_branch(self, index, roles):
+        from apps.units.models import Branch, Rank, Unit, Position, UserPosition, RecruitmentSlot
+        from apps.units.models_promotion import UserRankHistory
+        from apps.users.models import User
+
+        self.log(f'Branch {index + 1}: units, positions and members...')
+        branch = Branch.objects.create(
+            name=f'{SYNTHETIC_PREFIX} Branch {index + 1}',
+            abbreviation=f'SYN{index + 1}'
+        )
+        ranks = self.bulk_create(Rank, [
+            Rank(branch=branch, tier=tier, abbreviation=abbreviation, name=name,
+                 is_enlisted=kind == 'enlisted', is_warrant=kind == 'warrant', is_officer=kind == 'officer')
+            for tier, (abbreviation, name, kind) in enumerate(RANKS, start=1)
+        ])
+
+        # The unit tree, level by level. Abbreviations spell out the path: S1, S12, S123...
+        unit_level, label = UNIT_LEVELS[0]
+        levels = [[Unit(branch=branch, name=f'{SYNTHETIC_PREFIX} {label} S{index + 1}',
+                        abbreviation=f'S{index + 1}', unit_level=unit_level, unit_type=label)]]
+        for unit_level, label in UNIT_LEVELS[1:]:
+            levels.append([
+                Unit(branch=branch, parent_unit=parent, name=f'{SYNTHETIC_PREFIX} {label} {parent.abbreviation}{n}',
+                     abbreviation=f'{parent.abbreviation}{n}', unit_level=unit_level, unit_type=label)
+                for parent in levels[-1] for n in range(1, self.fanout + 1)
+            ])
+        units = self.bulk_create(Unit, [unit for level in levels for unit in level])
+        self.all_units.extend((unit, depth) for depth, level in enumerate(levels) for unit in level)
+
+        # Positions: a command team per unit plus troopers. Seniority falls with depth.
+        positions = []
+        for depth, level in enumerate(levels):
+            officer = len(RANKS) - 1 - depth
+            for unit in level:
+                positions.append((Position(unit=unit, role=roles['commander']), officer))
+                positions.append((Position(unit=unit, role=roles['executive']), officer - 1))
+                positions.append((Position(unit=unit, role=roles['nco']), self.random.randint(5, 8)))
+                positions.extend(
+                    (Position(unit=unit, role=roles['trooper'], identifier=str(n)), self.random.randint(0, 4))
+                    for n in range(1, self.troopers + 1)
+                )
+
+        members, assignments, history = [], [], []
+        for position, rank_index in positions:
+            if self.random.random() >= self.fill_rate:
+                continue
+            position.is_vacant = False
+            member = self.new_user(branch, ranks[rank_index], position.unit)
+            members.append(member)
+            assignments.append(UserPosition(user=member, position=position, status='active',
+                                            effective_date=member.join_date))
+            history.extend(self.rank_history(member, ranks, rank_index))
+
+        # Recruits waiting for a position
+        for _ in range(len(members) // 10):
+            recruit = self.new_user(branch, ranks[0])
+            members.append(recruit)
+            history.extend(self.rank_history(recruit, ranks, 0))
+
+        self.bulk_create(Position, [position for position, _ in positions])
+        self.bulk_create(User, members)
+        self.bulk_create(UserPosition, assignments)
+        self.bulk_create(UserRankHistory, history)
+        self.members_by_branch[branch.id] = members
+
+        # Open slots in the two lowest levels
+        self.slots_by_branch[branch.id] = self.bulk_create(RecruitmentSlot, [
+            RecruitmentSlot(unit=unit, role=roles['trooper'], career_track='enlisted',
+                            total_slots=self.random.randint(2, 6), filled_slots=self.random.randint(0, 2))
+            for level in levels[-2:] for unit in level
+        ])
+
+    def rank_history(self, member, ranks, rank_index):
+        """The member's path to their current rank, oldest first"""
+        from apps.units.models_promotion import UserRankHistory
+
+        steps = self.random.randint(0, min(3, rank_index))
+        path = sorted(self.random.sample(range(rank_index), steps)) + [rank_index]
+        dates = sorted(member.join_date + timedelta(days=self.random.uniform(0, (self.now - member.join_date).days))
+                       for _ in path[1:])
+        dates = [member.join_date] + dates
+
+        return [
+            UserRankHistory(user=member, rank=ranks[index], date_assigned=dates[n],
+                            date_ended=dates[n + 1] if n + 1 < len(path) else None,
+                            promoted_by=self.admin if n else None)
+            for n, index in enumerate(path)
+        ]
+
+    def create_events(self):
+        from apps.events.models import Event, EventAttendance
+
+        self.log('Events and attendance...')
+        hosts = [unit for unit, depth in self.all_units if depth < 5]
+        event_types = [choice for choice, _ in Event._meta.get_field('event_type').choices]
+
+        events, attendance = [], []
+        for n in range(self.events):
+            host = self.random.choice(hosts)
+            start = self.now + timedelta(days=self.random.uniform(-365, 30))
+            members = self.members_by_branch[host.branch_id]
+            event = Event(
+                title=f'{SYNTHETIC_PREFIX} Operation {n + 1}', description=self.paragraph(2),
+                event_type=self.random.choice(event_types), start_time=start,
+                end_time=start + timedelta(hours=self.random.choice([1, 2, 3])),
+                host_unit=host, creator=self.random.choice(members),
+                status='Completed' if start < self.now else 'Scheduled'
+            )
+            events.append(event)
+            for member in self.random.sample(members, min(len(members), self.random.randint(10, 40))):
+                attendance.append(EventAttendance(
+                    event=event, user=member,
+                    status=self.random.choices(['Attending', 'Maybe', 'Declined', 'Excused'], [7, 1, 1, 1])[0]
+                ))
+
+        self.bulk_create(Event, events)
+        self.bulk_create(EventAttendance, attendance)
+
+    def create_forums(self):
+        from apps.forums.models import ForumCategory, ForumThread, ForumPost
+
+        self.log('Forums...')
+        members = [member for branch_members in self.members_by_branch.values() for member in branch_members]
+        categories = []
+        for n in range(1, 5):
+            parent = ForumCategory(name=f'{SYNTHETIC_PREFIX} Forum {n}', description=self.sentence())
+            categories.append(parent)
+            categories.extend(
+                ForumCategory(name=f'{SYNTHETIC_PREFIX} Forum {n}.{m}', parent=parent, description=self.sentence())
+                for m in range(1, 3)
+            )
+        self.bulk_create(ForumCategory, categories)
+
+        threads, posts = [], []
+        for _ in range(self.threads):
+            thread = ForumThread(
+                title=self.sentence(self.random.randint(4, 9))[:200], content=self.paragraph(),
+                author=self.random.choice(members), category=self.random.choice(categories),
+                is_pinned=self.random.random() < 0.02
+            )
+            threads.append(thread)
+            # The opening post repeats the thread text, as ForumThreadViewSet.perform_create does
+            posts.append(ForumPost(thread=thread, author=thread.author, content=thread.content))
+            posts.extend(
+                ForumPost(thread=thread, author=self.random.choice(members), content=self.paragraph(2))
+                # Most threads get a few replies, a few get a great many
+                for _ in range(min(int(self.random.paretovariate(1.2)), 100))
+            )
+
+        self.bulk_create(ForumThread, threads)
+        self.bulk_create(ForumPost, posts)
+        self.forum_categories = categories
+        self.forum_threads = threads
+        self.forum_posts = posts
+
+    def create_commendations(self):
+        from apps.commendations.models import CommendationType, Commendation
+
+        self.log('Commendations...')
+        categories = [choice for choice, _ in CommendationType._meta.get_field('category').choices]
+        types = self.bulk_create(CommendationType, [
+            CommendationType(name=f'{SYNTHETIC_PREFIX} Medal {n}', abbreviation=f'SYNM{n}',
+                             category=categories[n % len(categories)], precedence=n, description=self.sentence())
+            for n in range(1, 11)
+        ])
+
+        awards = []
+        for members in self.members_by_branch.values():
+            for member in members:
+                if self.random.random() >= 0.3:
+                    continue
+                award_numbers = {}
+                for _ in range(self.random.randint(1, 3)):
+                    commendation_type = self.random.choice(types)
+                    award_numbers[commendation_type] = award_numbers.get(commendation_type, 0) + 1
+                    awards.append(Commendation(
+                        user=member, commendation_type=commendation_type,
+                        award_number=award_numbers[commendation_type],
+                        awarded_date=self.past(2 * 365), awarded_by=self.admin,
+                        citation=self.paragraph(2), short_citation=self.sentence()[:500],
+                        related_unit=member.primary_unit, is_verified=True
+                    ))
+        self.bulk_create(Commendation, awards)
+
+    def create_applications(self):
+        from apps.onboarding.models import Application
+
+        self.log('Applications...')
+        statuses = ['draft', 'submitted', 'under_review', 'interview_scheduled', 'approved', 'rejected', 'withdrawn']
+        branch_ids = list(self.slots_by_branch)
+
+        applications = []
+        for n in range(1, self.applications + 1):
+            branch_id = self.random.choice(branch_ids)
+            slot = self.random.choice(self.slots_by_branch[branch_id])
+            status = self.random.choices(statuses, [2, 3, 2, 1, 2, 1, 1])[0]
+            first_name, last_name = self.random.choice(FIRST_NAMES), self.random.choice(LAST_NAMES)
+            applications.append(Application(
+                application_number=f'{SYNTHETIC_APPLICATION_PREFIX}{n:06d}',
+                discord_id=f'synthetic-applicant-{n}', discord_username=f'applicant{n}',
+                email=f'applicant{n}@example.com', first_name=first_name, last_name=last_name,
+                timezone='UTC', country='US', branch_id=branch_id, primary_unit=slot.unit,
+                career_track='enlisted', selected_recruitment_slot=slot,
+                previous_experience=self.paragraph(2), reason_for_joining=self.paragraph(2),
+                status=status, submitted_at=None if status == 'draft' else self.past(90)
+            ))
+        self.bulk_create(Application, applications)
+
+    def create_hierarchy_view(self):
+        from apps.units.models import UnitHierarchyView
+
+        UnitHierarchyView.objects.create(
+            name=f'{SYNTHETIC_PREFIX} organisation', view_type='full', created_by=self.admin,
+            filter_config={'branch_ids': [str(branch_id) for branch_id in self.members_by_branch]}
+        )
+
+    def rebuild(self):
+        """Bring the data that signals normally maintain up to date"""
+        from apps.forums.models import ForumCategory, ForumThread, ForumPost
+        from apps.units import rank_ladder
+        from apps.units.models import UnitClosure, UnitStrength
+        from apps.units.recruitment import invalidate_branches
+
+        self.log('Rebuilding unit tree, strength, forum counters and search...')
+        UnitClosure.objects.rebuild()
+        UnitStrength.objects.rebuild()
+        ForumThread.objects.recount([thread.id for thread in self.forum_threads])
+        ForumCategory.objects.recount([category.id for category in self.forum_categories])
+        ForumThread.objects.update_search_vector([thread.id for thread in self.forum_threads])
+        ForumPost.objects.update_search_vector([post.id for post in self.forum_posts])
+        rank_ladder.invalidate()
+        invalidate_branches(self.members_by_branch)
+
+
+def clear():
+    """Delete everything a SyntheticOrg created. Returns the number of rows deleted."""
+    from apps.commendations.models import CommendationType
+    from apps.forums.models import ForumCategory
+    from apps.onboarding.models import Application
+    from apps.units.models import Branch, Role, UnitHierarchyView
+    from apps.users.models import User
+
+    deleted = 0
+    with transaction.atomic():
+        for queryset in [
+            Application.objects.filter(application_number__startswith=SYNTHETIC_APPLICATION_PREFIX),
+            ForumCategory.objects.filter(name__startswith=SYNTHETIC_PREFIX),
+            User.objects.filter(username__startswith=SYNTHETIC_USERNAME_PREFIX),
+            Branch.objects.filter(name__startswith=SYNTHETIC_PREFIX),
+            CommendationType.objects.filter(name__startswith=SYNTHETIC_PREFIX),
+            Role.objects.filter(name__startswith=SYNTHETIC_PREFIX),
+            UnitHierarchyView.objects.filter(name__startswith=SYNTHETIC_PREFIX),
+        ]:
+            deleted += queryset.delete()[0]
+    return deleted
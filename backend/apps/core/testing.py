@@ -0,0 +1,57 @@
+# backend/apps/core/testing.py
+"""
+Test helpers
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .instrumentation import fingerprint, get_query_budget
+
+
+class _QueryBudgetContext(CaptureQueriesContext):
+    def __init__(self, test_case, budget, endpoint):
+        self.test_case = test_case
+        self.budget = budget
+        self.endpoint = endpoint
+        super().__init__(connection)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None:
+            return
+
+        executed = len(self)
+        if executed > self.budget:
+            repeated = {}
+            for query in self.captured_queries:
+                key = fingerprint(query['sql'])
+                repeated[key] = repeated.get(key, 0) + 1
+            self.test_case.fail(
+                f"{self.endpoint} ran {executed} queries, over its budget of {self.budget}:\n"
+                + '\n'.join(f"{i}. {query['sql']}" for i, query in enumerate(self.captured_queries, start=1))
+                + '\nRepeated: '
+                + ', '.join(f"{count}x {sql[:120]}" for sql, count in repeated.items() if count > 1)
+            )
+
+
+class QueryBudgetTestMixin:
+    """
+    TestCase mixin that holds view actions to the query budget their view
+    declares in `query_budgets`. Budgets count every query of the request,
+    authentication included, as RequestStatsMiddleware does.
+
+        with self.assertWithinQueryBudget(EventViewSet, 'list'):
+            self.client.get('/api/events/')
+    """
+
+    def assertWithinQueryBudget(self, view_class, action, func=None, *args, **kwargs):
+        budget = get_query_budget(view_class, action)
+        if budget is None:
+            self.fail(f'{view_class.__name__} declares no query budget for {action}')
+
+        context = _QueryBudgetContext(self, budget, f'{view_class.__name__}.{action}')
+        if func is None:
+            return context
+
+        with context:
+            func(*args, **kwargs)
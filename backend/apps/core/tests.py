@@ -0,0 +1,212 @@
+import io
+import math
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from apps.units.models import Branch
+from apps.users.models import User
+
+from .cache import cached_response, get_or_set, make_key, tag_versions, Uncacheable
+from .renderers import ORJSONParser, ORJSONRenderer
+from .serializers import SparseFieldsetMixin, requested_fields
+
+
+class ORJSONRendererTests(SimpleTestCase):
+
+    def assertRendersLikeDRF(self, data):
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_matches_drf(self):
+        self.assertRendersLikeDRF({
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'name': 'Ünit\u2028line',
+            'count': 3,
+            'ratio': 0.25,
+            'price': Decimal('1.50'),
+            'at': datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+            'nested': [None, True, {'1': 'a'}],
+        })
+
+    def test_integers_wider_than_64_bits_are_rendered_by_drf(self):
+        self.assertRendersLikeDRF({'big': 2 ** 64, 'small': -2 ** 70})
+
+    def test_float_exponents_are_written_without_plus_sign(self):
+        self.assertEqual(ORJSONRenderer().render([1e16, 1.5e-7]), b'[1e16,1.5e-7]')
+
+    def test_nan_is_written_as_null(self):
+        self.assertEqual(ORJSONRenderer().render([math.nan, math.inf]), b'[null,null]')
+        with self.assertRaises(ValueError):
+            JSONRenderer().render([math.nan])
+
+
+class ORJSONParserTests(SimpleTestCase):
+
+    def parse(self, body, encoding='utf-8'):
+        return ORJSONParser().parse(io.BytesIO(body), parser_context={'encoding': encoding})
+
+    def test_parses_json(self):
+        self.assertEqual(self.parse(b'{"a": [1, 2.5, "\xc3\xbc"]}'), {'a': [1, 2.5, 'ü']})
+
+    def test_integers_wider_than_64_bits_stay_exact(self):
+        body = b'[18446744073709551616, -9223372036854775809]'
+        self.assertEqual(self.parse(body), [2 ** 64, -2 ** 63 - 1])
+        self.assertEqual(self.parse(body), JSONParser().parse(io.BytesIO(body)))
+
+    def test_other_encodings(self):
+        self.assertEqual(self.parse('{"a": "é"}'.encode('latin-1'), encoding='latin-1'), {'a': 'é'})
+
+    def test_invalid_json_and_constants_raise_parse_error(self):
+        for body in (b'{"a": ', b'[NaN]', b'[NaN, 12345678901234567890]'):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                self.parse(body)
+
+
+class CountingViewSet:
+    """Stands in for a ViewSet: answers with the next of `statuses` and counts calls"""
+
+    def __init__(self, *statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    @cached_response(tags=['tests.counting'])
+    def list(self, request):
+        self.calls += 1
+        return Response({'call': self.calls}, status=self.statuses.pop(0))
+
+
+class CacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_tagged_model_save_makes_cached_response_stale_after_commit(self):
+        self.client.force_login(User.objects.create_user(discord_id='1', username='viewer'))
+        Branch.objects.create(name='Army', abbreviation='A')
+
+        def branch_names():
+            return sorted(branch['name'] for branch in self.client.get('/api/units/branches/').json()['results'])
+
+        self.assertEqual(branch_names(), ['Army'])
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            Branch.objects.create(name='Navy', abbreviation='N')
+        # Not committed yet, so other requests still get the cached list
+        self.assertEqual(branch_names(), ['Army'])
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(branch_names(), ['Army', 'Navy'])
+
+    def test_unsuccessful_responses_are_not_stored(self):
+        view = CountingViewSet(404, 200, 200)
+        request = RequestFactory().get('/counting/')
+
+        self.assertEqual(view.list(request).status_code, 404)
+        self.assertEqual(view.list(request).data, {'call': 2})
+        self.assertEqual(view.list(request).data, {'call': 2})
+        self.assertEqual(view.calls, 2)
+
+    def test_uncacheable_value_is_returned_but_not_stored(self):
+        def build():
+            raise Uncacheable('partial')
+
+        self.assertEqual(get_or_set('tests', ['uncacheable'], build), 'partial')
+        self.assertEqual(get_or_set('tests', ['uncacheable'], lambda: 'complete'), 'complete')
+
+    def test_second_caller_waits_for_the_builder(self):
+        key = make_key('tests', 'shared')
+        versions = tag_versions(['tests.shared'])
+        # Another caller is building the value
+        cache.add(f'lock:{key}', 'builder', 30)
+
+        def finish_building():
+            time.sleep(0.2)
+            cache.set(key, (versions, 'built by the first caller'))
+            cache.delete(f'lock:{key}')
+
+        builder = threading.Thread(target=finish_building)
+        builder.start()
+        builds = []
+        value = get_or_set('tests', ['shared'], lambda: builds.append(1) or 'rebuilt', tags=['tests.shared'])
+        builder.join()
+
+        self.assertEqual(value, 'built by the first caller')
+        self.assertEqual(builds, [])
+
+    def test_waiting_caller_builds_when_the_builder_stores_nothing(self):
+        key = make_key('tests', 'abandoned')
+        cache.add(f'lock:{key}', 'builder', 30)
+        threading.Timer(0.1, cache.delete, [f'lock:{key}']).start()
+
+        started = time.monotonic()
+        self.assertEqual(get_or_set('tests', ['abandoned'], lambda: 'rebuilt'), 'rebuilt')
+        self.assertLess(time.monotonic() - started, 2)
+
+
+class SquadSerializer(SparseFieldsetMixin, serializers.Serializer):
+    name = serializers.CharField()
+    motto = serializers.CharField()
+    roster = serializers.ListField()
+
+    class Meta:
+        expandable_fields = ['roster']
+
+
+class PlatoonSerializer(SparseFieldsetMixin, serializers.Serializer):
+    name = serializers.CharField()
+    lead_squad = SquadSerializer()
+    squads = SquadSerializer(many=True)
+
+    class Meta:
+        expandable_fields = ['squads']
+
+
+class SparseFieldsetTests(SimpleTestCase):
+
+    NAMES = ['name', 'motto', 'roster', 'squads']
+    EXPANDABLE = ['roster', 'squads']
+
+    def request(self, query='', method='get'):
+        return Request(getattr(APIRequestFactory(), method)(f'/{query}'))
+
+    def selected(self, query, method='get'):
+        return requested_fields(self.request(query, method), self.NAMES, self.EXPANDABLE)
+
+    def test_requested_fields(self):
+        self.assertEqual(self.selected(''), set(self.NAMES))
+        self.assertEqual(self.selected('?fields=name,roster'), {'name', 'roster'})
+        self.assertEqual(self.selected('?expand='), {'name', 'motto'})
+        self.assertEqual(self.selected('?expand=squads'), {'name', 'motto', 'squads'})
+        self.assertEqual(self.selected('?fields=name,squads&expand=roster'), {'name'})
+        # Writes are never shaped
+        self.assertEqual(self.selected('?fields=name', method='post'), set(self.NAMES))
+
+    def test_unknown_names_are_ignored(self):
+        self.assertEqual(self.selected('?fields=name,bogus'), {'name'})
+        self.assertEqual(self.selected('?expand=bogus,squads'), {'name', 'motto', 'squads'})
+
+    def test_only_the_top_level_serializer_is_shaped(self):
+        squad = {'name': 'Alpha', 'motto': 'First', 'roster': ['a', 'b']}
+        platoon = {'name': '1st', 'lead_squad': squad, 'squads': [squad]}
+
+        request = self.request('?fields=name,lead_squad,squads&expand=')
+        data = PlatoonSerializer(platoon, context={'request': request}).data
+
+        self.assertEqual(set(data), {'name', 'lead_squad'})
+        self.assertEqual(data['lead_squad'], squad)
+
+        data = PlatoonSerializer(platoon, context={'request': self.request('?expand=squads')}).data
+        self.assertEqual(data['squads'], [squad])
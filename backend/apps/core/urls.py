@@ -1,5 +1,7 @@
 from django.urls import path 
+from .views import RequestStatsView
  
 urlpatterns = [ 
     # Core URL patterns 
+    path('request-stats/', RequestStatsView.as_view(), name='request-stats'),
 ] 
@@ -7,7 +7,11 @@ from django.http import JsonResponse
 from django.conf import settings
 import os
 from pathlib import Path
-from rest_framework import viewsets
+from rest_framework import viewsets, permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .instrumentation import request_stats
 
 
 def debug_static_config(request):
@@ -75,3 +79,18 @@ class MediaContextMixin:
         context = super().get_serializer_context()
         context['request'] = self.request
         return context
+
+
+class RequestStatsView(APIView):
+    """
+    Query count, duplicate queries and timings per endpoint (p50/p95/max) for
+    the recent requests served by this worker process. DELETE clears them.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(request_stats.summary())
+
+    def delete(self, request):
+        request_stats.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
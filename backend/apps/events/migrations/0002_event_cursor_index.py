@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-17 03:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_time', 'id'], name='events_even_start_t_5d3f7d_idx'),
+        ),
+    ]
@@ -176,6 +176,10 @@ class Event(BaseModel):
 
     class Meta:
         ordering = ['-start_time']
+        indexes = [
+            # Keyset pagination (EventViewSet.cursor_ordering)
+            models.Index(fields=['start_time', 'id']),
+        ]
 
 
 class EventAttendance(BaseModel):
@@ -17,6 +17,8 @@ class EventListSerializer(serializers.ModelSerializer):
                   'image_url', 'is_mandatory', 'status', 'attendees_count']
 
     def get_attendees_count(self, obj):
+        if hasattr(obj, 'attending_count'):
+            return obj.attending_count
         return obj.attendances.filter(status='Attending').count()
 
 
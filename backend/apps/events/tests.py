@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.core.testing import QueryBudgetTestMixin
+from apps.units.models import Branch, Unit
+from apps.users.models import User
+
+from .models import Event, EventAttendance
+from .views import EventViewSet
+
+
+class EventListQueryBudgetTests(QueryBudgetTestMixin, TestCase):
+
+    def setUp(self):
+        branch = Branch.objects.create(name='Navy', abbreviation='N')
+        self.users = [User.objects.create_user(discord_id=str(i), username=f'pilot{i}') for i in range(3)]
+        self.client.force_login(self.users[0])
+        start = timezone.now() + timedelta(days=1)
+        for i in range(10):
+            unit = Unit.objects.create(name=f'Squadron {i}', abbreviation=f'S{i}', branch=branch)
+            event = Event.objects.create(
+                title=f'Patrol {i}', event_type='Fighter_Patrol', host_unit=unit, creator=self.users[i % 3],
+                start_time=start + timedelta(hours=i), end_time=start + timedelta(hours=i + 2)
+            )
+            for user, status in zip(self.users, ['Attending', 'Attending', 'Declined']):
+                EventAttendance.objects.create(event=event, user=user, status=status)
+
+    def test_list_is_within_budget(self):
+        with self.assertWithinQueryBudget(EventViewSet, 'list'):
+            response = self.client.get('/api/events/')
+        self.assertEqual(response.status_code, 200)
+
+        events = response.json()['results']
+        self.assertEqual(len(events), 10)
+        self.assertEqual({event['attendees_count'] for event in events}, {2})
+        self.assertEqual(events[0]['host_unit_name'], 'Squadron 0')
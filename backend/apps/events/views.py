@@ -3,12 +3,14 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.db.models import Count, Q
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import Event, EventAttendance
 from .serializers import (
     EventListSerializer, EventDetailSerializer, EventAttendanceSerializer,
     EventAttendanceUpdateSerializer, EventCalendarSerializer, EventRSVPSerializer
 )
+from apps.core.pagination import OptionalCursorPagination
 from apps.users.views import IsAdminOrReadOnly
 
 
@@ -31,6 +33,18 @@ class EventViewSet(viewsets.ModelViewSet):
     ordering_fields = ['start_time', 'end_time', 'created_at']
     ordering = ['start_time']
     permission_classes = [IsCreatorOrAdminOrReadOnly]
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ('start_time', 'id')
+    # Queries per request, authentication included (see apps.core.instrumentation)
+    query_budgets = {'list': 4}
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = queryset.select_related('host_unit', 'creator').annotate(
+                attending_count=Count('attendances', filter=Q(attendances__status='Attending'))
+            )
+        return queryset
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ForumsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.forums'
+
+    def ready(self):
+        # Register model signal handlers
+        from . import signals  # noqa: F401
@@ -0,0 +1,20 @@
+"""
+Recount the stored forum thread and category counters from the posts
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.forums.models import ForumCategory, ForumThread
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds stored forum post/thread counters and last posts (run once after deploying, or to repair them)'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding forum counters...')
+        with transaction.atomic():
+            thread_count = ForumThread.objects.recount()
+            category_count = ForumCategory.objects.recount()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Successfully rebuilt counters for {thread_count} threads and {category_count} categories'
+        ))
@@ -0,0 +1,20 @@
+"""
+Recompute the stored full-text search vectors of every forum thread and post
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.forums.models import ForumThread, ForumPost
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the forum full-text search vectors (run once after deploying, or to repair them)'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding forum search vectors...')
+        with transaction.atomic():
+            thread_count = ForumThread.objects.update_search_vector()
+            post_count = ForumPost.objects.update_search_vector()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Successfully rebuilt search vectors for {thread_count} threads and {post_count} posts'
+        ))
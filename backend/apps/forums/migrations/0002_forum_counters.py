@@ -0,0 +1,55 @@
+# Generated by Django 5.2 on 2026-10-17 03:15
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def recount_forums(apps, schema_editor):
+    """Fill in the new counters; recount() lives on the real managers, which historical models do not carry"""
+    from apps.forums.models import ForumCategory, ForumThread
+
+    ForumThread.objects.recount()
+    ForumCategory.objects.recount()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('forums', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='forumcategory',
+            name='post_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='forumcategory',
+            name='thread_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='forumthread',
+            name='last_post',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='forums.forumpost'),
+        ),
+        migrations.AddField(
+            model_name='forumthread',
+            name='last_post_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='forumthread',
+            name='last_post_author',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='forumthread',
+            name='post_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(recount_forums, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-17 03:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forums', '0002_forum_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='forumpost',
+            index=models.Index(fields=['thread', 'created_at', 'id'], name='forums_foru_thread__e37dcf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='forumpost',
+            index=models.Index(fields=['created_at', 'id'], name='forums_foru_created_b70eca_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2 on 2026-10-17 03:40
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def backfill_search_vectors(apps, schema_editor):
+    """Index existing threads and posts; update_search_vector() lives on the real managers, which historical models do not carry"""
+    from apps.forums.models import ForumPost, ForumThread
+
+    ForumThread.objects.update_search_vector()
+    ForumPost.objects.update_search_vector()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forums', '0003_forumpost_cursor_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='forumpost',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='forumthread',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='forumpost',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='forum_post_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='forumthread',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='forum_thread_search_idx'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
@@ -1,12 +1,42 @@
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Coalesce
 from apps.core.models import BaseModel
 
+# Text search configuration used both for the stored vectors and for queries
+FORUM_SEARCH_CONFIG = getattr(settings, 'FORUM_SEARCH_CONFIG', 'english')
+
+
+class ForumCategoryManager(models.Manager):
+    def recount(self, category_ids=None):
+        """Recompute thread_count and post_count (for every category by default)"""
+        threads = ForumThread.objects.filter(
+            category=models.OuterRef('pk')
+        ).order_by().values('category').annotate(count=models.Count('id')).values('count')
+        posts = ForumPost.objects.filter(
+            thread__category=models.OuterRef('pk')
+        ).order_by().values('thread__category').annotate(count=models.Count('id')).values('count')
+
+        categories = self.all() if category_ids is None else self.filter(id__in=category_ids)
+        return categories.update(
+            thread_count=Coalesce(models.Subquery(threads), 0),
+            post_count=Coalesce(models.Subquery(posts), 0)
+        )
+
 
 class ForumCategory(BaseModel):
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True, null=True)
     parent = models.ForeignKey('self', on_delete=models.CASCADE, null=True, blank=True, related_name='subcategories')
 
+    # Maintained by the forum signals; rebuild with rebuild_forum_counters
+    thread_count = models.IntegerField(default=0)
+    post_count = models.IntegerField(default=0)
+
+    objects = ForumCategoryManager()
+
     def __str__(self):
         return self.name
 
@@ -14,6 +44,30 @@ class ForumCategory(BaseModel):
         verbose_name_plural = "Forum categories"
 
 
+class ForumThreadManager(models.Manager):
+    def recount(self, thread_ids=None):
+        """Recompute post_count and the last post fields (for every thread by default)"""
+        posts = ForumPost.objects.filter(thread=models.OuterRef('pk'))
+        counts = posts.order_by().values('thread').annotate(count=models.Count('id')).values('count')
+        latest = posts.order_by('-created_at', '-id')
+
+        threads = self.all() if thread_ids is None else self.filter(id__in=thread_ids)
+        return threads.update(
+            post_count=Coalesce(models.Subquery(counts), 0),
+            last_post_id=models.Subquery(latest.values('id')[:1]),
+            last_post_at=models.Subquery(latest.values('created_at')[:1]),
+            last_post_author_id=models.Subquery(latest.values('author_id')[:1])
+        )
+
+    def update_search_vector(self, thread_ids=None):
+        """Recompute search_vector from the title and opening text (for every thread by default)"""
+        threads = self.all() if thread_ids is None else self.filter(id__in=thread_ids)
+        return threads.update(search_vector=(
+            SearchVector('title', weight='A', config=FORUM_SEARCH_CONFIG)
+            + SearchVector('content', weight='B', config=FORUM_SEARCH_CONFIG)
+        ))
+
+
 class ForumThread(BaseModel):
     title = models.CharField(max_length=200)
     content = models.TextField()
@@ -24,11 +78,32 @@ class ForumThread(BaseModel):
     view_count = models.IntegerField(default=0)
     last_activity = models.DateTimeField(auto_now=True)
 
+    # Maintained by the forum signals; rebuild with rebuild_forum_counters
+    post_count = models.IntegerField(default=0)
+    last_post = models.ForeignKey('ForumPost', on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    last_post_at = models.DateTimeField(null=True, blank=True)
+    last_post_author = models.ForeignKey('users.User', on_delete=models.SET_NULL, null=True, blank=True,
+                                         related_name='+')
+    # Maintained by the forum signals; rebuild with rebuild_forum_search
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ForumThreadManager()
+
     def __str__(self):
         return self.title
 
     class Meta:
         ordering = ['-is_pinned', '-last_activity']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='forum_thread_search_idx'),
+        ]
+
+
+class ForumPostManager(models.Manager):
+    def update_search_vector(self, post_ids=None):
+        """Recompute search_vector from the content (for every post by default)"""
+        posts = self.all() if post_ids is None else self.filter(id__in=post_ids)
+        return posts.update(search_vector=SearchVector('content', weight='B', config=FORUM_SEARCH_CONFIG))
 
 
 class ForumPost(BaseModel):
@@ -37,15 +112,19 @@ class ForumPost(BaseModel):
     author = models.ForeignKey('users.User', on_delete=models.CASCADE, related_name='forum_posts')
     is_edited = models.BooleanField(default=False)
     edit_timestamp = models.DateTimeField(null=True, blank=True)
+    # Maintained by the forum signals; rebuild with rebuild_forum_search
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ForumPostManager()
 
     def __str__(self):
         return f"Post by {self.author.username} in {self.thread.title}"
 
     class Meta:
         ordering = ['created_at']
-
-    def save(self, *args, **kwargs):
-        # Update thread's last_activity timestamp
-        self.thread.last_activity = self.created_at or self.updated_at
-        self.thread.save(update_fields=['last_activity'])
-        super().save(*args, **kwargs)
\ No newline at end of file
+        indexes = [
+            # Keyset pagination of a thread's posts and of all posts
+            models.Index(fields=['thread', 'created_at', 'id']),
+            models.Index(fields=['created_at', 'id']),
+            GinIndex(fields=['search_vector'], name='forum_post_search_idx'),
+        ]
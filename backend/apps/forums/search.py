@@ -0,0 +1,116 @@
+"""
+Full-text search across forum threads and posts
+
+Threads (title and opening text) and posts each keep a stored search vector,
+maintained by the forum signals. search() ranks both kinds together in one
+UNION query that carries only ids and scores, so the database can page it
+cheaply; load_hits() then fetches the page, with snippets, in one query per
+kind.
+"""
+from django.conf import settings
+from django.contrib.postgres.search import SearchHeadline, SearchRank
+from django.db import models
+from django.db.models.functions import Extract, Now
+
+from apps.core.search import prefix_query
+from .models import FORUM_SEARCH_CONFIG, ForumCategory, ForumThread, ForumPost
+
+# A hit this many days old scores half as much as an equally relevant new one
+FORUM_SEARCH_RECENCY_DAYS = getattr(settings, 'FORUM_SEARCH_RECENCY_DAYS', 30)
+
+
+def category_subtree(category_id):
+    """IDs of the category and all of its subcategories"""
+    children = {}
+    for pk, parent_id in ForumCategory.objects.values_list('id', 'parent_id'):
+        children.setdefault(parent_id, []).append(pk)
+
+    category_ids = [category_id]
+    index = 0
+    while index < len(category_ids):
+        category_ids.extend(children.get(category_ids[index], []))
+        index += 1
+    return category_ids
+
+
+def score(query):
+    """Text rank, discounted by the age of the thread or post"""
+    age_days = Extract(Now() - models.F('created_at'), 'epoch') / 86400.0
+    return models.ExpressionWrapper(
+        SearchRank(models.F('search_vector'), query) / (1.0 + age_days / FORUM_SEARCH_RECENCY_DAYS),
+        output_field=models.FloatField()
+    )
+
+
+def search(text, category_ids=None):
+    """
+    Ranked hits as {'kind', 'id', 'score'} rows, best first, or None when text
+    has nothing to search for. Every word is matched as a prefix.
+    """
+    query = prefix_query(text, FORUM_SEARCH_CONFIG)
+    if query is None:
+        return None
+
+    threads = ForumThread.objects.filter(search_vector=query)
+    # A thread's opening post repeats the thread's text; the thread hit stands for both
+    posts = ForumPost.objects.filter(search_vector=query).exclude(content=models.F('thread__content'))
+    if category_ids is not None:
+        threads = threads.filter(category_id__in=category_ids)
+        posts = posts.filter(thread__category_id__in=category_ids)
+
+    threads = threads.order_by().annotate(
+        kind=models.Value('thread'), score=score(query)
+    ).values('kind', 'id', 'score')
+    posts = posts.order_by().annotate(
+        kind=models.Value('post'), score=score(query)
+    ).values('kind', 'id', 'score')
+    return threads.union(posts, all=True).order_by('-score', 'kind', 'id')
+
+
+def load_hits(rows, text):
+    """Turn a page of search() rows into hits with highlighted snippets, keeping their order"""
+    # Highlight any of the words, not only passages that contain all of them
+    any_term = prefix_query(text, FORUM_SEARCH_CONFIG, operator='|')
+    snippet = SearchHeadline(
+        'content', any_term, config=FORUM_SEARCH_CONFIG,
+        start_sel='<mark>', stop_sel='</mark>',
+        max_words=35, min_words=15, max_fragments=2
+    )
+
+    ids = {'thread': [], 'post': []}
+    for row in rows:
+        ids[row['kind']].append(row['id'])
+
+    loaded = {}
+    if ids['thread']:
+        threads = ForumThread.objects.filter(id__in=ids['thread']).select_related(
+            'author', 'category'
+        ).annotate(snippet=snippet)
+        for thread in threads:
+            loaded['thread', thread.id] = (thread, thread)
+    if ids['post']:
+        posts = ForumPost.objects.filter(id__in=ids['post']).select_related(
+            'author', 'thread__category'
+        ).annotate(snippet=snippet)
+        for post in posts:
+            loaded['post', post.id] = (post, post.thread)
+
+    hits = []
+    for row in rows:
+        if (row['kind'], row['id']) not in loaded:
+            # Deleted since the page was ranked
+            continue
+        obj, thread = loaded[row['kind'], row['id']]
+        hits.append({
+            'type': row['kind'],
+            'id': obj.id,
+            'thread': thread.id,
+            'title': thread.title,
+            'category': thread.category_id,
+            'category_name': thread.category.name,
+            'author_username': obj.author.username,
+            'created_at': obj.created_at,
+            'score': row['score'],
+            'snippet': obj.snippet,
+        })
+    return hits
@@ -4,24 +4,25 @@ from .models import ForumCategory, ForumThread, ForumPost
 
 class ForumCategorySerializer(serializers.ModelSerializer):
     subcategories_count = serializers.SerializerMethodField()
-    threads_count = serializers.SerializerMethodField()
+    threads_count = serializers.ReadOnlyField(source='thread_count')
 
     class Meta:
         model = ForumCategory
         fields = '__all__'
+        read_only_fields = ['thread_count', 'post_count']
 
     def get_subcategories_count(self, obj):
+        # Annotated by ForumCategoryViewSet
+        if hasattr(obj, 'subcategories_count'):
+            return obj.subcategories_count
         return obj.subcategories.count()
 
-    def get_threads_count(self, obj):
-        return obj.threads.count()
-
 
 class ForumThreadListSerializer(serializers.ModelSerializer):
     author_username = serializers.ReadOnlyField(source='author.username')
     author_avatar = serializers.ReadOnlyField(source='author.avatar_url')
     category_name = serializers.ReadOnlyField(source='category.name')
-    posts_count = serializers.SerializerMethodField()
+    posts_count = serializers.ReadOnlyField(source='post_count')
     last_post = serializers.SerializerMethodField()
 
     class Meta:
@@ -30,16 +31,12 @@ class ForumThreadListSerializer(serializers.ModelSerializer):
                   'category_name', 'is_pinned', 'is_locked', 'view_count',
                   'created_at', 'last_activity', 'posts_count', 'last_post']
 
-    def get_posts_count(self, obj):
-        return obj.posts.count()
-
     def get_last_post(self, obj):
-        last_post = obj.posts.order_by('-created_at').first()
-        if last_post:
+        if obj.last_post_id:
             return {
-                'id': last_post.id,
-                'author': last_post.author.username,
-                'created_at': last_post.created_at
+                'id': obj.last_post_id,
+                'author': obj.last_post_author.username if obj.last_post_author else None,
+                'created_at': obj.last_post_at
             }
         return None
 
@@ -51,7 +48,8 @@ class ForumThreadDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ForumThread
-        fields = '__all__'
+        exclude = ['search_vector']
+        read_only_fields = ['post_count', 'last_post', 'last_post_at', 'last_post_author']
 
 
 class ForumPostSerializer(serializers.ModelSerializer):
@@ -61,7 +59,7 @@ class ForumPostSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ForumPost
-        fields = '__all__'
+        exclude = ['search_vector']
 
     def get_author_rank(self, obj):
         if obj.author.current_rank:
@@ -0,0 +1,117 @@
+"""
+Signal handlers that keep the stored forum counters and search vectors in sync
+with posts and threads
+"""
+import threading
+
+from django.db.models import F
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import ForumCategory, ForumThread, ForumPost
+
+# Threads being deleted in this thread of execution, mapped to the origin of
+# the delete. Their posts go first in the same cascade and are left for
+# uncount_thread to account for at once.
+_deleting = threading.local()
+
+
+def _deleting_threads():
+    if not hasattr(_deleting, 'threads'):
+        _deleting.threads = {}
+    return _deleting.threads
+
+
+# Thread counters
+
+@receiver(post_save, sender=ForumPost)
+def count_new_post(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    if not created:
+        ForumThread.objects.filter(pk=instance.thread_id).update(last_activity=timezone.now())
+        return
+
+    ForumThread.objects.filter(pk=instance.thread_id).update(
+        post_count=F('post_count') + 1,
+        last_post=instance,
+        last_post_at=instance.created_at,
+        last_post_author=instance.author_id,
+        last_activity=timezone.now()
+    )
+    ForumCategory.objects.filter(threads__id=instance.thread_id).update(post_count=F('post_count') + 1)
+
+
+@receiver(post_delete, sender=ForumPost)
+def uncount_post(sender, instance, **kwargs):
+    origin = kwargs.get('origin')
+    if origin is not None and _deleting_threads().get(instance.thread_id) is origin:
+        return
+
+    # The thread's last post may have been this one, so recount it outright
+    ForumThread.objects.recount([instance.thread_id])
+    ForumCategory.objects.filter(threads__id=instance.thread_id).update(post_count=F('post_count') - 1)
+
+
+# Category counters
+
+@receiver(pre_save, sender=ForumThread)
+def track_thread_category(sender, instance, raw=False, **kwargs):
+    """Remember the stored category so a moved thread recounts both categories"""
+    instance._previous_category_id = None
+    if raw or instance._state.adding:
+        return
+
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and not {'category', 'category_id'} & set(update_fields):
+        return
+
+    instance._previous_category_id = ForumThread.objects.filter(
+        pk=instance.pk
+    ).values_list('category_id', flat=True).first()
+
+
+@receiver(post_save, sender=ForumThread)
+def count_thread(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    if created:
+        ForumCategory.objects.filter(pk=instance.category_id).update(thread_count=F('thread_count') + 1)
+        return
+
+    previous_category_id = getattr(instance, '_previous_category_id', None)
+    if previous_category_id and previous_category_id != instance.category_id:
+        ForumCategory.objects.recount([previous_category_id, instance.category_id])
+
+
+@receiver(pre_delete, sender=ForumThread)
+def track_thread_delete(sender, instance, **kwargs):
+    _deleting_threads()[instance.pk] = kwargs.get('origin')
+
+
+@receiver(post_delete, sender=ForumThread)
+def uncount_thread(sender, instance, **kwargs):
+    _deleting_threads().pop(instance.pk, None)
+    # The thread's posts were deleted without touching the counters
+    ForumCategory.objects.recount([instance.category_id])
+
+
+# Search vectors
+
+@receiver(post_save, sender=ForumThread)
+def update_thread_search_vector(sender, instance, raw=False, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    if raw or (update_fields is not None and not {'title', 'content'} & set(update_fields)):
+        return
+    ForumThread.objects.update_search_vector([instance.pk])
+
+
+@receiver(post_save, sender=ForumPost)
+def update_post_search_vector(sender, instance, raw=False, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    if raw or (update_fields is not None and 'content' not in update_fields):
+        return
+    ForumPost.objects.update_search_vector([instance.pk])
@@ -0,0 +1,158 @@
+import time
+from unittest import mock
+
+from django.db import OperationalError, ProgrammingError, connection
+from django.db.models import QuerySet
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.users.models import User
+
+from . import view_counts
+from .models import ForumCategory, ForumPost, ForumThread
+
+
+class ForumCounterTests(TestCase):
+
+    def setUp(self):
+        self.author = User.objects.create_user(discord_id='1', username='author')
+        self.replier = User.objects.create_user(discord_id='2', username='replier')
+        self.category = ForumCategory.objects.create(name='General')
+
+    def create_thread(self, replies, title='Thread', author=None):
+        thread = ForumThread.objects.create(
+            title=title, content='Opening post', author=author or self.author, category=self.category
+        )
+        for i in range(replies):
+            ForumPost.objects.create(thread=thread, author=self.replier, content=f'Reply {i}')
+        return thread
+
+    def assertCategoryCounts(self, thread_count, post_count):
+        self.category.refresh_from_db()
+        self.assertEqual((self.category.thread_count, self.category.post_count), (thread_count, post_count))
+
+    def test_deleting_a_post_recounts_its_thread(self):
+        thread = self.create_thread(replies=3)
+        last = thread.posts.order_by('-created_at', '-id').first()
+
+        last.delete()
+
+        thread.refresh_from_db()
+        self.assertEqual(thread.post_count, 2)
+        self.assertNotEqual(thread.last_post_id, last.id)
+        self.assertIsNotNone(thread.last_post_id)
+        self.assertCategoryCounts(1, 2)
+
+    def test_deleting_a_thread_does_not_recount_per_post(self):
+        small = self.create_thread(replies=2, title='Small')
+        large = self.create_thread(replies=20, title='Large')
+        self.create_thread(replies=1, title='Kept')
+        self.assertCategoryCounts(3, 23)
+
+        with CaptureQueriesContext(connection) as small_delete:
+            small.delete()
+        with CaptureQueriesContext(connection) as large_delete:
+            large.delete()
+
+        self.assertEqual(len(large_delete), len(small_delete))
+        self.assertCategoryCounts(1, 1)
+
+    def test_deleting_a_user_recounts_threads_that_remain(self):
+        thread = self.create_thread(replies=3)
+        self.create_thread(replies=2, title='By replier', author=self.replier)
+
+        self.replier.delete()
+
+        thread.refresh_from_db()
+        self.assertEqual(thread.post_count, 0)
+        self.assertIsNone(thread.last_post_id)
+        self.assertCategoryCounts(1, 0)
+
+
+class ViewCountFlushTests(TestCase):
+
+    def setUp(self):
+        author = User.objects.create_user(discord_id='1', username='author')
+        category = ForumCategory.objects.create(name='General')
+        self.threads = [
+            ForumThread.objects.create(title=f'Thread {i}', content='Text', author=author, category=category)
+            for i in range(3)
+        ]
+        view_counts.reset()
+        self.addCleanup(view_counts.reset)
+
+    def add_views(self, thread, count):
+        with view_counts._lock:
+            view_counts._pending[thread.id] += count
+
+    def test_flush_writes_buffered_views(self):
+        self.add_views(self.threads[0], 2)
+        self.add_views(self.threads[1], 2)
+        self.add_views(self.threads[2], 5)
+
+        self.assertEqual(view_counts.flush(), 3)
+
+        self.assertEqual(
+            [thread.view_count for thread in ForumThread.objects.order_by('title')], [2, 2, 5]
+        )
+        self.assertEqual(view_counts.pending_views(self.threads[0].id), 0)
+
+    def test_failed_flush_logs_and_keeps_only_unwritten_views(self):
+        first, second, third = self.threads
+        self.add_views(first, 1)
+        self.add_views(second, 3)
+        self.add_views(third, 3)
+
+        update = QuerySet.update
+
+        def failing_update(queryset, **kwargs):
+            if kwargs['view_count'].rhs.value == 3:
+                # Views recorded while the flush is running are kept as well
+                self.add_views(second, 10)
+                raise OperationalError('connection lost')
+            return update(queryset, **kwargs)
+
+        with mock.patch.object(QuerySet, 'update', failing_update), \
+                self.assertLogs('apps.forums.view_counts', 'ERROR'):
+            self.assertEqual(view_counts.flush(), 1)
+
+        first.refresh_from_db()
+        self.assertEqual(first.view_count, 1)
+        self.assertEqual(view_counts.pending_views(first.id), 0)
+        self.assertEqual(view_counts.pending_views(second.id), 13)
+        self.assertEqual(view_counts.pending_views(third.id), 3)
+
+        self.assertEqual(view_counts.flush(), 2)
+        self.assertEqual(
+            [thread.view_count for thread in ForumThread.objects.order_by('title')], [1, 13, 3]
+        )
+
+    def test_views_are_flushed_on_a_timer(self):
+        thread = self.threads[0]
+        state = {'flushed_at': time.monotonic() + 60, 'timer': None, 'exit_hook': False}
+        with mock.patch.object(view_counts, 'FORUM_VIEW_FLUSH_INTERVAL', 0.05), \
+                mock.patch.dict(view_counts._state, state), \
+                mock.patch.object(view_counts.atexit, 'register') as register:
+            view_counts.record_view(thread.id)
+            self.assertEqual(view_counts.pending_views(thread.id), 1)
+            # The exit flush comes with the timer, once
+            register.assert_called_once_with(view_counts._flush_at_exit)
+            view_counts.record_view(self.threads[1].id)
+            register.assert_called_once()
+
+            deadline = time.monotonic() + 5
+            while view_counts.pending_views(thread.id) and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        # Written by the timer thread's own connection, outside this test's transaction
+        self.assertEqual(view_counts.pending_views(thread.id), 0)
+
+    def test_exit_flush_is_quiet_when_the_database_is_gone(self):
+        self.add_views(self.threads[0], 1)
+
+        def missing_table(queryset, **kwargs):
+            raise ProgrammingError('relation "forums_forumthread" does not exist')
+
+        with mock.patch.object(QuerySet, 'update', missing_table), \
+                self.assertNoLogs('apps.forums.view_counts', 'ERROR'):
+            view_counts._flush_at_exit()
@@ -0,0 +1,123 @@
+"""
+Buffered thread view counts
+
+Reads no longer write. Each worker process adds views up in memory and
+every FORUM_VIEW_FLUSH_INTERVAL seconds writes them out with one
+UPDATE ... SET view_count = view_count + n per distinct n, from a background
+timer and from busy requests alike. Once the timer has started, views still
+in the buffer when the process exits are flushed at exit. A flush that hits a
+database error logs it and keeps the views it could not write for the next
+one.
+
+With FORUM_VIEW_DEDUPE_WINDOW set, a signed-in user's repeat views of the
+same thread within that many seconds count once.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.db.models import F
+
+FORUM_VIEW_FLUSH_INTERVAL = getattr(settings, 'FORUM_VIEW_FLUSH_INTERVAL', 10)
+FORUM_VIEW_DEDUPE_WINDOW = getattr(settings, 'FORUM_VIEW_DEDUPE_WINDOW', 0)
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_pending = Counter()
+_state = {'flushed_at': time.monotonic(), 'timer': None, 'exit_hook': False}
+
+
+def record_view(thread_id, user_id=None):
+    """Count one view of a thread; returns False if it was deduplicated"""
+    if user_id and FORUM_VIEW_DEDUPE_WINDOW:
+        if not cache.add(f'forum:viewed:{thread_id}:{user_id}', 1, FORUM_VIEW_DEDUPE_WINDOW):
+            return False
+
+    with _lock:
+        _pending[thread_id] += 1
+        due = time.monotonic() - _state['flushed_at'] >= FORUM_VIEW_FLUSH_INTERVAL
+        timer = _state['timer']
+        if timer is None or not timer.is_alive():
+            # Started lazily so each forked worker runs its own
+            timer = threading.Thread(target=_flush_periodically, name='forum-view-flush', daemon=True)
+            _state['timer'] = timer
+            timer.start()
+            if not _state['exit_hook']:
+                atexit.register(_flush_at_exit)
+                _state['exit_hook'] = True
+
+    if due:
+        flush()
+    return True
+
+
+def pending_views(thread_id):
+    """Views of a thread buffered in this process and not yet written"""
+    return _pending.get(thread_id, 0)
+
+
+def reset():
+    """Drop the buffered views without writing them, e.g. between tests"""
+    with _lock:
+        _pending.clear()
+        _state['flushed_at'] = time.monotonic()
+
+
+def flush(quiet=False):
+    """
+    Write the buffered views out; returns the number of threads updated.
+    With quiet set, a database error is logged at debug level instead.
+    """
+    from .models import ForumThread
+
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _state['flushed_at'] = time.monotonic()
+
+    if not pending:
+        return 0
+
+    by_count = defaultdict(list)
+    for thread_id, count in pending.items():
+        by_count[count].append(thread_id)
+
+    written = 0
+    batches = list(by_count.items())
+    for i, (count, thread_ids) in enumerate(batches):
+        try:
+            ForumThread.objects.filter(id__in=thread_ids).update(view_count=F('view_count') + count)
+        except DatabaseError:
+            log = logger.debug if quiet else logger.error
+            log('Failed to write buffered views of %s forum threads', len(pending) - written, exc_info=True)
+            # Put back this batch and the ones after it, on top of any views
+            # recorded since; the batches already written stay written
+            with _lock:
+                for unwritten_count, unwritten_ids in batches[i:]:
+                    for thread_id in unwritten_ids:
+                        _pending[thread_id] += unwritten_count
+            break
+        written += len(thread_ids)
+
+    return written
+
+
+def _flush_periodically():
+    while True:
+        time.sleep(FORUM_VIEW_FLUSH_INTERVAL)
+        try:
+            flush()
+        finally:
+            connection.close()
+
+
+def _flush_at_exit():
+    # The database may be gone by now (a dropped test database, say), and
+    # nothing can keep the views anyway
+    flush(quiet=True)
@@ -1,14 +1,20 @@
+import uuid
+
 from rest_framework import viewsets, permissions, status, filters
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from django.db.models import Count
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
+from . import search as forum_search
+from . import view_counts
 from .models import ForumCategory, ForumThread, ForumPost
 from .serializers import (
     ForumCategorySerializer, ForumThreadListSerializer, ForumThreadDetailSerializer,
     ForumPostSerializer, ForumThreadCreateSerializer, ForumPostCreateSerializer
 )
+from apps.core.pagination import OptionalCursorPagination
 from apps.users.views import IsAdminOrReadOnly
 
 
@@ -24,23 +30,32 @@ class IsAuthorOrAdminOrReadOnly(permissions.BasePermission):
 
 
 class ForumCategoryViewSet(viewsets.ModelViewSet):
-    queryset = ForumCategory.objects.all()
+    queryset = ForumCategory.objects.annotate(subcategories_count=Count('subcategories'))
     serializer_class = ForumCategorySerializer
     permission_classes = [IsAdminOrReadOnly]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['name', 'description']
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
+    # Queries per request, authentication included (see apps.core.instrumentation)
+    query_budgets = {'list': 4}
 
 
 class ForumThreadViewSet(viewsets.ModelViewSet):
-    queryset = ForumThread.objects.all()
+    queryset = ForumThread.objects.select_related('author', 'category', 'last_post_author')
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['category', 'author', 'is_pinned', 'is_locked']
     search_fields = ['title', 'content']
     ordering_fields = ['created_at', 'last_activity', 'view_count']
     ordering = ['-is_pinned', '-last_activity']
     permission_classes = [IsAuthorOrAdminOrReadOnly]
+    pagination_class = OptionalCursorPagination
+    query_budgets = {'list': 4, 'search': 6}
+
+    @property
+    def cursor_ordering(self):
+        # Only the posts of a thread can be paged by cursor
+        return ('created_at', 'id') if self.action == 'posts' else None
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -61,9 +76,9 @@ class ForumThreadViewSet(viewsets.ModelViewSet):
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        # Increment view count
-        instance.view_count += 1
-        instance.save(update_fields=['view_count'])
+        # Count the view; the buffer writes it out in batches
+        view_counts.record_view(instance.id, request.user.pk)
+        instance.view_count += view_counts.pending_views(instance.id)
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
@@ -80,6 +95,35 @@ class ForumThreadViewSet(viewsets.ModelViewSet):
         serializer = ForumPostSerializer(posts, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """
+        Search threads and posts together, most relevant and recent first.
+        ?category= restricts the search to a category and its subcategories.
+        """
+        query = request.query_params.get('q', '')
+
+        if not query:
+            return Response({"detail": "Search query is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        category_ids = None
+        category = request.query_params.get('category')
+        if category:
+            try:
+                category_ids = forum_search.category_subtree(uuid.UUID(category))
+            except ValueError:
+                return Response({"detail": "Invalid category."}, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = forum_search.search(query, category_ids)
+        if rows is None:
+            rows = []
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(forum_search.load_hits(page, query))
+
+        return Response(forum_search.load_hits(list(rows), query))
+
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def add_post(self, request, pk=None):
         thread = self.get_object()
@@ -109,6 +153,8 @@ class ForumPostViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ['thread', 'author']
     search_fields = ['content']
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ('created_at', 'id')
 
     def perform_update(self, serializer):
         serializer.save(is_edited=True, edit_timestamp=timezone.now())
\ No newline at end of file
@@ -0,0 +1,11 @@
+# backend/apps/onboarding/apps.py
+from django.apps import AppConfig
+
+
+class OnboardingConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.onboarding'
+
+    def ready(self):
+        # Register model signal handlers
+        from . import signals  # noqa: F401
@@ -0,0 +1,169 @@
+# backend/apps/onboarding/discord_outbox.py
+"""
+Delivery of queued Discord webhook messages
+
+Views only write DiscordNotification rows. The send_discord_notifications
+worker claims due rows in batches, posts them concurrently over one pooled
+HTTP session and records the outcome. Failed posts are retried with
+exponential backoff; 429 responses are retried after the delay Discord asks
+for, and hold back the rest of the batch for that webhook until then.
+"""
+import os
+import random
+import threading
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+
+from .models import Application, DiscordNotification
+
+WEBHOOK_TIMEOUT = getattr(settings, 'DISCORD_WEBHOOK_TIMEOUT', 10)
+MAX_ATTEMPTS = getattr(settings, 'DISCORD_OUTBOX_MAX_ATTEMPTS', 8)
+BACKOFF_BASE = getattr(settings, 'DISCORD_OUTBOX_BACKOFF_BASE', 5)
+BACKOFF_MAX = getattr(settings, 'DISCORD_OUTBOX_BACKOFF_MAX', 60 * 60)
+
+# Claimed rows are pushed this far into the future, so a worker that dies
+# mid-batch releases them to the next worker instead of losing them
+CLAIM_LEASE = timedelta(minutes=5)
+
+
+def get_session(pool_size):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def backoff_delay(attempts):
+    """Seconds to wait after the given number of failed attempts, with jitter"""
+    delay = min(BACKOFF_BASE * 2 ** (attempts - 1), BACKOFF_MAX)
+    return delay * random.uniform(0.8, 1.2)
+
+
+def retry_after(response):
+    """Seconds Discord asked us to wait on a 429"""
+    try:
+        return float(response.json()['retry_after'])
+    except (ValueError, KeyError, TypeError):
+        pass
+    try:
+        return float(response.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return BACKOFF_BASE
+
+
+def claim_batch(batch_size):
+    """
+    Lock up to batch_size due rows, skipping rows another worker holds, and
+    lease them to this worker. Returns the claimed rows.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            DiscordNotification.objects.due(now).select_for_update(skip_locked=True)[:batch_size]
+        )
+        for notification in batch:
+            notification.attempts += 1
+            notification.next_attempt_at = now + CLAIM_LEASE
+        DiscordNotification.objects.bulk_update(batch, ['attempts', 'next_attempt_at'])
+    return batch
+
+
+class WebhookSender:
+    """Posts notifications over a shared session, tracking per-webhook rate limits"""
+
+    def __init__(self, session):
+        self.session = session
+        self.blocked_until = {}
+        self.lock = threading.Lock()
+
+    def _block(self, url, seconds):
+        with self.lock:
+            until = timezone.now() + timedelta(seconds=seconds)
+            self.blocked_until[url] = max(until, self.blocked_until.get(url, until))
+
+    def send(self, notification):
+        """
+        Post one notification. Returns (outcome, detail) where outcome is
+        'sent', 'rate_limited' (detail is the delay in seconds), 'retry' or
+        'failed' (detail is the error).
+        """
+        url = os.environ.get(DiscordNotification.WEBHOOK_ENV[notification.webhook])
+        if not url:
+            return 'failed', f'{notification.webhook} webhook is not configured'
+
+        blocked = self.blocked_until.get(url)
+        if blocked and blocked > timezone.now():
+            return 'rate_limited', (blocked - timezone.now()).total_seconds()
+
+        try:
+            response = self.session.post(url, json=notification.payload, timeout=WEBHOOK_TIMEOUT)
+        except requests.RequestException as e:
+            return 'retry', str(e)
+
+        if response.status_code == 429:
+            delay = retry_after(response)
+            self._block(url, delay)
+            return 'rate_limited', delay
+        if response.ok:
+            return 'sent', None
+        if response.status_code >= 500:
+            return 'retry', f'HTTP {response.status_code}'
+        # Anything else (bad payload, deleted webhook) will not succeed on retry
+        return 'failed', f'HTTP {response.status_code}: {response.text[:500]}'
+
+
+def record_results(results):
+    """Store the outcome of each send in a handful of queries"""
+    now = timezone.now()
+    sent_applications = []
+
+    for notification, (outcome, detail) in results:
+        if outcome == 'sent':
+            notification.status = DiscordNotification.STATUS_SENT
+            notification.sent_at = now
+            notification.last_error = ''
+            if notification.event == 'application_submitted' and notification.webhook == 'application':
+                sent_applications.append(notification.application_id)
+        elif outcome == 'rate_limited':
+            # Discord told us when to come back; this does not count as a failure
+            notification.attempts -= 1
+            notification.next_attempt_at = now + timedelta(seconds=detail)
+            notification.last_error = f'Rate limited for {detail:.2f}s'
+        elif outcome == 'retry' and notification.attempts < MAX_ATTEMPTS:
+            notification.next_attempt_at = now + timedelta(seconds=backoff_delay(notification.attempts))
+            notification.last_error = detail
+        else:
+            notification.status = DiscordNotification.STATUS_FAILED
+            notification.last_error = detail
+
+    with transaction.atomic():
+        DiscordNotification.objects.bulk_update(
+            [notification for notification, _ in results],
+            ['status', 'attempts', 'next_attempt_at', 'last_error', 'sent_at']
+        )
+        if sent_applications:
+            Application.objects.filter(id__in=sent_applications).update(
+                discord_notification_sent=True,
+                discord_notification_sent_at=now
+            )
+
+
+def deliver_batch(sender, executor, batch_size):
+    """Claim, send and record one batch. Returns {status: count}."""
+    batch = claim_batch(batch_size)
+    if not batch:
+        return {}
+
+    results = list(zip(batch, executor.map(sender.send, batch)))
+    record_results(results)
+
+    counts = {}
+    for notification in batch:
+        counts[notification.status] = counts.get(notification.status, 0) + 1
+    return counts
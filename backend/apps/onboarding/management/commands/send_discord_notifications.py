@@ -0,0 +1,55 @@
+# backend/apps/onboarding/management/commands/send_discord_notifications.py
+"""
+Deliver queued Discord webhook messages.
+
+Run once to drain everything due (e.g. from cron), or with --loop as a
+long-running worker. Several workers can run side by side; each claims its
+own rows.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from apps.onboarding.discord_outbox import WebhookSender, deliver_batch, get_session
+
+
+class Command(BaseCommand):
+    help = 'Sends pending Discord webhook notifications from the outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50,
+                            help='Notifications claimed per batch')
+        parser.add_argument('--concurrency', type=int, default=8,
+                            help='Webhook posts in flight at once')
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep polling for new notifications instead of exiting once drained')
+        parser.add_argument('--interval', type=float, default=2.0,
+                            help='Seconds to wait between polls when the outbox is empty (with --loop)')
+
+    def handle(self, *args, **options):
+        self.stdout.write('Sending Discord notifications...')
+
+        sender = WebhookSender(get_session(options['concurrency']))
+        totals = {}
+
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            while True:
+                counts = deliver_batch(sender, executor, options['batch_size'])
+                for outcome, count in counts.items():
+                    totals[outcome] = totals.get(outcome, 0) + count
+
+                if counts:
+                    if options['verbosity'] > 1:
+                        self.stdout.write(f'Batch: {counts}')
+                    continue
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Successfully processed Discord notifications: "
+            f"{totals.get('sent', 0)} sent, "
+            f"{totals.get('pending', 0)} to retry, "
+            f"{totals.get('failed', 0)} failed"
+        ))
@@ -5,7 +5,7 @@ import django.db.models.deletion
 class Migration(migrations.Migration):
 
     dependencies = [
-        ('units', '0001_initial'),  # or whatever your units migration is
+        ('units', '0006_promotion_recruitment_models'),
         ('onboarding', '0001_initial'),
     ]
 
@@ -0,0 +1,519 @@
+# Generated by Django 5.2 on 2026-10-17 03:40
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+def number_applications(apps, schema_editor):
+    """Give existing applications APP-YYYYMMDD-XXXX numbers in creation order"""
+    Application = apps.get_model('onboarding', 'Application')
+
+    last_numbers = {}
+    applications = Application.objects.filter(application_number__isnull=True).order_by('created_at', 'id')
+    for application in applications.iterator():
+        day = application.created_at.date()
+        last_numbers[day] = last_numbers.get(day, 0) + 1
+        application.application_number = f"APP-{day:%Y%m%d}-{last_numbers[day]:04d}"
+        application.save(update_fields=['application_number'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('onboarding', '0004_discordnotification'),
+        ('units', '0006_promotion_recruitment_models'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='application',
+            old_name='username',
+            new_name='discord_username',
+        ),
+        migrations.RenameField(
+            model_name='application',
+            old_name='motivation',
+            new_name='reason_for_joining',
+        ),
+        migrations.RenameField(
+            model_name='application',
+            old_name='experience',
+            new_name='previous_experience',
+        ),
+        migrations.RenameField(
+            model_name='application',
+            old_name='submission_date',
+            new_name='submitted_at',
+        ),
+        migrations.RenameField(
+            model_name='application',
+            old_name='review_date',
+            new_name='reviewed_at',
+        ),
+        migrations.RenameField(
+            model_name='application',
+            old_name='interview_date',
+            new_name='interview_scheduled_at',
+        ),
+        migrations.CreateModel(
+            name='ApplicationComment',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('comment', models.TextField()),
+                ('is_visible_to_applicant', models.BooleanField(default=False)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ApplicationInterview',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('scheduled_at', models.DateTimeField()),
+                ('interview_type', models.CharField(choices=[('initial', 'Initial Interview'), ('technical', 'Technical Interview'), ('command', 'Command Interview'), ('final', 'Final Interview')], default='initial', max_length=20)),
+                ('status', models.CharField(choices=[('scheduled', 'Scheduled'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('no_show', 'No Show'), ('rescheduled', 'Rescheduled')], default='scheduled', max_length=20)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('interview_notes', models.TextField(blank=True, null=True)),
+                ('recommendation', models.CharField(blank=True, choices=[('strongly_recommend', 'Strongly Recommend'), ('recommend', 'Recommend'), ('neutral', 'Neutral'), ('not_recommend', 'Do Not Recommend'), ('strongly_not_recommend', 'Strongly Do Not Recommend')], max_length=25, null=True)),
+            ],
+            options={
+                'ordering': ['scheduled_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ApplicationProgress',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('basic_info_completed', models.BooleanField(default=False)),
+                ('branch_selected', models.BooleanField(default=False)),
+                ('primary_unit_selected', models.BooleanField(default=False)),
+                ('secondary_unit_selected', models.BooleanField(default=False)),
+                ('track_selected', models.BooleanField(default=False)),
+                ('position_selected', models.BooleanField(default=False)),
+                ('experience_completed', models.BooleanField(default=False)),
+                ('role_specific_completed', models.BooleanField(default=False)),
+                ('waivers_completed', models.BooleanField(default=False)),
+                ('current_step', models.IntegerField(default=2)),
+                ('last_saved_at', models.DateTimeField(auto_now=True)),
+                ('completion_percentage', models.IntegerField(default=0)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ApplicationWaiver',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('accepted', models.BooleanField(default=False)),
+                ('accepted_at', models.DateTimeField(blank=True, null=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ApplicationWaiverType',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('code', models.CharField(max_length=50, unique=True)),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField()),
+                ('content', models.TextField(help_text='Full waiver/acknowledgment text')),
+                ('is_required', models.BooleanField(default=True)),
+                ('order', models.IntegerField(default=0)),
+                ('waiver_type', models.CharField(choices=[('acknowledgment', 'Acknowledgment'), ('waiver', 'Waiver'), ('agreement', 'Agreement'), ('consent', 'Consent')], default='acknowledgment', max_length=20)),
+            ],
+            options={
+                'ordering': ['order', 'title'],
+            },
+        ),
+        migrations.RemoveField(
+            model_name='branchapplication',
+            name='branch',
+        ),
+        migrations.RemoveField(
+            model_name='branchapplication',
+            name='reviewer',
+        ),
+        migrations.RemoveField(
+            model_name='branchapplication',
+            name='user',
+        ),
+        migrations.RemoveField(
+            model_name='useronboardingprogress',
+            name='branch_application',
+        ),
+        migrations.AlterModelOptions(
+            name='application',
+            options={'ordering': ['-created_at']},
+        ),
+        migrations.RemoveField(
+            model_name='application',
+            name='onboarding_complete',
+        ),
+        migrations.RemoveField(
+            model_name='application',
+            name='preferred_branch',
+        ),
+        migrations.RemoveField(
+            model_name='application',
+            name='preferred_unit',
+        ),
+        migrations.RemoveField(
+            model_name='useronboardingprogress',
+            name='bit_event',
+        ),
+        migrations.RemoveField(
+            model_name='useronboardingprogress',
+            name='branch_induction_event',
+        ),
+        migrations.RemoveField(
+            model_name='useronboardingprogress',
+            name='last_updated',
+        ),
+        migrations.RemoveField(
+            model_name='useronboardingprogress',
+            name='officer_track',
+        ),
+        migrations.RemoveField(
+            model_name='useronboardingprogress',
+            name='warrant_track',
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='application_number',
+            field=models.CharField(editable=False, help_text='Auto-generated application number', max_length=20, null=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='availability_notes',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='branch',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='applications_v2', to='units.branch'),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='can_attend_mandatory_events',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='career_track',
+            field=models.CharField(choices=[('enlisted', 'Enlisted'), ('warrant', 'Warrant Officer'), ('officer', 'Commissioned Officer')], default='enlisted', max_length=20),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='country',
+            field=models.CharField(default='', max_length=100),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='date_of_birth',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='decision_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='discord_discriminator',
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='discord_notification_sent',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='discord_notification_sent_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='first_name',
+            field=models.CharField(default='', max_length=100),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='flight_hours',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='has_flight_experience',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='interview_completed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='interview_notes',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='last_name',
+            field=models.CharField(default='', max_length=100),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='leadership_experience',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='primary_unit',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='primary_applications', to='units.unit'),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='referral_source',
+            field=models.CharField(blank=True, help_text='How did you hear about us?', max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='role_specific_answers',
+            field=models.JSONField(blank=True, default=dict, help_text='Answers to role/position specific questions'),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='secondary_unit',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='secondary_applications', to='units.unit'),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='started_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='technical_experience',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='timezone',
+            field=models.CharField(default='UTC', max_length=50),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='applications_v2', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='weekly_availability_hours',
+            field=models.IntegerField(default=0, help_text='Hours available per week'),
+        ),
+        migrations.AddField(
+            model_name='mentorassignment',
+            name='application',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='onboarding.application'),
+        ),
+        migrations.AddField(
+            model_name='useronboardingprogress',
+            name='basic_training_completed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='useronboardingprogress',
+            name='basic_training_completed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='useronboardingprogress',
+            name='basic_training_enrolled',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='useronboardingprogress',
+            name='basic_training_enrolled_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='useronboardingprogress',
+            name='discord_roles_assigned',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='useronboardingprogress',
+            name='discord_roles_assigned_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='useronboardingprogress',
+            name='mentor_assigned',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='useronboardingprogress',
+            name='mentor_assigned_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='useronboardingprogress',
+            name='orientation_completed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='useronboardingprogress',
+            name='orientation_completed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='useronboardingprogress',
+            name='unit_assigned',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='useronboardingprogress',
+            name='unit_assigned_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='email',
+            field=models.EmailField(default='', max_length=254),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='previous_experience',
+            field=models.TextField(default='', help_text='Previous gaming/simulation experience'),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='reason_for_joining',
+            field=models.TextField(help_text='Why do you want to join this unit?'),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='referrer',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='referrals_v2', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='reviewer',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reviewed_applications_v2', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='status',
+            field=models.CharField(choices=[('draft', 'Draft'), ('submitted', 'Submitted'), ('under_review', 'Under Review'), ('interview_scheduled', 'Interview Scheduled'), ('interview_completed', 'Interview Completed'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('withdrawn', 'Withdrawn'), ('on_hold', 'On Hold')], default='draft', max_length=30),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='submitted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mentorassignment',
+            name='status',
+            field=models.CharField(choices=[('active', 'Active'), ('completed', 'Completed'), ('terminated', 'Terminated'), ('on_hold', 'On Hold')], default='active', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='useronboardingprogress',
+            name='onboarding_status',
+            field=models.CharField(choices=[('pending_discord', 'Pending Discord Setup'), ('pending_orientation', 'Pending Orientation'), ('in_training', 'In Basic Training'), ('pending_assignment', 'Pending Unit Assignment'), ('active', 'Active Member'), ('inactive', 'Inactive')], default='pending_discord', max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['application_number'], name='onboarding__applica_fc137c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['discord_id'], name='onboarding__discord_c41d96_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['status'], name='onboarding__status_0f65f0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['branch', 'career_track'], name='onboarding__branch__c4fda3_idx'),
+        ),
+        migrations.AddField(
+            model_name='applicationcomment',
+            name='application',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='onboarding.application'),
+        ),
+        migrations.AddField(
+            model_name='applicationcomment',
+            name='author',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='applicationinterview',
+            name='application',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='interviews', to='onboarding.application'),
+        ),
+        migrations.AddField(
+            model_name='applicationinterview',
+            name='interviewer',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='conducted_interviews', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='applicationinterview',
+            name='scheduled_by',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='scheduled_interviews', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='applicationprogress',
+            name='application',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='progress', to='onboarding.application'),
+        ),
+        migrations.AddField(
+            model_name='applicationwaiver',
+            name='application',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waivers', to='onboarding.application'),
+        ),
+        migrations.AddField(
+            model_name='applicationwaiver',
+            name='waiver_type',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='onboarding.applicationwaivertype'),
+        ),
+        migrations.DeleteModel(
+            name='BranchApplication',
+        ),
+        migrations.AlterUniqueTogether(
+            name='applicationwaiver',
+            unique_together={('application', 'waiver_type')},
+        ),
+        migrations.RunPython(number_applications, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='application',
+            name='application_number',
+            field=models.CharField(editable=False, help_text='Auto-generated application number', max_length=20, unique=True),
+        ),
+    ]
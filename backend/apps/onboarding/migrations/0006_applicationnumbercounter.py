@@ -0,0 +1,54 @@
+# Generated by Django 5.2 on 2026-10-17 03:05
+
+import datetime
+import uuid
+
+from django.db import migrations, models
+
+
+def seed_counters(apps, schema_editor):
+    """Start each day's counter at the highest APP-YYYYMMDD-XXXX number already issued that day"""
+    Application = apps.get_model('onboarding', 'Application')
+    ApplicationNumberCounter = apps.get_model('onboarding', 'ApplicationNumberCounter')
+
+    last_numbers = {}
+    numbers = Application.objects.filter(
+        application_number__startswith='APP-'
+    ).values_list('application_number', flat=True)
+    for number in numbers.iterator():
+        try:
+            _, day, sequence = number.split('-')
+            day = datetime.datetime.strptime(day, '%Y%m%d').date()
+            sequence = int(sequence)
+        except ValueError:
+            continue
+        last_numbers[day] = max(sequence, last_numbers.get(day, 0))
+
+    ApplicationNumberCounter.objects.bulk_create(
+        [ApplicationNumberCounter(day=day, last_number=last) for day, last in last_numbers.items()],
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('onboarding', '0005_application_redesign'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationNumberCounter',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('day', models.DateField(unique=True)),
+                ('last_number', models.IntegerField(default=0)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
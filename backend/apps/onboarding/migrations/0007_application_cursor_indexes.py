@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-17 03:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('onboarding', '0006_applicationnumbercounter'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['-created_at', '-id'], name='onboarding__created_6273a7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='onboarding__user_id_5616dd_idx'),
+        ),
+    ]
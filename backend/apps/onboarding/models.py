@@ -1,5 +1,5 @@
 # backend/apps/onboarding/models.py
-from django.db import models
+from django.db import connections, models
 from django.utils import timezone
 from apps.core.models import BaseModel
 import uuid
@@ -44,6 +44,43 @@ class ApplicationStatus(models.TextChoices):
     ON_HOLD = 'on_hold', 'On Hold'
 
 
+class ApplicationNumberCounterManager(models.Manager):
+    def allocate(self, day):
+        """
+        Return the next application sequence number for the given day.
+
+        A single upsert increments the day's counter row and returns the new
+        value. The row stays locked until the caller's transaction ends, so
+        concurrent submits queue on it instead of reading the same maximum.
+        Numbers from rolled-back transactions are not reused.
+        """
+        table = connections[self.db].ops.quote_name(self.model._meta.db_table)
+        now = timezone.now()
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (id, created_at, updated_at, day, last_number)
+                VALUES (%s, %s, %s, %s, 1)
+                ON CONFLICT (day) DO UPDATE
+                SET last_number = {table}.last_number + 1, updated_at = EXCLUDED.updated_at
+                RETURNING last_number
+                """,
+                [uuid.uuid4(), now, now, day]
+            )
+            return cursor.fetchone()[0]
+
+
+class ApplicationNumberCounter(BaseModel):
+    """Last application number handed out per day"""
+    day = models.DateField(unique=True)
+    last_number = models.IntegerField(default=0)
+
+    objects = ApplicationNumberCounterManager()
+
+    def __str__(self):
+        return f"{self.day}: {self.last_number}"
+
+
 class Application(BaseModel):
     """Enhanced application model for the new flow"""
 
@@ -221,23 +258,17 @@ class Application(BaseModel):
             models.Index(fields=['discord_id']),
             models.Index(fields=['status']),
             models.Index(fields=['branch', 'career_track']),
+            # Keyset pagination (ApplicationViewSet.cursor_ordering)
+            models.Index(fields=['-created_at', '-id']),
+            models.Index(fields=['user', '-created_at', '-id']),
         ]
 
     def save(self, *args, **kwargs):
         if not self.application_number:
             # Generate application number: APP-YYYYMMDD-XXXX
-            date_str = timezone.now().strftime('%Y%m%d')
-            last_app = Application.objects.filter(
-                application_number__startswith=f'APP-{date_str}'
-            ).order_by('-application_number').first()
-
-            if last_app:
-                last_num = int(last_app.application_number.split('-')[-1])
-                new_num = last_num + 1
-            else:
-                new_num = 1
-
-            self.application_number = f'APP-{date_str}-{new_num:04d}'
+            today = timezone.now().date()
+            new_num = ApplicationNumberCounter.objects.allocate(today)
+            self.application_number = f"APP-{today.strftime('%Y%m%d')}-{new_num:04d}"
 
         super().save(*args, **kwargs)
 
@@ -410,6 +441,80 @@ class ApplicationInterview(BaseModel):
         ordering = ['scheduled_at']
 
 
+class DiscordNotificationManager(models.Manager):
+    def enqueue(self, webhook, payload, application=None, event=''):
+        """
+        Queue a webhook message for the send_discord_notifications worker.
+        Call inside the transaction that makes the change being announced, so
+        the message goes out if and only if the change commits.
+        """
+        return self.create(
+            webhook=webhook,
+            payload=payload,
+            application=application,
+            event=event,
+            next_attempt_at=timezone.now()
+        )
+
+    def due(self, now=None):
+        return self.filter(
+            status=DiscordNotification.STATUS_PENDING,
+            next_attempt_at__lte=now or timezone.now()
+        )
+
+
+class DiscordNotification(BaseModel):
+    """Outbox of Discord webhook messages, delivered by send_discord_notifications"""
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+
+    # Webhook -> environment variable holding its URL
+    WEBHOOK_ENV = {
+        'application': 'DISCORD_APPLICATION_WEBHOOK',
+        'admin': 'DISCORD_ADMIN_WEBHOOK',
+    }
+
+    webhook = models.CharField(
+        max_length=20,
+        choices=[
+            ('application', 'Application Channel'),
+            ('admin', 'Admin Channel')
+        ]
+    )
+    event = models.CharField(max_length=50, blank=True)
+    payload = models.JSONField()
+    application = models.ForeignKey(
+        Application, on_delete=models.CASCADE, null=True, blank=True,
+        related_name='discord_notifications'
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            (STATUS_PENDING, 'Pending'),
+            (STATUS_SENT, 'Sent'),
+            (STATUS_FAILED, 'Failed')
+        ],
+        default=STATUS_PENDING
+    )
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    objects = DiscordNotificationManager()
+
+    class Meta:
+        ordering = ['next_attempt_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.event or 'message'} -> {self.webhook} ({self.status})"
+
+
 # Keep existing models for backward compatibility but mark as deprecated
 class CommissionStage(BaseModel):
     """DEPRECATED - Use ApplicationProgress instead"""
@@ -0,0 +1,44 @@
+# backend/apps/onboarding/recruitment_cache.py
+"""
+Cached bootstrap payload for the application wizard
+
+recruitment_data is the same for every visitor, so it is rendered to JSON
+bytes once, tagged with a content hash and kept until a branch or waiver type
+changes. Browsers and the CDN revalidate it with If-None-Match.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.core.renderers import ORJSONRenderer
+
+# Bump when the payload shape changes so old payloads are never served
+RECRUITMENT_DATA_FORMAT_VERSION = 1
+
+RECRUITMENT_DATA_TIMEOUT = getattr(settings, 'RECRUITMENT_DATA_TIMEOUT', 60 * 60 * 24)
+
+# How long browsers and shared caches may reuse the payload without asking
+RECRUITMENT_DATA_MAX_AGE = getattr(settings, 'RECRUITMENT_DATA_MAX_AGE', 60 * 5)
+
+
+def payload_key():
+    return f"recruitment_data:v{RECRUITMENT_DATA_FORMAT_VERSION}"
+
+
+def get_payload():
+    """Return the (etag, payload bytes) pair, rendering it on a cache miss"""
+    snapshot = cache.get(payload_key())
+    if snapshot is None:
+        from .serializers import ApplicationRecruitmentDataSerializer
+
+        payload = ORJSONRenderer().render(ApplicationRecruitmentDataSerializer({}).data)
+        snapshot = (f'"{hashlib.md5(payload).hexdigest()}"', payload)
+        cache.set(payload_key(), snapshot, RECRUITMENT_DATA_TIMEOUT)
+    return snapshot
+
+
+def invalidate():
+    """Drop the payload once the surrounding transaction commits"""
+    transaction.on_commit(lambda: cache.delete(payload_key()))
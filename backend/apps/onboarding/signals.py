@@ -0,0 +1,23 @@
+# backend/apps/onboarding/signals.py
+"""
+Signal handlers that keep cached onboarding data in sync with the source models
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.units.models import Branch
+
+from . import recruitment_cache
+from .models import ApplicationWaiverType
+
+
+# Recruitment data payload
+
+@receiver(post_save, sender=Branch)
+@receiver(post_delete, sender=Branch)
+@receiver(post_save, sender=ApplicationWaiverType)
+@receiver(post_delete, sender=ApplicationWaiverType)
+def invalidate_recruitment_data(sender, raw=False, **kwargs):
+    if raw:
+        return
+    recruitment_cache.invalidate()
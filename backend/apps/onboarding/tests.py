@@ -0,0 +1,208 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from apps.units.models import Branch, RecruitmentSlot, Role, Unit
+from apps.users.models import User
+
+from .discord_outbox import MAX_ATTEMPTS, WebhookSender, deliver_batch, get_session
+from .models import Application, ApplicationNumberCounter, ApplicationStatus, DiscordNotification
+
+
+class StubWebhookHandler(BaseHTTPRequestHandler):
+    """Answers each path with the (status, body) set in `responses` and records what was posted"""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.received.append((self.path, json.loads(body)))
+        status, payload = self.server.responses[self.path]
+        data = json.dumps(payload).encode() if payload is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class DiscordOutboxTests(TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubWebhookHandler)
+        self.server.received = []
+        self.server.responses = {}
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        base = f'http://127.0.0.1:{self.server.server_address[1]}'
+        environ = mock.patch.dict(os.environ, {
+            'DISCORD_APPLICATION_WEBHOOK': f'{base}/application',
+            'DISCORD_ADMIN_WEBHOOK': f'{base}/admin',
+        })
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def deliver(self):
+        sender = WebhookSender(get_session(4))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return deliver_batch(sender, executor, batch_size=10)
+
+    def test_delivered_messages_are_marked_sent(self):
+        self.server.responses = {'/application': (204, None)}
+        notifications = [
+            DiscordNotification.objects.enqueue('application', {'content': str(i)}) for i in range(3)
+        ]
+
+        self.assertEqual(self.deliver(), {DiscordNotification.STATUS_SENT: 3})
+
+        self.assertEqual(
+            sorted(payload['content'] for _, payload in self.server.received), ['0', '1', '2']
+        )
+        for notification in notifications:
+            notification.refresh_from_db()
+            self.assertEqual(notification.status, DiscordNotification.STATUS_SENT)
+            self.assertEqual(notification.attempts, 1)
+            self.assertIsNotNone(notification.sent_at)
+        # Nothing is due any more
+        self.assertEqual(self.deliver(), {})
+
+    def test_rate_limited_message_waits_without_using_an_attempt(self):
+        self.server.responses = {'/admin': (429, {'retry_after': 30})}
+        notification = DiscordNotification.objects.enqueue('admin', {'content': 'hello'})
+
+        self.assertEqual(self.deliver(), {DiscordNotification.STATUS_PENDING: 1})
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.attempts, 0)
+        self.assertGreater(notification.next_attempt_at, timezone.now() + timedelta(seconds=20))
+        self.assertEqual(self.deliver(), {})
+
+    def test_server_errors_are_retried_and_client_errors_are_not(self):
+        self.server.responses = {'/application': (500, None), '/admin': (400, {'message': 'Invalid payload'})}
+        retried = DiscordNotification.objects.enqueue('application', {'content': 'a'})
+        rejected = DiscordNotification.objects.enqueue('admin', {'content': 'b'})
+
+        self.assertEqual(self.deliver(), {DiscordNotification.STATUS_PENDING: 1, DiscordNotification.STATUS_FAILED: 1})
+
+        retried.refresh_from_db()
+        self.assertEqual(retried.status, DiscordNotification.STATUS_PENDING)
+        self.assertEqual(retried.last_error, 'HTTP 500')
+        rejected.refresh_from_db()
+        self.assertEqual(rejected.status, DiscordNotification.STATUS_FAILED)
+        self.assertIn('Invalid payload', rejected.last_error)
+
+    def test_message_fails_after_max_attempts(self):
+        self.server.responses = {'/application': (503, None)}
+        notification = DiscordNotification.objects.enqueue('application', {'content': 'a'})
+        DiscordNotification.objects.filter(id=notification.id).update(attempts=MAX_ATTEMPTS - 1)
+
+        self.assertEqual(self.deliver(), {DiscordNotification.STATUS_FAILED: 1})
+        notification.refresh_from_db()
+        self.assertEqual(notification.attempts, MAX_ATTEMPTS)
+
+
+class ApplicationDecisionSlotTests(TestCase):
+
+    def setUp(self):
+        branch = Branch.objects.create(name='Army', abbreviation='A')
+        unit = Unit.objects.create(name='Company', abbreviation='CO', branch=branch)
+        role = Role.objects.create(name='Rifleman', category='trooper')
+        self.slot = RecruitmentSlot.objects.create(unit=unit, role=role, career_track='enlisted', total_slots=2)
+        self.client.force_login(User.objects.create_superuser(discord_id='1', username='admin'))
+
+    def apply(self, discord_id, reserve=True):
+        applicant = User.objects.create_user(discord_id=discord_id, username=f'applicant{discord_id}')
+        if reserve:
+            RecruitmentSlot.objects.reserve(self.slot.id)
+        return Application.objects.create(
+            user=applicant, discord_id=discord_id, discord_username=applicant.username,
+            email='applicant@example.com', first_name='A', last_name='B', timezone='UTC', country='X',
+            career_track='enlisted', previous_experience='', reason_for_joining='',
+            selected_recruitment_slot=self.slot, status=ApplicationStatus.SUBMITTED
+        )
+
+    def decide(self, application, decision):
+        return self.client.post(f'/api/onboarding/applications/{application.id}/{decision}/')
+
+    def assertSlotCounts(self, filled, reserved):
+        self.slot.refresh_from_db()
+        self.assertEqual((self.slot.filled_slots, self.slot.reserved_slots), (filled, reserved))
+
+    def test_approve_fills_the_reserved_place(self):
+        application = self.apply('2')
+        self.assertSlotCounts(filled=0, reserved=1)
+
+        self.assertEqual(self.decide(application, 'approve').status_code, 200)
+
+        self.assertSlotCounts(filled=1, reserved=0)
+        application.refresh_from_db()
+        self.assertEqual(application.status, ApplicationStatus.APPROVED)
+
+    def test_approve_without_a_reservation_takes_an_open_place(self):
+        application = self.apply('2', reserve=False)
+
+        self.assertEqual(self.decide(application, 'approve').status_code, 200)
+
+        self.assertSlotCounts(filled=1, reserved=0)
+
+    def test_approve_with_no_open_place_changes_nothing(self):
+        RecruitmentSlot.objects.fill(self.slot.id, 2)
+        application = self.apply('2', reserve=False)
+
+        self.assertEqual(self.decide(application, 'approve').status_code, 400)
+
+        self.assertSlotCounts(filled=2, reserved=0)
+        application.refresh_from_db()
+        self.assertEqual(application.status, ApplicationStatus.SUBMITTED)
+
+    def test_reject_releases_the_reservation(self):
+        application = self.apply('2')
+
+        self.assertEqual(self.decide(application, 'reject').status_code, 200)
+
+        self.assertSlotCounts(filled=0, reserved=0)
+        application.refresh_from_db()
+        self.assertEqual(application.status, ApplicationStatus.REJECTED)
+
+
+class ApplicationNumberTests(TransactionTestCase):
+
+    THREADS = 10
+    CREATES_PER_THREAD = 30
+
+    def create_applications(self, count):
+        try:
+            for _ in range(count):
+                Application.objects.create(
+                    discord_id='1', discord_username='applicant', email='applicant@example.com',
+                    first_name='A', last_name='B', timezone='UTC', country='X', career_track='enlisted',
+                    previous_experience='', reason_for_joining=''
+                )
+        finally:
+            connection.close()
+
+    def test_parallel_creates_get_distinct_consecutive_numbers(self):
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            futures = [
+                executor.submit(self.create_applications, self.CREATES_PER_THREAD) for _ in range(self.THREADS)
+            ]
+            for future in futures:
+                future.result()
+
+        total = self.THREADS * self.CREATES_PER_THREAD
+        prefix = f"APP-{timezone.now():%Y%m%d}-"
+        numbers = sorted(Application.objects.values_list('application_number', flat=True))
+        self.assertEqual(numbers, [f'{prefix}{i:04d}' for i in range(1, total + 1)])
+        self.assertEqual(ApplicationNumberCounter.objects.get().last_number, total)
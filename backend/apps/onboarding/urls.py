@@ -8,7 +8,8 @@ router.register(r'applications', ApplicationViewSet, basename='application')
 
 urlpatterns = [
     # Application flow endpoints
-    path('applications/recruitment-data/', ApplicationViewSet.as_view({'get': 'recruitment_data'}),
+    path('applications/recruitment-data/',
+         ApplicationViewSet.as_view({'get': 'recruitment_data'}, authentication_classes=[]),
          name='recruitment-data'),
     path('applications/current/', ApplicationViewSet.as_view({'get': 'current'}), name='current-application'),
     path('applications/check-status/', ApplicationViewSet.as_view({'get': 'check_status'}),
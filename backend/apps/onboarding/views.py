@@ -3,17 +3,21 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from django.shortcuts import get_object_or_404
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
 from django.utils import timezone
 from django.db import transaction, models
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
-import requests
 import os
 
+from . import recruitment_cache
 from .models import (
     Application, ApplicationWaiverType, ApplicationWaiver,
     ApplicationProgress, ApplicationComment, ApplicationInterview,
-    UserOnboardingProgress, MentorAssignment, ApplicationStatus
+    UserOnboardingProgress, MentorAssignment, ApplicationStatus,
+    DiscordNotification
 )
 from .serializers import (
     ApplicationListSerializer, ApplicationDetailSerializer,
@@ -21,10 +25,12 @@ from .serializers import (
     ApplicationStatusSerializer, ApplicationWaiverTypeSerializer,
     ApplicationWaiverSerializer, ApplicationProgressSerializer,
     ApplicationCommentSerializer, ApplicationInterviewSerializer,
-    ApplicationRecruitmentDataSerializer, UserOnboardingProgressSerializer,
+    UserOnboardingProgressSerializer,
     MentorAssignmentSerializer
 )
 from apps.units.models import Unit, MOS, Branch, RecruitmentSlot, Role
+from apps.units.recruitment import get_branch_recruitment
+from apps.core.pagination import OptionalCursorPagination
 from apps.users.views import IsAdminOrReadOnly
 from django.contrib.auth import get_user_model
 
@@ -45,52 +51,8 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     search_fields = ['application_number', 'discord_username', 'email', 'first_name', 'last_name']
     ordering_fields = ['created_at', 'submitted_at', 'status']
     ordering = ['-created_at']
-
-    def _get_all_subordinate_units(self, unit):
-        """
-        Recursively get all subordinate units including the unit itself.
-        Returns a list of unit IDs.
-
-        This is used to aggregate recruitment slots from an entire unit hierarchy,
-        so when a user selects a Squadron, they see positions from the Squadron,
-        its Divisions, Flights, etc.
-
-        Args:
-            unit: The parent Unit object
-
-        Returns:
-            list: List of UUID strings representing all unit IDs in the hierarchy
-        """
-        unit_ids = [unit.id]
-
-        # Get all direct children
-        children = Unit.objects.filter(
-            parent_unit=unit,
-            is_active=True
-        ).values_list('id', flat=True)
-
-        unit_ids.extend(children)
-
-        # Recursively get all descendants
-        current_level = list(children)
-        max_depth = 10  # Prevent infinite loops
-        depth = 0
-
-        while current_level and depth < max_depth:
-            next_level = Unit.objects.filter(
-                parent_unit_id__in=current_level,
-                is_active=True
-            ).values_list('id', flat=True)
-
-            if next_level:
-                unit_ids.extend(next_level)
-                current_level = list(next_level)
-            else:
-                break
-
-            depth += 1
-
-        return unit_ids
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ('-created_at', '-id')
 
     def get_permissions(self):
         """
@@ -130,14 +92,25 @@ class ApplicationViewSet(viewsets.ModelViewSet):
 
         return queryset
 
-    @action(detail=False, methods=['get'], permission_classes=[permissions.AllowAny])
+    @action(detail=False, methods=['get'], permission_classes=[permissions.AllowAny],
+            authentication_classes=[])
     def recruitment_data(self, request):
         """
         Get initial recruitment data for the application form
         Step 6: Initial Breakdown
+
+        The payload is the same for everyone, so it is served from cache and
+        may be stored by browsers and shared caches. No authentication runs,
+        which keeps the session (and its Vary: Cookie) out of the response.
         """
-        serializer = ApplicationRecruitmentDataSerializer({})
-        return Response(serializer.data)
+        etag, payload = recruitment_cache.get_payload()
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(payload, content_type='application/json')
+        response['ETag'] = etag
+        patch_cache_control(response, public=True, max_age=recruitment_cache.RECRUITMENT_DATA_MAX_AGE)
+        return response
 
     @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def get_recruitment_slots(self, request):
@@ -165,61 +138,15 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # Get all subordinate units including the selected unit
-        all_unit_ids = self._get_all_subordinate_units(unit)
+        # Slots from the selected unit and all of its subordinate units
+        recruitment = get_branch_recruitment(unit.branch_id)
+        all_unit_ids = recruitment.subtree(unit.id)
 
-        print(f"Getting recruitment slots for unit {unit.name} and {len(all_unit_ids) - 1} subordinate units")
-
-        # Get open recruitment slots for all units in hierarchy and career track
-        slots = RecruitmentSlot.objects.filter(
-            unit_id__in=all_unit_ids,
-            career_track=career_track,
-            is_active=True
-        ).select_related('role', 'unit').filter(
-            # Only show slots with available positions
-            models.Q(total_slots__gt=models.F('filled_slots') + models.F('reserved_slots'))
-        )
-
-        data = []
-
-        for slot in slots:
-            # Build the slot data
-            slot_data = {
-                'id': slot.id,
-                'unit': {
-                    'id': str(slot.unit.id),
-                    'name': slot.unit.name,
-                    'abbreviation': slot.unit.abbreviation,
-                    'level': slot.unit.unit_level,
-                    'type': slot.unit.unit_type
-                },
-                'role': {
-                    'id': str(slot.role.id),
-                    'name': slot.role.name,
-                    'abbreviation': slot.role.abbreviation or slot.role.name[:4],
-                    'category': slot.role.category,
-                    'description': slot.role.description or '',
-                    'is_command_role': slot.role.is_command_role,
-                    'is_staff_role': slot.role.is_staff_role,
-                    'is_nco_role': slot.role.is_nco_role,
-                    'is_specialist_role': slot.role.is_specialist_role,
-                    'responsibilities': slot.role.responsibilities,
-                    'min_rank': slot.role.min_rank.abbreviation if slot.role.min_rank else None,
-                    'typical_rank': slot.role.typical_rank.abbreviation if slot.role.typical_rank else None,
-                },
-                'career_track': slot.career_track,
-                'available_slots': slot.available_slots,
-                'total_slots': slot.total_slots,
-                'filled_slots': slot.filled_slots,
-                'reserved_slots': slot.reserved_slots,
-                'notes': slot.notes,
-
-                # Display info
-                'display_name': f"{slot.role.name} - {slot.unit.abbreviation}",
-                'display_code': f"{slot.role.abbreviation or 'POS'}-{slot.unit.abbreviation}",
-            }
-
-            data.append(slot_data)
+        # Only show slots with available positions
+        data = [
+            slot_data for slot_data in recruitment.slots(unit.id, career_track)
+            if slot_data['available_slots'] > 0
+        ]
 
         # Sort by available slots (most available first) and then by role name
         data.sort(key=lambda x: (-x['available_slots'], x['role']['name']))
@@ -342,16 +269,17 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Get base query with prefetch
+        try:
+            recruitment = get_branch_recruitment(branch_id)
+        except ValueError:
+            return Response(
+                {'error': 'Invalid branch_id'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         units = Unit.objects.filter(
             branch_id=branch_id,
             is_active=True
-        ).prefetch_related(
-            models.Prefetch(
-                'recruitment_slots',
-                queryset=RecruitmentSlot.objects.filter(is_active=True),
-                to_attr='active_recruitment_slots'
-            )
         )
 
         # Filter by unit type - be flexible with field names
@@ -361,7 +289,6 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 models.Q(unit_type__in=['navy_squadron', 'ground_company', 'aviation_squadron']) |
                 models.Q(unit_level__in=['squadron', 'company'])
             )
-            print(f"Filtering for primary units (squadrons/companies), found {units.count()} units")
         elif unit_type == 'secondary' and parent_unit_id:
             # Get Division/Platoon level units under the selected primary unit
             units = units.filter(
@@ -370,46 +297,13 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 models.Q(unit_type__in=['navy_division', 'ground_platoon', 'aviation_division']) |
                 models.Q(unit_level__in=['division', 'platoon'])
             )
-            print(f"Filtering for secondary units under {parent_unit_id}, found {units.count()} units")
 
         data = []
         for unit in units:
-            # Get all subordinate units recursively
-            all_unit_ids = self._get_all_subordinate_units(unit)
-
-            # Calculate total available slots from this unit and all subordinates
-            total_available = RecruitmentSlot.objects.filter(
-                unit_id__in=all_unit_ids,
-                is_active=True
-            ).aggregate(
-                total=models.Sum(models.F('total_slots') - models.F('filled_slots') - models.F('reserved_slots'))
-            )['total'] or 0
-
-            # Get breakdown by career track
-            slots_by_track = RecruitmentSlot.objects.filter(
-                unit_id__in=all_unit_ids,
-                is_active=True
-            ).values('career_track').annotate(
-                available=models.Sum(models.F('total_slots') - models.F('filled_slots') - models.F('reserved_slots'))
-            )
-
-            track_breakdown = {
-                'enlisted': 0,
-                'warrant': 0,
-                'officer': 0
-            }
-            for slot_data in slots_by_track:
-                if slot_data['career_track'] in track_breakdown:
-                    track_breakdown[slot_data['career_track']] = slot_data['available'] or 0
-
-            # Get all unique roles available in this unit hierarchy
-            available_roles = Role.objects.filter(
-                recruitment_slots__unit_id__in=all_unit_ids,
-                recruitment_slots__is_active=True
-            ).distinct().values('id', 'name', 'category')
-
-            # Get number of subordinate units
-            subordinate_count = len(all_unit_ids) - 1  # Exclude the unit itself
+            # Availability across this unit and all of its subordinates
+            rollup = recruitment.rollup(unit.id)
+            total_available = rollup['available_slots']
+            available_roles = sorted(rollup['roles'].values(), key=lambda role: role['name'])
 
             # Only include units with available slots or open recruitment status
             if total_available > 0 or unit.recruitment_status in ['open', 'limited', None]:
@@ -422,46 +316,18 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                     'description': unit.description,
                     'emblem_url': unit.emblem_url,
                     'available_slots': total_available,
-                    'slots_by_track': track_breakdown,
+                    'slots_by_track': rollup['slots_by_track'],
                     'recruitment_status': unit.recruitment_status or 'open',
                     'recruitment_notes': getattr(unit, 'recruitment_notes', None),
                     'is_aviation_only': getattr(unit, 'is_aviation_only', False),
-                    'subordinate_units_count': subordinate_count,
-                    'total_units_included': len(all_unit_ids),
+                    'subordinate_units_count': rollup['units_included'] - 1,
+                    'total_units_included': rollup['units_included'],
                     'available_roles_count': len(available_roles),
-                    'available_roles': list(available_roles)[:10]  # Show first 10 roles
+                    'available_roles': available_roles[:10]  # Show first 10 roles
                 })
 
         return Response(data)
 
-    def _get_all_subordinate_units(self, unit):
-        """
-        Get all subordinate units recursively, including the unit itself
-        Returns a list of unit IDs
-        """
-        unit_ids = [unit.id]
-
-        # Get all children
-        children = Unit.objects.filter(
-            parent_unit=unit,
-            is_active=True
-        ).values_list('id', flat=True)
-
-        unit_ids.extend(children)
-
-        # Recursively get all descendants
-        current_level = list(children)
-        while current_level:
-            next_level = Unit.objects.filter(
-                parent_unit_id__in=current_level,
-                is_active=True
-            ).values_list('id', flat=True)
-
-            unit_ids.extend(next_level)
-            current_level = list(next_level)
-
-        return unit_ids
-
     # backend/apps/onboarding/views.py
     # Replace the existing get_mos_options action with this updated version
 
@@ -491,96 +357,63 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # Get all subordinate units including the selected unit
-        all_unit_ids = self._get_all_subordinate_units(unit)
-
-        print(f"Getting MOS options for unit {unit.name} and {len(all_unit_ids) - 1} subordinate units")
-
-        # Get open recruitment slots for all units in hierarchy and career track
-        slots_query = RecruitmentSlot.objects.filter(
-            unit_id__in=all_unit_ids,
-            career_track=career_track,
-            is_active=True
-        ).select_related('role', 'unit')
+        # Open slots from the selected unit and all of its subordinate units
+        recruitment = get_branch_recruitment(unit.branch_id)
+        all_unit_ids = recruitment.subtree(unit.id)
 
         # Create a dictionary to track MOS slots
         mos_slots = {}
         unit_breakdown = {}  # Track which units have which positions
 
-        # Process each recruitment slot
-        for slot in slots_query:
-            # Only process if slot has available positions
-            if slot.available_slots > 0 and slot.role:
-                # Try to get MOS from role - adjust this based on your Role model
-                role_mos = None
-
-                # Option 1: Direct MOS field
-                if hasattr(slot.role, 'mos') and slot.role.mos:
-                    role_mos = slot.role.mos
-                # Option 2: Required MOS field
-                elif hasattr(slot.role, 'required_mos') and slot.role.required_mos:
-                    role_mos = slot.role.required_mos
-                # Option 3: Use role itself as a pseudo-MOS (if MOS model isn't fully integrated)
-                else:
-                    # Create a pseudo-MOS entry based on the role
-                    role_mos = type('obj', (object,), {
-                        'id': f'role_{slot.role.id}',
-                        'code': slot.role.abbreviation or f'R{slot.role.id[:8]}',
-                        'title': slot.role.name,
-                        'category': slot.role.category,
-                        'description': slot.role.description or '',
-                        'ait_weeks': 0,
-                        'physical_demand_rating': ''
-                    })()
-
-                if role_mos:
-                    mos_id = str(role_mos.id)
-
-                    # Initialize MOS entry if not exists
-                    if mos_id not in mos_slots:
-                        mos_slots[mos_id] = {
-                            'id': role_mos.id,
-                            'code': getattr(role_mos, 'code', ''),
-                            'title': getattr(role_mos, 'title', slot.role.name),
-                            'category': getattr(role_mos, 'category', slot.role.category),
-                            'description': getattr(role_mos, 'description', slot.role.description or ''),
-                            'ait_weeks': getattr(role_mos, 'ait_weeks', 0),
-                            'physical_demand_rating': getattr(role_mos, 'physical_demand_rating', ''),
-                            'available_slots': 0,
-                            'roles': [],
-                            'units': [],
-                            'is_command_role': slot.role.is_command_role,
-                            'is_staff_role': slot.role.is_staff_role,
-                            'is_nco_role': slot.role.is_nco_role,
-                            'is_specialist_role': slot.role.is_specialist_role
-                        }
-
-                    # Add to available slots count
-                    mos_slots[mos_id]['available_slots'] += slot.available_slots
-
-                    # Add role info with unit context
-                    role_info = f"{slot.role.name} in {slot.unit.abbreviation} ({slot.available_slots} slots)"
-                    if role_info not in mos_slots[mos_id]['roles']:
-                        mos_slots[mos_id]['roles'].append(role_info)
-
-                    # Track which units have this position
-                    unit_info = {
-                        'id': str(slot.unit.id),
-                        'name': slot.unit.name,
-                        'abbreviation': slot.unit.abbreviation,
-                        'level': slot.unit.unit_level,
-                        'available_slots': slot.available_slots
-                    }
+        # Roles carry no MOS of their own, so each role stands in as a pseudo-MOS
+        for slot in recruitment.slots(unit.id, career_track):
+            available = slot['available_slots']
+            if available <= 0:
+                continue
+
+            role = slot['role']
+            slot_unit = slot['unit']
+            mos_id = f"role_{role['id']}"
+
+            # Initialize MOS entry if not exists
+            if mos_id not in mos_slots:
+                mos_slots[mos_id] = {
+                    'id': mos_id,
+                    'code': role['abbreviation'],
+                    'title': role['name'],
+                    'category': role['category'],
+                    'description': role['description'],
+                    'ait_weeks': 0,
+                    'physical_demand_rating': '',
+                    'available_slots': 0,
+                    'roles': [],
+                    'units': [],
+                    'is_command_role': role['is_command_role'],
+                    'is_staff_role': role['is_staff_role'],
+                    'is_nco_role': role['is_nco_role'],
+                    'is_specialist_role': role['is_specialist_role']
+                }
 
-                    # Check if this unit is already in the list
-                    unit_already_added = any(u['id'] == unit_info['id'] for u in mos_slots[mos_id]['units'])
-                    if not unit_already_added:
-                        mos_slots[mos_id]['units'].append(unit_info)
+            # Add to available slots count
+            mos_slots[mos_id]['available_slots'] += available
+
+            # Add role info with unit context
+            role_info = f"{role['name']} in {slot_unit['abbreviation']} ({available} slots)"
+            if role_info not in mos_slots[mos_id]['roles']:
+                mos_slots[mos_id]['roles'].append(role_info)
+
+            # Track which units have this position
+            if not any(u['id'] == slot_unit['id'] for u in mos_slots[mos_id]['units']):
+                mos_slots[mos_id]['units'].append({
+                    'id': slot_unit['id'],
+                    'name': slot_unit['name'],
+                    'abbreviation': slot_unit['abbreviation'],
+                    'level': slot_unit['level'],
+                    'available_slots': available
+                })
 
-                    # Track unit breakdown
-                    if slot.unit.abbreviation not in unit_breakdown:
-                        unit_breakdown[slot.unit.abbreviation] = 0
-                    unit_breakdown[slot.unit.abbreviation] += slot.available_slots
+            # Track unit breakdown
+            unit_breakdown[slot_unit['abbreviation']] = unit_breakdown.get(slot_unit['abbreviation'], 0) + available
 
         # Convert to list and sort by available slots (most available first)
         data = list(mos_slots.values())
@@ -788,6 +621,14 @@ class ApplicationViewSet(viewsets.ModelViewSet):
 
         # Submit the application
         with transaction.atomic():
+            # Reserve the slot, unless it filled up since it was selected
+            if application.selected_recruitment_slot_id:
+                if RecruitmentSlot.objects.reserve(application.selected_recruitment_slot_id) is None:
+                    return Response(
+                        {'errors': ['The selected position is no longer available']},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+
             application.status = ApplicationStatus.SUBMITTED
             application.submitted_at = timezone.now()
             application.save()
@@ -796,12 +637,6 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             application.progress.current_step = 11
             application.progress.save()
 
-            # Reserve the slot
-            if application.selected_recruitment_slot:
-                slot = application.selected_recruitment_slot
-                slot.reserved_slots = models.F('reserved_slots') + 1
-                slot.save(update_fields=['reserved_slots'])
-
             # Send Discord notification
             self.send_discord_notification(application)
 
@@ -856,18 +691,19 @@ class ApplicationViewSet(viewsets.ModelViewSet):
 
         serializer = ApplicationInterviewSerializer(data=request.data)
         if serializer.is_valid():
-            interview = serializer.save(
-                application=application,
-                scheduled_by=request.user
-            )
+            with transaction.atomic():
+                interview = serializer.save(
+                    application=application,
+                    scheduled_by=request.user
+                )
 
-            # Update application status
-            application.status = ApplicationStatus.INTERVIEW_SCHEDULED
-            application.interview_scheduled_at = interview.scheduled_at
-            application.save()
+                # Update application status
+                application.status = ApplicationStatus.INTERVIEW_SCHEDULED
+                application.interview_scheduled_at = interview.scheduled_at
+                application.save()
 
-            # Send Discord notification about interview
-            self.send_interview_notification(application, interview)
+                # Send Discord notification about interview
+                self.send_interview_notification(application, interview)
 
             return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -881,19 +717,22 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         application = self.get_object()
 
         with transaction.atomic():
+            # Update recruitment slot - convert reserved to filled, or take an
+            # open place if none was reserved
+            slot_id = application.selected_recruitment_slot_id
+            if slot_id and (RecruitmentSlot.objects.fill(slot_id, from_reserved=True) is None
+                            and RecruitmentSlot.objects.fill(slot_id) is None):
+                return Response(
+                    {'error': 'The selected position has no open slots'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
             application.status = ApplicationStatus.APPROVED
             application.decision_at = timezone.now()
             application.reviewer = request.user
             application.reviewer_notes = request.data.get('notes', '')
             application.save()
 
-            # Update recruitment slot - convert reserved to filled
-            if application.selected_recruitment_slot:
-                slot = application.selected_recruitment_slot
-                slot.filled_slots = models.F('filled_slots') + 1
-                slot.reserved_slots = models.F('reserved_slots') - 1
-                slot.save(update_fields=['filled_slots', 'reserved_slots'])
-
             # Create onboarding progress
             UserOnboardingProgress.objects.get_or_create(
                 user=application.user,
@@ -950,10 +789,8 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             application.save()
 
             # Release the reserved slot
-            if application.selected_recruitment_slot:
-                slot = application.selected_recruitment_slot
-                slot.reserved_slots = models.F('reserved_slots') - 1
-                slot.save(update_fields=['reserved_slots'])
+            if application.selected_recruitment_slot_id:
+                RecruitmentSlot.objects.release(application.selected_recruitment_slot_id)
 
             # Send rejection notification
             self.send_rejection_notification(application)
@@ -989,10 +826,8 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             application.save()
 
             # Release the reserved slot if application was submitted
-            if application.submitted_at and application.selected_recruitment_slot:
-                slot = application.selected_recruitment_slot
-                slot.reserved_slots = models.F('reserved_slots') - 1
-                slot.save(update_fields=['reserved_slots'])
+            if application.submitted_at and application.selected_recruitment_slot_id:
+                RecruitmentSlot.objects.release(application.selected_recruitment_slot_id)
 
         return Response({
             'success': True,
@@ -1056,199 +891,183 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         """
         Send Discord webhook notification for new application
         """
-        webhook_url = os.environ.get('DISCORD_APPLICATION_WEBHOOK')
-        if not webhook_url:
+        if not os.environ.get('DISCORD_APPLICATION_WEBHOOK'):
             return
 
-        try:
-            # Get role information from recruitment slot
-            role_info = "N/A"
-            unit_info = "N/A"
-            if application.selected_recruitment_slot:
-                slot = application.selected_recruitment_slot
-                role_info = f"{slot.role.name} ({slot.role.abbreviation})"
-                unit_info = f"{slot.unit.name} ({slot.unit.abbreviation})"
-
-            embed = {
-                "title": f"New Application Received",
-                "description": f"Application #{application.application_number}",
-                "color": 3447003,  # Blue
+        # Get role information from recruitment slot
+        role_info = "N/A"
+        unit_info = "N/A"
+        if application.selected_recruitment_slot:
+            slot = application.selected_recruitment_slot
+            role_info = f"{slot.role.name} ({slot.role.abbreviation})"
+            unit_info = f"{slot.unit.name} ({slot.unit.abbreviation})"
+
+        embed = {
+            "title": f"New Application Received",
+            "description": f"Application #{application.application_number}",
+            "color": 3447003,  # Blue
+            "fields": [
+                {
+                    "name": "Applicant",
+                    "value": f"{application.discord_username}",
+                    "inline": True
+                },
+                {
+                    "name": "Branch",
+                    "value": application.branch.name if application.branch else "N/A",
+                    "inline": True
+                },
+                {
+                    "name": "Track",
+                    "value": application.get_career_track_display(),
+                    "inline": True
+                },
+                {
+                    "name": "Primary Unit",
+                    "value": application.primary_unit.name if application.primary_unit else "N/A",
+                    "inline": True
+                },
+                {
+                    "name": "Applied Position",
+                    "value": role_info,
+                    "inline": True
+                },
+                {
+                    "name": "Position Unit",
+                    "value": unit_info,
+                    "inline": True
+                }
+            ],
+            "timestamp": timezone.now().isoformat()
+        }
+
+        # Send to applicant
+        user_message = {
+            "content": f"<@{application.discord_id}>",
+            "embeds": [{
+                **embed,
+                "title": "Application Received",
+                "description": f"Thank you for applying! Your application #{application.application_number} has been received and is under review.",
+                "footer": {
+                    "text": "You will be contacted soon regarding the next steps."
+                }
+            }]
+        }
+
+        # The worker marks discord_notification_sent once this is delivered
+        DiscordNotification.objects.enqueue(
+            'application', user_message, application=application, event='application_submitted'
+        )
+
+        # Send to admin channel
+        if os.environ.get('DISCORD_ADMIN_WEBHOOK'):
+            admin_message = {
+                "embeds": [embed]
+            }
+            DiscordNotification.objects.enqueue(
+                'admin', admin_message, application=application, event='application_submitted'
+            )
+
+    def send_interview_notification(self, application, interview):
+        """Send Discord notification for interview scheduling"""
+        if not os.environ.get('DISCORD_APPLICATION_WEBHOOK'):
+            return
+
+        message = {
+            "content": f"<@{application.discord_id}>",
+            "embeds": [{
+                "title": "Interview Scheduled",
+                "description": f"Your interview for application #{application.application_number} has been scheduled.",
+                "color": 15844367,  # Gold
                 "fields": [
                     {
-                        "name": "Applicant",
-                        "value": f"{application.discord_username}",
-                        "inline": True
+                        "name": "Date & Time",
+                        "value": interview.scheduled_at.strftime("%B %d, %Y at %H:%M UTC"),
+                        "inline": False
                     },
                     {
-                        "name": "Branch",
-                        "value": application.branch.name if application.branch else "N/A",
+                        "name": "Type",
+                        "value": interview.get_interview_type_display(),
                         "inline": True
                     },
                     {
-                        "name": "Track",
-                        "value": application.get_career_track_display(),
-                        "inline": True
-                    },
-                    {
-                        "name": "Primary Unit",
-                        "value": application.primary_unit.name if application.primary_unit else "N/A",
-                        "inline": True
-                    },
-                    {
-                        "name": "Applied Position",
-                        "value": role_info,
-                        "inline": True
-                    },
-                    {
-                        "name": "Position Unit",
-                        "value": unit_info,
+                        "name": "Interviewer",
+                        "value": interview.interviewer.username if interview.interviewer else "TBD",
                         "inline": True
                     }
                 ],
-                "timestamp": timezone.now().isoformat()
-            }
-
-            # Send to applicant
-            user_message = {
-                "content": f"<@{application.discord_id}>",
-                "embeds": [{
-                    **embed,
-                    "title": "Application Received",
-                    "description": f"Thank you for applying! Your application #{application.application_number} has been received and is under review.",
-                    "footer": {
-                        "text": "You will be contacted soon regarding the next steps."
-                    }
-                }]
-            }
-
-            requests.post(webhook_url, json=user_message)
-
-            # Send to admin channel
-            admin_webhook = os.environ.get('DISCORD_ADMIN_WEBHOOK')
-            if admin_webhook:
-                admin_message = {
-                    "embeds": [embed]
+                "footer": {
+                    "text": "Please be available on Discord at the scheduled time."
                 }
-                requests.post(admin_webhook, json=admin_message)
-
-            # Mark notification as sent
-            application.discord_notification_sent = True
-            application.discord_notification_sent_at = timezone.now()
-            application.save()
-
-        except Exception as e:
-            print(f"Failed to send Discord notification: {e}")
-
-
-    def send_interview_notification(self, application, interview):
-        """Send Discord notification for interview scheduling"""
-        webhook_url = os.environ.get('DISCORD_APPLICATION_WEBHOOK')
-        if not webhook_url:
-            return
-
-        try:
-            message = {
-                "content": f"<@{application.discord_id}>",
-                "embeds": [{
-                    "title": "Interview Scheduled",
-                    "description": f"Your interview for application #{application.application_number} has been scheduled.",
-                    "color": 15844367,  # Gold
-                    "fields": [
-                        {
-                            "name": "Date & Time",
-                            "value": interview.scheduled_at.strftime("%B %d, %Y at %H:%M UTC"),
-                            "inline": False
-                        },
-                        {
-                            "name": "Type",
-                            "value": interview.get_interview_type_display(),
-                            "inline": True
-                        },
-                        {
-                            "name": "Interviewer",
-                            "value": interview.interviewer.username if interview.interviewer else "TBD",
-                            "inline": True
-                        }
-                    ],
-                    "footer": {
-                        "text": "Please be available on Discord at the scheduled time."
-                    }
-                }]
-            }
-
-            requests.post(webhook_url, json=message)
+            }]
+        }
 
-        except Exception as e:
-            print(f"Failed to send interview notification: {e}")
+        DiscordNotification.objects.enqueue(
+            'application', message, application=application, event='interview_scheduled'
+        )
 
     def send_approval_notification(self, application):
         """Send Discord notification for application approval"""
-        webhook_url = os.environ.get('DISCORD_APPLICATION_WEBHOOK')
-        if not webhook_url:
+        if not os.environ.get('DISCORD_APPLICATION_WEBHOOK'):
             return
 
-        try:
-            message = {
-                "content": f"<@{application.discord_id}>",
-                "embeds": [{
-                    "title": "Application Approved!",
-                    "description": f"Congratulations! Your application #{application.application_number} has been approved.",
-                    "color": 5763719,  # Green
-                    "fields": [
-                        {
-                            "name": "Next Steps",
-                            "value": "1. Discord roles will be assigned shortly\n2. Complete orientation\n3. Begin basic training",
-                            "inline": False
-                        },
-                        {
-                            "name": "Assigned Unit",
-                            "value": application.primary_unit.name if application.primary_unit else "TBD",
-                            "inline": True
-                        },
-                        {
-                            "name": "Career Track",
-                            "value": application.get_career_track_display(),
-                            "inline": True
-                        }
-                    ],
-                    "footer": {
-                        "text": "Welcome to the unit!"
+        message = {
+            "content": f"<@{application.discord_id}>",
+            "embeds": [{
+                "title": "Application Approved!",
+                "description": f"Congratulations! Your application #{application.application_number} has been approved.",
+                "color": 5763719,  # Green
+                "fields": [
+                    {
+                        "name": "Next Steps",
+                        "value": "1. Discord roles will be assigned shortly\n2. Complete orientation\n3. Begin basic training",
+                        "inline": False
+                    },
+                    {
+                        "name": "Assigned Unit",
+                        "value": application.primary_unit.name if application.primary_unit else "TBD",
+                        "inline": True
+                    },
+                    {
+                        "name": "Career Track",
+                        "value": application.get_career_track_display(),
+                        "inline": True
                     }
-                }]
-            }
-
-            requests.post(webhook_url, json=message)
+                ],
+                "footer": {
+                    "text": "Welcome to the unit!"
+                }
+            }]
+        }
 
-        except Exception as e:
-            print(f"Failed to send approval notification: {e}")
+        DiscordNotification.objects.enqueue(
+            'application', message, application=application, event='application_approved'
+        )
 
     def send_rejection_notification(self, application):
         """Send Discord notification for application rejection"""
-        webhook_url = os.environ.get('DISCORD_APPLICATION_WEBHOOK')
-        if not webhook_url:
+        if not os.environ.get('DISCORD_APPLICATION_WEBHOOK'):
             return
 
-        try:
-            message = {
-                "content": f"<@{application.discord_id}>",
-                "embeds": [{
-                    "title": "Application Status Update",
-                    "description": f"Thank you for your interest. After careful review, we are unable to approve application #{application.application_number} at this time.",
-                    "color": 15548997,  # Red
-                    "fields": [
-                        {
-                            "name": "Next Steps",
-                            "value": "You may reapply after 30 days. We encourage you to gain more experience and try again.",
-                            "inline": False
-                        }
-                    ],
-                    "footer": {
-                        "text": "Thank you for your interest in our unit."
+        message = {
+            "content": f"<@{application.discord_id}>",
+            "embeds": [{
+                "title": "Application Status Update",
+                "description": f"Thank you for your interest. After careful review, we are unable to approve application #{application.application_number} at this time.",
+                "color": 15548997,  # Red
+                "fields": [
+                    {
+                        "name": "Next Steps",
+                        "value": "You may reapply after 30 days. We encourage you to gain more experience and try again.",
+                        "inline": False
                     }
-                }]
-            }
-
-            requests.post(webhook_url, json=message)
+                ],
+                "footer": {
+                    "text": "Thank you for your interest in our unit."
+                }
+            }]
+        }
 
-        except Exception as e:
-            print(f"Failed to send rejection notification: {e}")
\ No newline at end of file
+        DiscordNotification.objects.enqueue(
+            'application', message, application=application, event='application_rejected'
+        )
\ No newline at end of file
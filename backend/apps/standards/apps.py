@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class StandardsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.standards'
+
+    def ready(self):
+        # Register model signal handlers
+        from . import signals  # noqa: F401
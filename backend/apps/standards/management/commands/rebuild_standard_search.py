@@ -0,0 +1,14 @@
+"""
+Recompute the stored full-text search vector of every standard
+"""
+from django.core.management.base import BaseCommand
+from apps.standards.models import Standard
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the standards full-text search vectors (run once after deploying, or to repair them)'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding standard search vectors...')
+        count = Standard.objects.all().update_search_vector()
+        self.stdout.write(self.style.SUCCESS(f'Successfully rebuilt search vectors for {count} standards'))
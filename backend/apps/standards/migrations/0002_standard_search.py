@@ -0,0 +1,38 @@
+# Generated by Django 5.2 on 2026-10-17 03:35
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import TrigramExtension
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def backfill_search_vectors(apps, schema_editor):
+    """Index existing standards; update_search_vector() lives on the real queryset, which historical models do not carry"""
+    from apps.standards.models import Standard
+
+    Standard.objects.all().update_search_vector()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('standards', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='standard',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='standard',
+            index=GinIndex(fields=['search_vector'], name='standard_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='standard',
+            index=GinIndex(fields=['document_number'], name='standard_doc_number_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
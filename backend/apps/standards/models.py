@@ -1,5 +1,17 @@
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchHeadline, SearchRank, SearchVector, SearchVectorField, TrigramSimilarity
+)
 from django.db import models
+from django.db.models.functions import Cast, Greatest
 from apps.core.models import BaseModel
+from apps.core.search import prefix_query
+
+# Text search configuration used both for the stored vector and for queries
+STANDARD_SEARCH_CONFIG = getattr(settings, 'STANDARD_SEARCH_CONFIG', 'english')
+# Document numbers at least this similar to the query match even without a text hit
+STANDARD_SEARCH_TRIGRAM_THRESHOLD = getattr(settings, 'STANDARD_SEARCH_TRIGRAM_THRESHOLD', 0.3)
 
 
 class StandardGroup(BaseModel):
@@ -32,6 +44,50 @@ class StandardSubGroup(BaseModel):
         return f"{self.standard_group.name} - {self.name}"
 
 
+class StandardQuerySet(models.QuerySet):
+    def update_search_vector(self):
+        """
+        Recompute search_vector in place. Weights: title A, document number
+        and tags B, summary C, content D.
+        """
+        config = STANDARD_SEARCH_CONFIG
+        return self.update(search_vector=(
+            SearchVector('title', weight='A', config=config)
+            + SearchVector('document_number', weight='B', config=config)
+            + SearchVector(Cast('tags', models.TextField()), weight='B', config=config)
+            + SearchVector('summary', weight='C', config=config)
+            + SearchVector('content', weight='D', config=config)
+        ))
+
+    def search(self, text):
+        """
+        Standards matching text, best first, annotated with rank and a
+        highlighted content snippet. Every word is matched as a prefix, and
+        document numbers also match by trigram similarity so that near misses
+        like "SOP CC 1" still find SOP-CC-001.
+        """
+        query = prefix_query(text, STANDARD_SEARCH_CONFIG)
+        if query is None:
+            return self.none()
+        # The match may come from the title alone, so highlight any of the words in the content
+        any_term = prefix_query(text, STANDARD_SEARCH_CONFIG, operator='|')
+
+        return self.annotate(
+            text_rank=SearchRank(models.F('search_vector'), query),
+            similarity=TrigramSimilarity('document_number', text),
+        ).filter(
+            models.Q(search_vector=query) |
+            models.Q(similarity__gt=STANDARD_SEARCH_TRIGRAM_THRESHOLD)
+        ).annotate(
+            rank=Greatest('text_rank', 'similarity'),
+            snippet=SearchHeadline(
+                'content', any_term, config=STANDARD_SEARCH_CONFIG,
+                start_sel='<mark>', stop_sel='</mark>',
+                max_words=35, min_words=15, max_fragments=2
+            ),
+        ).order_by('-rank', 'document_number', 'title')
+
+
 class Standard(BaseModel):
     title = models.CharField(max_length=200)
     document_number = models.CharField(max_length=50, blank=True, null=True)
@@ -70,6 +126,18 @@ class Standard(BaseModel):
     )
     tags = models.JSONField(blank=True, null=True)
     is_required = models.BooleanField(default=False)
+    # Maintained by the post_save signal and rebuild_standard_search
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = StandardQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='standard_search_vector_idx'),
+            # Needs the pg_trgm extension
+            GinIndex(fields=['document_number'], name='standard_doc_number_trgm_idx',
+                     opclasses=['gin_trgm_ops']),
+        ]
 
     def __str__(self):
         return f"{self.document_number}: {self.title}" if self.document_number else self.title
\ No newline at end of file
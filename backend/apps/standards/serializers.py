@@ -48,6 +48,14 @@ class StandardListSerializer(serializers.ModelSerializer):
                   'effective_date', 'difficulty_level', 'is_required']
 
 
+class StandardSearchResultSerializer(StandardListSerializer):
+    rank = serializers.FloatField(read_only=True)
+    snippet = serializers.CharField(read_only=True)
+
+    class Meta(StandardListSerializer.Meta):
+        fields = StandardListSerializer.Meta.fields + ['rank', 'snippet']
+
+
 class StandardDetailSerializer(serializers.ModelSerializer):
     subgroup_name = serializers.ReadOnlyField(source='standard_sub_group.name')
     group_name = serializers.ReadOnlyField(source='standard_sub_group.standard_group.name')
@@ -56,7 +64,7 @@ class StandardDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Standard
-        fields = '__all__'
+        exclude = ['search_vector']
 
 
 class StandardApproveSerializer(serializers.Serializer):
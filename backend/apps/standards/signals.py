@@ -0,0 +1,15 @@
+"""
+Signal handlers that keep the stored standard search vector current
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Standard
+
+
+@receiver(post_save, sender=Standard)
+def update_standard_search_vector(sender, instance, raw=False, **kwargs):
+    """Keep the stored search vector in step with the text it is built from"""
+    if raw:
+        return
+    Standard.objects.filter(pk=instance.pk).update_search_vector()
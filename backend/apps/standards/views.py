@@ -8,10 +8,12 @@ from .models import StandardGroup, StandardSubGroup, Standard
 from .serializers import (
     StandardGroupListSerializer, StandardGroupDetailSerializer,
     StandardSubGroupSerializer, StandardListSerializer, StandardDetailSerializer,
-    StandardApproveSerializer
+    StandardApproveSerializer, StandardSearchResultSerializer
 )
 from apps.users.views import IsAdminOrReadOnly
-from django.db import models
+from django.conf import settings
+
+STANDARD_SEARCH_LIMIT = getattr(settings, 'STANDARD_SEARCH_LIMIT', 50)
 
 
 class StandardGroupViewSet(viewsets.ModelViewSet):
@@ -70,6 +72,8 @@ class StandardViewSet(viewsets.ModelViewSet):
     ordering_fields = ['document_number', 'title', 'effective_date', 'created_at']
     ordering = ['document_number', 'title']
     permission_classes = [IsAdminOrReadOnly]
+    # Queries per request, authentication included (see apps.core.instrumentation)
+    query_budgets = {'search': 3}
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -126,15 +130,11 @@ class StandardViewSet(viewsets.ModelViewSet):
         if not query:
             return Response({"detail": "Search query is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-        standards = Standard.objects.filter(
-            models.Q(title__icontains=query) |
-            models.Q(document_number__icontains=query) |
-            models.Q(content__icontains=query) |
-            models.Q(summary__icontains=query) |
-            models.Q(tags__contains=[query])
-        )
+        standards = Standard.objects.search(query).select_related(
+            'standard_sub_group__standard_group', 'author'
+        )[:STANDARD_SEARCH_LIMIT]
 
-        serializer = StandardListSerializer(standards, many=True)
+        serializer = StandardSearchResultSerializer(standards, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
@@ -0,0 +1,11 @@
+# backend/apps/units/apps.py
+from django.apps import AppConfig
+
+
+class UnitsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.units'
+
+    def ready(self):
+        # Register model signal handlers
+        from . import signals  # noqa: F401
@@ -0,0 +1,33 @@
+# backend/apps/units/management/commands/evaluate_promotions.py
+"""
+Re-evaluate promotion eligibility for all members in bulk
+"""
+from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+from apps.units.promotion_engine import evaluate_promotions
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Evaluates next-rank promotion requirements for every active member'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--branch',
+            type=str,
+            help='Only evaluate members of this branch (ID)'
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(is_active=True)
+        if options['branch']:
+            users = users.filter(branch_id=options['branch'])
+
+        self.stdout.write('Evaluating promotion eligibility...')
+        progress = evaluate_promotions(users)
+        eligible = sum(1 for row in progress if row.overall_eligible)
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully evaluated {len(progress)} members ({eligible} eligible)')
+        )
@@ -0,0 +1,22 @@
+# backend/apps/units/management/commands/rebuild_unit_tree.py
+"""
+Rebuild the unit ancestor/descendant index from Unit.parent_unit
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.units.models import Unit, UnitClosure
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the unit hierarchy index (run once after deploying, or to repair it)'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.stdout.write('Rebuilding unit hierarchy index...')
+            link_count = UnitClosure.objects.rebuild()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully indexed {Unit.objects.count()} units ({link_count} ancestor links)'
+            )
+        )
@@ -0,0 +1,18 @@
+# backend/apps/units/management/commands/recount_unit_strength.py
+"""
+Recount the stored unit strength figures from positions and assignments
+"""
+from django.core.management.base import BaseCommand
+from apps.units.models import UnitStrength
+
+
+class Command(BaseCommand):
+    help = 'Recounts stored unit strength figures (run once after deploying, or to repair them)'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Recounting unit strength...')
+        unit_count = UnitStrength.objects.rebuild()
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully recounted strength for {unit_count} units')
+        )
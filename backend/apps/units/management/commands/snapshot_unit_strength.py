@@ -0,0 +1,20 @@
+# backend/apps/units/management/commands/snapshot_unit_strength.py
+"""
+Record today's strength figures for every unit (intended to run nightly)
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.units.models import UnitStrengthReport
+
+
+class Command(BaseCommand):
+    help = 'Writes one UnitStrengthReport row per unit for today (re-running overwrites today)'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.stdout.write('Recording unit strength...')
+            report_count = UnitStrengthReport.objects.snapshot()
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully recorded strength for {report_count} units')
+        )
@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-17 01:18
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def build_unit_closure(apps, schema_editor):
+    """Index the existing units; the same walk as UnitClosure.objects.rebuild()"""
+    Unit = apps.get_model('units', 'Unit')
+    UnitClosure = apps.get_model('units', 'UnitClosure')
+
+    parents = dict(Unit.objects.values_list('id', 'parent_unit_id'))
+    links = []
+    for unit_id in parents:
+        ancestor_id = unit_id
+        depth = 0
+        seen = set()
+        while ancestor_id and ancestor_id not in seen:
+            seen.add(ancestor_id)
+            links.append(UnitClosure(ancestor_id=ancestor_id, descendant_id=unit_id, depth=depth))
+            ancestor_id = parents.get(ancestor_id)
+            depth += 1
+    UnitClosure.objects.bulk_create(links, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('units', '0003_unithierarchyview_unithierarchynode'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnitClosure',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('depth', models.PositiveIntegerField(default=0)),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='units.unit')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='units.unit')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['ancestor', 'depth'], name='units_unitc_ancesto_7f224e_idx'), models.Index(fields=['descendant', 'depth'], name='units_unitc_descend_06b645_idx')],
+                'unique_together': {('ancestor', 'descendant')},
+            },
+        ),
+        migrations.RunPython(build_unit_closure, migrations.RunPython.noop),
+    ]
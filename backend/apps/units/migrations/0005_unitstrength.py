@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-17 02:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def rebuild_unit_strength(apps, schema_editor):
+    """Count every existing unit; rebuild() lives on the real manager, which historical models do not carry"""
+    from apps.units.models import UnitStrength
+
+    UnitStrength.objects.rebuild()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('units', '0004_unitclosure'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnitStrength',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('total_positions', models.PositiveIntegerField(default=0)),
+                ('filled_positions', models.PositiveIntegerField(default=0)),
+                ('vacant_positions', models.PositiveIntegerField(default=0)),
+                ('active_personnel', models.PositiveIntegerField(default=0)),
+                ('subtree_total_positions', models.PositiveIntegerField(default=0)),
+                ('subtree_filled_positions', models.PositiveIntegerField(default=0)),
+                ('subtree_vacant_positions', models.PositiveIntegerField(default=0)),
+                ('subtree_active_personnel', models.PositiveIntegerField(default=0)),
+                ('unit', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='strength', to='units.unit')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(rebuild_unit_strength, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,532 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:12
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0001_initial'),
+        ('units', '0005_unitstrength'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PromotionRequirementType',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=100)),
+                ('code', models.CharField(max_length=50, unique=True)),
+                ('category', models.CharField(choices=[('time_based', 'Time-Based Requirements'), ('position_based', 'Position-Based Requirements'), ('qualification_based', 'Qualification-Based Requirements'), ('deployment_based', 'Deployment-Based Requirements'), ('performance_based', 'Performance-Based Requirements'), ('administrative', 'Administrative Requirements')], max_length=30)),
+                ('evaluation_type', models.CharField(choices=[('time_in_service', 'Total Time in Service'), ('time_in_grade', 'Time in Current Grade'), ('time_in_unit', 'Time in Current Unit'), ('time_in_unit_type', 'Time in Unit Type'), ('time_in_position', 'Time in Specific Position'), ('time_in_position_type', 'Time in Position Type'), ('certification_required', 'Required Certification'), ('certifications_count', 'Number of Certifications'), ('deployments_count', 'Number of Deployments'), ('deployment_time', 'Total Deployment Time'), ('deployment_in_position', 'Deployments in Specific Position'), ('event_participation', 'Event Participation Count'), ('leadership_time', 'Time in Leadership Position'), ('command_time', 'Time in Command Position'), ('performance_rating', 'Average Performance Rating'), ('commendations_count', 'Number of Commendations'), ('mos_qualification', 'MOS Qualification Level'), ('custom_evaluation', 'Custom Evaluation Function')], max_length=30)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('custom_evaluation_function', models.TextField(blank=True, help_text='Python code for custom evaluation (use with caution)', null=True)),
+            ],
+            options={
+                'ordering': ['category', 'name'],
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='position',
+            options={'ordering': ['unit', 'role__sort_order']},
+        ),
+        migrations.AlterModelOptions(
+            name='userposition',
+            options={'ordering': ['-assignment_date']},
+        ),
+        migrations.RemoveField(
+            model_name='branch',
+            name='commander_position',
+        ),
+        migrations.RemoveField(
+            model_name='unit',
+            name='commander_position',
+        ),
+        migrations.RemoveField(
+            model_name='userposition',
+            name='is_primary',
+        ),
+        migrations.RemoveField(
+            model_name='userposition',
+            name='unit',
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='additional_requirements',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='display_order',
+            field=models.IntegerField(default=0, help_text='Order of display among siblings in ORBAT'),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='identifier',
+            field=models.CharField(blank=True, help_text="Additional identifier (e.g., 'Alpha', '1st')", max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='is_active',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='is_available_for_recruitment',
+            field=models.BooleanField(default=True, help_text='Whether this specific position can be applied for'),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='is_vacant',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='notes',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='orbat_display_level',
+            field=models.CharField(choices=[('full', 'Full Details'), ('summary', 'Summary Only'), ('minimal', 'Minimal Info')], default='full', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='override_max_rank',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='override_max_positions', to='units.rank'),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='override_min_rank',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='override_min_positions', to='units.rank'),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='recruitment_priority',
+            field=models.CharField(choices=[('critical', 'Critical - Fill Immediately'), ('high', 'High Priority'), ('normal', 'Normal Priority'), ('low', 'Low Priority'), ('hold', 'On Hold')], default='normal', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='reports_to_external',
+            field=models.ForeignKey(blank=True, help_text='For positions that report outside their unit', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='external_subordinates', to='units.position'),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='requires_flight_qualification',
+            field=models.BooleanField(default=False, help_text='Position requires aviation qualifications'),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='show_in_orbat',
+            field=models.BooleanField(default=True, help_text='Whether to show this position in ORBAT views'),
+        ),
+        migrations.AddField(
+            model_name='rank',
+            name='insignia_image',
+            field=models.ImageField(blank=True, help_text='Upload rank insignia image (JPG, PNG, GIF, or SVG)', null=True, upload_to='ranks/insignias/', validators=[django.core.validators.FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'gif', 'svg'])]),
+        ),
+        migrations.AddField(
+            model_name='unit',
+            name='is_aviation_only',
+            field=models.BooleanField(default=False, help_text='Unit restricted to aviation warrant officers only'),
+        ),
+        migrations.AddField(
+            model_name='unit',
+            name='max_personnel',
+            field=models.IntegerField(default=0, help_text='Maximum authorized personnel for this unit'),
+        ),
+        migrations.AddField(
+            model_name='unit',
+            name='recruitment_notes',
+            field=models.TextField(blank=True, help_text='Notes about recruitment status/requirements', null=True),
+        ),
+        migrations.AddField(
+            model_name='unit',
+            name='recruitment_status',
+            field=models.CharField(choices=[('open', 'Open for Recruitment'), ('limited', 'Limited Recruitment'), ('closed', 'Closed to Recruitment'), ('frozen', 'Temporarily Frozen')], default='open', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='unit',
+            name='target_personnel',
+            field=models.IntegerField(default=0, help_text='Target personnel strength'),
+        ),
+        migrations.AddField(
+            model_name='unit',
+            name='unit_designation',
+            field=models.CharField(blank=True, help_text="Military designation (e.g., '1st PLT, A/1-61 IN')", max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='unit',
+            name='unit_level',
+            field=models.CharField(blank=True, choices=[('expeditionary_force', 'Expeditionary Force'), ('fleet', 'Fleet'), ('battle_group', 'Battle Group'), ('task_force', 'Task Force'), ('squadron', 'Squadron'), ('division', 'Division'), ('flight', 'Flight'), ('vessel', 'Individual Vessel'), ('air_wing', 'Air Wing'), ('air_group', 'Air Group'), ('squadron', 'Squadron'), ('division', 'Division'), ('flight', 'Flight'), ('element', 'Element/Section'), ('corps', 'Corps'), ('division', 'Division'), ('brigade', 'Brigade/Regiment'), ('battalion', 'Battalion'), ('company', 'Company'), ('platoon', 'Platoon'), ('squad', 'Squad'), ('fire_team', 'Fire Team')], max_length=20, null=True),
+        ),
+        migrations.AddField(
+            model_name='userposition',
+            name='assigned_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='positions_assigned', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='userposition',
+            name='assignment_type',
+            field=models.CharField(choices=[('primary', 'Primary'), ('secondary', 'Secondary'), ('acting', 'Acting'), ('assistant', 'Assistant')], default='primary', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='userposition',
+            name='effective_date',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='userposition',
+            name='end_date',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='userposition',
+            name='notes',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='position',
+            name='title',
+            field=models.CharField(blank=True, help_text='Override title for this specific position', max_length=200, null=True),
+        ),
+        migrations.AlterField(
+            model_name='position',
+            name='unit',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='positions', to='units.unit'),
+        ),
+        migrations.AlterField(
+            model_name='unithierarchyview',
+            name='view_type',
+            field=models.CharField(choices=[('full', 'Full Organization'), ('branch', 'Branch Specific'), ('custom', 'Custom View'), ('operational', 'Operational Structure'), ('administrative', 'Administrative Structure')], default='full', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='userposition',
+            name='position',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignments', to='units.position'),
+        ),
+        migrations.AlterField(
+            model_name='userposition',
+            name='status',
+            field=models.CharField(choices=[('active', 'Active'), ('temporary', 'Temporary'), ('training', 'Training'), ('suspended', 'Suspended'), ('ended', 'Ended')], default='active', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='userposition',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='position_assignments', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.CreateModel(
+            name='MOS',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('code', models.CharField(help_text='MOS code (e.g., 11B, 25B, 68W)', max_length=10, unique=True)),
+                ('title', models.CharField(help_text='MOS title (e.g., Infantryman, Information Technology Specialist)', max_length=100)),
+                ('category', models.CharField(choices=[('combat_arms', 'Combat Arms'), ('combat_support', 'Combat Support'), ('combat_service_support', 'Combat Service Support'), ('special_operations', 'Special Operations'), ('aviation', 'Aviation'), ('medical', 'Medical'), ('intelligence', 'Intelligence'), ('signal', 'Signal/Communications'), ('logistics', 'Logistics'), ('maintenance', 'Maintenance'), ('administration', 'Administration')], max_length=50)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('min_asvab_score', models.IntegerField(default=0, help_text='Minimum ASVAB score required')),
+                ('security_clearance_required', models.CharField(choices=[('none', 'None'), ('secret', 'Secret'), ('top_secret', 'Top Secret'), ('ts_sci', 'TS/SCI')], default='none', max_length=20)),
+                ('physical_demand_rating', models.CharField(choices=[('light', 'Light'), ('moderate', 'Moderate'), ('heavy', 'Heavy'), ('very_heavy', 'Very Heavy')], default='moderate', max_length=20)),
+                ('ait_weeks', models.IntegerField(default=0, help_text='Length of AIT (Advanced Individual Training) in weeks')),
+                ('ait_location', models.CharField(blank=True, max_length=100, null=True)),
+                ('skill_levels', models.JSONField(blank=True, default=dict, help_text='Skill level progression (10, 20, 30, 40)')),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_entry_level', models.BooleanField(default=True, help_text='Can be selected by new recruits')),
+                ('requires_reclassification', models.BooleanField(default=False, help_text='Requires formal reclassification process')),
+                ('branch', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='mos_list', to='units.branch')),
+                ('related_mos', models.ManyToManyField(blank=True, help_text='Related MOS for career progression', to='units.mos')),
+                ('required_certifications', models.ManyToManyField(blank=True, related_name='required_for_mos', to='training.trainingcertificate')),
+            ],
+            options={
+                'verbose_name': 'Military Occupational Specialty',
+                'verbose_name_plural': 'Military Occupational Specialties',
+                'ordering': ['branch', 'code'],
+            },
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='preferred_mos',
+            field=models.ManyToManyField(blank=True, help_text='Preferred MOS for this position', related_name='preferred_positions', to='units.mos'),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='required_mos',
+            field=models.ManyToManyField(blank=True, help_text='MOS required for this position', related_name='positions', to='units.mos'),
+        ),
+        migrations.AddField(
+            model_name='unit',
+            name='authorized_mos',
+            field=models.ManyToManyField(blank=True, help_text='MOS authorized for this unit', related_name='authorized_units', to='units.mos'),
+        ),
+        migrations.AddField(
+            model_name='unit',
+            name='mos_training_capability',
+            field=models.ManyToManyField(blank=True, help_text='MOS this unit can provide training for', related_name='training_units', to='units.mos'),
+        ),
+        migrations.AddField(
+            model_name='unit',
+            name='primary_mos',
+            field=models.ManyToManyField(blank=True, help_text='Primary MOS for this unit type', related_name='primary_units', to='units.mos'),
+        ),
+        migrations.CreateModel(
+            name='PositionTemplate',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=200, unique=True)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('template_type', models.CharField(choices=[('squad', 'Squad Structure'), ('platoon', 'Platoon Structure'), ('company', 'Company Structure'), ('battalion', 'Battalion Structure'), ('brigade', 'Brigade Structure'), ('division', 'Division Structure'), ('custom', 'Custom Structure')], max_length=50)),
+                ('applicable_unit_types', models.JSONField(default=list, help_text='List of unit types this template can be applied to')),
+                ('is_active', models.BooleanField(default=True)),
+                ('allowed_branches', models.ManyToManyField(blank=True, related_name='position_templates', to='units.branch')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='created_position_templates', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['template_type', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Role',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('abbreviation', models.CharField(blank=True, max_length=20, null=True)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('category', models.CharField(choices=[('command', 'Command'), ('staff', 'Staff'), ('nco', 'Non-Commissioned Officer'), ('specialist', 'Specialist'), ('trooper', 'Trooper'), ('support', 'Support'), ('medical', 'Medical'), ('logistics', 'Logistics'), ('intelligence', 'Intelligence'), ('communications', 'Communications'), ('aviation', 'Aviation'), ('armor', 'Armor'), ('infantry', 'Infantry')], max_length=50)),
+                ('is_command_role', models.BooleanField(default=False)),
+                ('is_staff_role', models.BooleanField(default=False)),
+                ('is_nco_role', models.BooleanField(default=False)),
+                ('is_specialist_role', models.BooleanField(default=False)),
+                ('allowed_unit_types', models.JSONField(blank=True, default=list, help_text='List of unit types where this role can exist')),
+                ('min_time_in_service', models.IntegerField(default=0, help_text='Days required in service')),
+                ('min_time_in_grade', models.IntegerField(default=0, help_text='Days required in current rank')),
+                ('min_operations_count', models.IntegerField(default=0, help_text='Minimum operations attended')),
+                ('responsibilities', models.TextField(blank=True, null=True)),
+                ('authorities', models.TextField(blank=True, help_text='What this role is authorized to do', null=True)),
+                ('icon_url', models.URLField(blank=True, null=True)),
+                ('badge_url', models.URLField(blank=True, null=True)),
+                ('color_code', models.CharField(blank=True, max_length=20, null=True)),
+                ('default_slots_per_unit', models.IntegerField(default=1, help_text='Default number of positions when creating in a unit')),
+                ('max_slots_per_unit', models.IntegerField(default=1, help_text='Maximum allowed positions of this role per unit')),
+                ('is_active', models.BooleanField(default=True)),
+                ('sort_order', models.IntegerField(default=0, help_text='Display order within category')),
+                ('allowed_branches', models.ManyToManyField(blank=True, help_text='Leave empty for all branches', related_name='allowed_roles', to='units.branch')),
+                ('max_rank', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='max_rank_roles', to='units.rank')),
+                ('min_rank', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='min_rank_roles', to='units.rank')),
+                ('parent_role', models.ForeignKey(blank=True, help_text='Typical reporting relationship', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='subordinate_roles', to='units.role')),
+                ('typical_rank', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='typical_rank_roles', to='units.rank')),
+            ],
+            options={
+                'ordering': ['category', 'sort_order', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='RankPromotionRequirement',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('value_required', models.IntegerField(default=0, help_text='Numeric value required (days, count, etc.)')),
+                ('unit_type', models.CharField(blank=True, help_text='Specific unit type required', max_length=50, null=True)),
+                ('position_category', models.CharField(blank=True, help_text='Position category (command, staff, etc.)', max_length=50, null=True)),
+                ('certification_category', models.CharField(blank=True, help_text='Category of certifications required', max_length=50, null=True)),
+                ('required_mos_level', models.IntegerField(blank=True, choices=[(10, 'Level 10'), (20, 'Level 20'), (30, 'Level 30'), (40, 'Level 40')], null=True)),
+                ('is_mandatory', models.BooleanField(default=True, help_text='If false, this is an alternative requirement')),
+                ('requirement_group', models.CharField(blank=True, help_text='Group identifier for OR requirements', max_length=50, null=True)),
+                ('display_order', models.IntegerField(default=0)),
+                ('display_text', models.CharField(help_text='Human-readable requirement text', max_length=200)),
+                ('waiverable', models.BooleanField(default=False, help_text='Can this requirement be waived?')),
+                ('waiver_authority', models.CharField(blank=True, choices=[('unit_commander', 'Unit Commander'), ('branch_commander', 'Branch Commander'), ('admin', 'Admin Only')], max_length=50, null=True)),
+                ('rank', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='promotion_requirements', to='units.rank')),
+                ('required_certification', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='training.trainingcertificate')),
+                ('requirement_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='units.promotionrequirementtype')),
+                ('position_role', models.ForeignKey(blank=True, help_text='Specific position role required', null=True, on_delete=django.db.models.deletion.SET_NULL, to='units.role')),
+            ],
+            options={
+                'ordering': ['rank', 'display_order', 'requirement_type'],
+                'unique_together': {('rank', 'requirement_type', 'position_role', 'required_certification')},
+            },
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='role',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='positions', to='units.role'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='position',
+            unique_together={('unit', 'role', 'identifier')},
+        ),
+        migrations.CreateModel(
+            name='TemplatePosition',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('naming_pattern', models.CharField(help_text='Use {unit_name}, {unit_abbr}, {number}, {ordinal} as placeholders', max_length=200)),
+                ('identifier_pattern', models.CharField(blank=True, help_text='Pattern for position identifier', max_length=100, null=True)),
+                ('quantity', models.IntegerField(default=1)),
+                ('display_order', models.IntegerField(default=0)),
+                ('additional_config', models.JSONField(blank=True, default=dict, help_text='Additional configuration for position creation')),
+                ('override_max_rank', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='template_override_max_positions', to='units.rank')),
+                ('override_min_rank', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='template_override_min_positions', to='units.rank')),
+                ('parent_template_position', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='subordinate_template_positions', to='units.templateposition')),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='template_positions', to='units.role')),
+                ('template', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='template_positions', to='units.positiontemplate')),
+            ],
+            options={
+                'ordering': ['template', 'display_order'],
+            },
+        ),
+        migrations.CreateModel(
+            name='UserPromotionProgress',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('last_evaluation_date', models.DateTimeField(blank=True, null=True)),
+                ('is_stale', models.BooleanField(default=True, help_text='Set when an input to the evaluation changes; cleared by evaluation')),
+                ('requirements_met', models.JSONField(default=dict, help_text='Map of requirement IDs to (met, current_value) tuples')),
+                ('overall_eligible', models.BooleanField(default=False)),
+                ('eligibility_percentage', models.FloatField(default=0.0)),
+                ('active_waivers', models.JSONField(default=list, help_text='List of waived requirement IDs')),
+                ('board_eligible', models.BooleanField(default=False)),
+                ('board_scheduled_date', models.DateTimeField(blank=True, null=True)),
+                ('board_completed_date', models.DateTimeField(blank=True, null=True)),
+                ('board_result', models.CharField(blank=True, choices=[('pending', 'Pending'), ('passed', 'Passed'), ('failed', 'Failed'), ('deferred', 'Deferred')], max_length=20, null=True)),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('next_rank', models.ForeignKey(blank=True, help_text='Next eligible rank', null=True, on_delete=django.db.models.deletion.SET_NULL, to='units.rank')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='promotion_progress', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['user'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PromotionWaiver',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('waiver_date', models.DateTimeField(auto_now_add=True)),
+                ('expiry_date', models.DateTimeField(blank=True, help_text='When this waiver expires', null=True)),
+                ('reason', models.TextField()),
+                ('is_active', models.BooleanField(default=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='promotion_waivers', to=settings.AUTH_USER_MODEL)),
+                ('waived_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='waivers_granted', to=settings.AUTH_USER_MODEL)),
+                ('requirement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='units.rankpromotionrequirement')),
+            ],
+            options={
+                'ordering': ['-waiver_date'],
+                'unique_together': {('user', 'requirement')},
+            },
+        ),
+        migrations.CreateModel(
+            name='RecruitmentSlot',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('career_track', models.CharField(choices=[('enlisted', 'Enlisted'), ('warrant', 'Warrant Officer'), ('officer', 'Commissioned Officer')], max_length=20)),
+                ('total_slots', models.IntegerField(default=0)),
+                ('filled_slots', models.IntegerField(default=0)),
+                ('reserved_slots', models.IntegerField(default=0, help_text='Slots reserved for incoming personnel')),
+                ('is_active', models.BooleanField(default=True)),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('unit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recruitment_slots', to='units.unit')),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recruitment_slots', to='units.role')),
+            ],
+            options={
+                'unique_together': {('unit', 'role', 'career_track')},
+            },
+        ),
+        migrations.RemoveField(
+            model_name='position',
+            name='abbreviation',
+        ),
+        migrations.RemoveField(
+            model_name='position',
+            name='description',
+        ),
+        migrations.RemoveField(
+            model_name='position',
+            name='icon_url',
+        ),
+        migrations.RemoveField(
+            model_name='position',
+            name='is_command_position',
+        ),
+        migrations.RemoveField(
+            model_name='position',
+            name='is_staff_position',
+        ),
+        migrations.RemoveField(
+            model_name='position',
+            name='max_rank',
+        ),
+        migrations.RemoveField(
+            model_name='position',
+            name='max_slots',
+        ),
+        migrations.RemoveField(
+            model_name='position',
+            name='min_rank',
+        ),
+        migrations.RemoveField(
+            model_name='position',
+            name='required_certifications',
+        ),
+        migrations.RemoveField(
+            model_name='position',
+            name='responsibilities',
+        ),
+        migrations.CreateModel(
+            name='UnitStrengthReport',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('report_date', models.DateField(auto_now_add=True)),
+                ('authorized_strength', models.IntegerField()),
+                ('assigned_strength', models.IntegerField()),
+                ('present_strength', models.IntegerField()),
+                ('officer_count', models.IntegerField(default=0)),
+                ('warrant_count', models.IntegerField(default=0)),
+                ('enlisted_count', models.IntegerField(default=0)),
+                ('unit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='strength_reports', to='units.unit')),
+            ],
+            options={
+                'ordering': ['-report_date'],
+                'unique_together': {('unit', 'report_date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='UserRankHistory',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('date_assigned', models.DateTimeField()),
+                ('date_ended', models.DateTimeField(blank=True, null=True)),
+                ('promotion_order', models.CharField(blank=True, help_text='Promotion order number', max_length=50, null=True)),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('promoted_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='promotions_given', to=settings.AUTH_USER_MODEL)),
+                ('rank', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='units.rank')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rank_history', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-date_assigned'],
+                'unique_together': {('user', 'rank', 'date_assigned')},
+            },
+        ),
+    ]
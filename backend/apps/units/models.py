@@ -1,7 +1,10 @@
 # backend/apps/units/models.py
 from django.core.validators import FileExtensionValidator
-from django.db import models
+from django.db import connections, models, transaction
 from django.core.exceptions import ValidationError
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models.functions import Coalesce, Greatest, TruncDay, TruncWeek, TruncMonth
+from django.utils import timezone
 from apps.core.models import BaseModel
 
 
@@ -64,6 +67,98 @@ class Rank(BaseModel):
         super().save(*args, **kwargs)
 
 
+class UnitQuerySet(models.QuerySet):
+    """
+    Subtree queries backed by the UnitClosure index, plus batch loaders for serializers.
+    Subtree methods resolve the whole tree in a single query, whatever its depth.
+    """
+
+    def descendants(self, unit, include_self=False, active_only=True):
+        """
+        Get all units below `unit`.
+
+        With active_only, inactive units are skipped together with everything
+        beneath them, matching the old level-by-level walks.
+        """
+        queryset = self.filter(
+            ancestor_links__ancestor=unit,
+            ancestor_links__depth__gte=0 if include_self else 1
+        ).annotate(tree_depth=models.F('ancestor_links__depth'))
+
+        if active_only:
+            inactive_branches = UnitClosure.objects.filter(
+                ancestor__is_active=False,
+                ancestor__ancestor_links__ancestor=unit,
+                ancestor__ancestor_links__depth__gt=0
+            ).values('descendant_id')
+            queryset = queryset.exclude(id__in=inactive_branches)
+
+        return queryset
+
+    def ancestors(self, unit, include_self=False):
+        """Get the chain of command above `unit`, nearest parent first"""
+        return self.filter(
+            descendant_links__descendant=unit,
+            descendant_links__depth__gte=0 if include_self else 1
+        ).annotate(
+            tree_depth=models.F('descendant_links__depth')
+        ).order_by('tree_depth')
+
+    def subtree_ids(self, unit, include_self=True, active_only=True):
+        """Get the IDs of `unit` and all of its subordinate units, unit first"""
+        unit_ids = [unit.id] if include_self else []
+        unit_ids.extend(
+            self.descendants(unit, active_only=active_only).values_list('id', flat=True)
+        )
+        return unit_ids
+
+    def with_summary(self):
+        """
+        Batch-load the per-unit summary used by list serializers:
+        personnel_count, subunit_ids and the commander (command_positions).
+        """
+        personnel = UserPosition.objects.filter(
+            position__unit=models.OuterRef('pk'),
+            status='active'
+        ).order_by().values('position__unit').annotate(
+            count=models.Count('id')
+        ).values('count')
+
+        return self.select_related('branch', 'parent_unit', 'strength').annotate(
+            personnel_count=Coalesce(
+                'strength__active_personnel',
+                models.Subquery(personnel),
+                0
+            ),
+            subunit_ids=ArraySubquery(
+                Unit.objects.filter(parent_unit=models.OuterRef('pk'), is_active=True).values('id')
+            )
+        ).prefetch_related(
+            models.Prefetch(
+                'positions',
+                queryset=Position.objects.filter(
+                    is_active=True,
+                    role__is_command_role=True
+                ).with_holders(),
+                to_attr='command_positions'
+            )
+        )
+
+    def with_positions(self):
+        """Prefetch active positions with their roles (active_positions)"""
+        return self.prefetch_related(
+            models.Prefetch(
+                'positions',
+                queryset=Position.objects.filter(is_active=True).select_related('role'),
+                to_attr='active_positions'
+            )
+        )
+
+
+class UnitManager(models.Manager.from_queryset(UnitQuerySet)):
+    pass
+
+
 class Unit(BaseModel):
     name = models.CharField(max_length=100)
     abbreviation = models.CharField(max_length=20)
@@ -181,30 +276,259 @@ class Unit(BaseModel):
         help_text="Unit restricted to aviation warrant officers only"
     )
 
+    objects = UnitManager()
+
     # Add method to check if unit is accepting applications
     def is_accepting_applications(self):
         """Check if unit and all parent units are open for recruitment"""
         if self.recruitment_status in ['closed', 'frozen']:
             return False
 
-        # Check parent units recursively
-        if self.parent_unit:
-            return self.parent_unit.is_accepting_applications()
-
-        return True
+        # Check the whole parent chain in one query
+        return not Unit.objects.ancestors(self).filter(
+            recruitment_status__in=['closed', 'frozen']
+        ).exists()
 
     def get_available_slots(self):
         """Calculate available slots based on positions"""
+        return self.get_strength_figures()['vacant_positions']
+
+    def get_strength_figures(self):
+        """
+        Direct strength figures from the stored UnitStrength row,
+        counted live for units that have not been recounted yet
+        """
+        try:
+            strength = self.strength
+        except UnitStrength.DoesNotExist:
+            strength = None
+
+        if strength is not None:
+            return {field: getattr(strength, field) for field in UnitStrengthManager.DIRECT_FIELDS}
+
         total_positions = self.positions.filter(is_active=True).count()
         filled_positions = self.positions.filter(
             is_active=True,
             is_vacant=False
         ).count()
-        return total_positions - filled_positions
+        return {
+            'total_positions': total_positions,
+            'filled_positions': filled_positions,
+            'vacant_positions': total_positions - filled_positions,
+            'active_personnel': UserPosition.objects.filter(
+                position__unit=self,
+                status='active'
+            ).count()
+        }
+
     def __str__(self):
         return self.name
 
 
+class UnitClosureManager(models.Manager):
+    """Maintains the ancestor/descendant index as units are created, moved and deleted"""
+
+    def insert_unit(self, unit):
+        """Link a new unit to itself and to every ancestor of its parent"""
+        links = [self.model(ancestor_id=unit.id, descendant_id=unit.id, depth=0)]
+        if unit.parent_unit_id:
+            links.extend(
+                self.model(ancestor_id=ancestor_id, descendant_id=unit.id, depth=depth + 1)
+                for ancestor_id, depth in self.filter(
+                    descendant_id=unit.parent_unit_id
+                ).values_list('ancestor_id', 'depth')
+            )
+        self.bulk_create(links)
+
+    def detach_subtree(self, unit):
+        """Drop every link between the unit's subtree and the units above it"""
+        subtree = self.filter(ancestor_id=unit.id).values('descendant_id')
+        self.filter(descendant_id__in=subtree).exclude(ancestor_id__in=subtree).delete()
+
+    def move_unit(self, unit):
+        """Re-attach the unit's whole subtree under its current parent"""
+        self.detach_subtree(unit)
+        if not unit.parent_unit_id:
+            return
+
+        subtree = list(self.filter(ancestor_id=unit.id).values_list('descendant_id', 'depth'))
+        if not subtree:
+            # Unit predates the index; the rebuild command will pick it up
+            return
+
+        ancestors = list(self.filter(descendant_id=unit.parent_unit_id).values_list('ancestor_id', 'depth'))
+        self.bulk_create([
+            self.model(ancestor_id=ancestor_id, descendant_id=descendant_id, depth=up + down + 1)
+            for ancestor_id, up in ancestors
+            for descendant_id, down in subtree
+        ])
+
+    def rebuild(self):
+        """Recompute the whole index from Unit.parent_unit"""
+        parents = dict(Unit.objects.values_list('id', 'parent_unit_id'))
+
+        links = []
+        for unit_id in parents:
+            ancestor_id = unit_id
+            depth = 0
+            seen = set()
+            # Walk up the parent chain; `seen` guards against bad data with cycles
+            while ancestor_id and ancestor_id not in seen:
+                seen.add(ancestor_id)
+                links.append(self.model(ancestor_id=ancestor_id, descendant_id=unit_id, depth=depth))
+                ancestor_id = parents.get(ancestor_id)
+                depth += 1
+
+        self.all().delete()
+        self.bulk_create(links, batch_size=1000)
+        return len(links)
+
+
+class UnitClosure(BaseModel):
+    """
+    Closure table over Unit.parent_unit.
+    One row per (ancestor, descendant) pair, including each unit with itself at depth 0.
+    """
+    ancestor = models.ForeignKey(Unit, on_delete=models.CASCADE, related_name='descendant_links')
+    descendant = models.ForeignKey(Unit, on_delete=models.CASCADE, related_name='ancestor_links')
+    depth = models.PositiveIntegerField(default=0)
+
+    objects = UnitClosureManager()
+
+    class Meta:
+        unique_together = ['ancestor', 'descendant']
+        indexes = [
+            models.Index(fields=['ancestor', 'depth']),
+            models.Index(fields=['descendant', 'depth']),
+        ]
+
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
+
+
+class UnitStrengthManager(models.Manager):
+    """Recounts stored strength figures as positions and assignments change"""
+
+    DIRECT_FIELDS = ['total_positions', 'filled_positions', 'vacant_positions', 'active_personnel']
+    SUBTREE_FIELDS = ['subtree_' + field for field in DIRECT_FIELDS]
+
+    def recount(self, unit_ids):
+        """
+        Recount the direct figures of `unit_ids` and the subtree figures of
+        those units and every unit above them.
+
+        The affected rows are locked first (in a fixed order), so concurrent
+        recounts of overlapping chains run one after the other and each one
+        counts the other's committed changes.
+        """
+        unit_ids = {unit_id for unit_id in unit_ids if unit_id}
+        if not unit_ids:
+            return
+
+        with transaction.atomic():
+            chain = set(
+                UnitClosure.objects.filter(
+                    descendant_id__in=unit_ids
+                ).values_list('ancestor_id', flat=True)
+            ) | unit_ids
+            list(self.select_for_update().filter(unit_id__in=chain).order_by('unit_id').values_list('id'))
+
+            self._recount_direct(unit_ids)
+            self._recount_subtrees(chain)
+
+    def rebuild(self):
+        """Create missing rows and recount every unit; returns the number of units"""
+        with transaction.atomic():
+            unit_ids = set(Unit.objects.values_list('id', flat=True))
+            missing = unit_ids - set(self.values_list('unit_id', flat=True))
+            self.bulk_create([self.model(unit_id=unit_id) for unit_id in missing], batch_size=1000)
+
+            self._recount_direct(unit_ids)
+            self._recount_subtrees(unit_ids)
+        return len(unit_ids)
+
+    def _recount_direct(self, unit_ids):
+        positions = {
+            row['unit_id']: row
+            for row in Position.objects.filter(
+                unit_id__in=unit_ids,
+                is_active=True
+            ).order_by().values('unit_id').annotate(
+                total=models.Count('id'),
+                filled=models.Count('id', filter=models.Q(is_vacant=False))
+            )
+        }
+        personnel = dict(
+            UserPosition.objects.filter(
+                position__unit_id__in=unit_ids,
+                status='active'
+            ).order_by().values('position__unit_id').annotate(
+                count=models.Count('id')
+            ).values_list('position__unit_id', 'count')
+        )
+
+        rows = list(self.filter(unit_id__in=unit_ids))
+        for row in rows:
+            counts = positions.get(row.unit_id, {})
+            row.total_positions = counts.get('total', 0)
+            row.filled_positions = counts.get('filled', 0)
+            row.vacant_positions = row.total_positions - row.filled_positions
+            row.active_personnel = personnel.get(row.unit_id, 0)
+        self.bulk_update(rows, self.DIRECT_FIELDS, batch_size=1000)
+
+    def _recount_subtrees(self, unit_ids):
+        # A descendant is left out when an inactive unit sits between it and
+        # the ancestor, the same pruning as Unit.objects.descendants()
+        blocked = UnitClosure.objects.filter(
+            descendant_id=models.OuterRef('descendant_id'),
+            ancestor__is_active=False,
+            ancestor__ancestor_links__ancestor_id=models.OuterRef('ancestor_id'),
+            ancestor__ancestor_links__depth__gt=0
+        )
+        totals = {
+            row['ancestor_id']: row
+            for row in UnitClosure.objects.filter(
+                ancestor_id__in=unit_ids
+            ).exclude(
+                models.Exists(blocked)
+            ).order_by().values('ancestor_id').annotate(**{
+                field: Coalesce(models.Sum(f'descendant__strength__{field}'), 0)
+                for field in self.DIRECT_FIELDS
+            })
+        }
+
+        rows = list(self.filter(unit_id__in=unit_ids))
+        for row in rows:
+            unit_totals = totals.get(row.unit_id, {})
+            for field in self.DIRECT_FIELDS:
+                setattr(row, 'subtree_' + field, unit_totals.get(field, 0))
+        self.bulk_update(rows, self.SUBTREE_FIELDS, batch_size=1000)
+
+
+class UnitStrength(BaseModel):
+    """
+    Stored strength figures for a unit, kept current by the units signals.
+    Direct figures cover the unit's own active positions; subtree figures
+    add every active subordinate unit. Repair with `recount_unit_strength`.
+    """
+    unit = models.OneToOneField(Unit, on_delete=models.CASCADE, related_name='strength')
+
+    total_positions = models.PositiveIntegerField(default=0)
+    filled_positions = models.PositiveIntegerField(default=0)
+    vacant_positions = models.PositiveIntegerField(default=0)
+    active_personnel = models.PositiveIntegerField(default=0)
+
+    subtree_total_positions = models.PositiveIntegerField(default=0)
+    subtree_filled_positions = models.PositiveIntegerField(default=0)
+    subtree_vacant_positions = models.PositiveIntegerField(default=0)
+    subtree_active_personnel = models.PositiveIntegerField(default=0)
+
+    objects = UnitStrengthManager()
+
+    def __str__(self):
+        return f"{self.unit_id}: {self.filled_positions}/{self.total_positions}"
+
+
 class Role(BaseModel):
     """Template for positions that can be instantiated across units"""
 
@@ -307,6 +631,38 @@ class Role(BaseModel):
         return f"{self.name} ({self.category})"
 
 
+class PositionQuerySet(models.QuerySet):
+
+    def with_holders(self):
+        """Prefetch each position's active primary assignment (active_primary_assignments)"""
+        return self.select_related('role').prefetch_related(
+            models.Prefetch(
+                'assignments',
+                queryset=UserPosition.objects.filter(
+                    status='active',
+                    assignment_type='primary'
+                ).select_related('user', 'user__current_rank'),
+                to_attr='active_primary_assignments'
+            )
+        )
+
+    def with_subordinates(self):
+        """
+        These positions plus every active position below them, collected with
+        one recursive query over parent_position
+        """
+        root_sql, root_params = self.order_by().values('id').query.sql_with_params()
+        table = self.model._meta.db_table
+        tree_sql = (
+            f'WITH RECURSIVE chain(id) AS ('
+            f'{root_sql} '
+            f'UNION SELECT p.id FROM {table} p JOIN chain ON p.parent_position_id = chain.id '
+            f'WHERE p.is_active'
+            f') SELECT id FROM chain'
+        )
+        return self.model.objects.filter(id__in=models.expressions.RawSQL(tree_sql, root_params))
+
+
 class Position(BaseModel):
     """Specific instance of a Role within a Unit"""
 
@@ -410,6 +766,8 @@ class Position(BaseModel):
         help_text="Preferred MOS for this position"
     )
 
+    objects = PositionQuerySet.as_manager()
+
     def can_be_filled_by_mos(self, mos):
         """Check if position can be filled by a specific MOS"""
         if not self.required_mos.exists():
@@ -474,6 +832,68 @@ class Position(BaseModel):
         return None
 
 
+class UserPositionQuerySet(models.QuerySet):
+
+    def leadership(self):
+        """Assignments to NCO or command roles"""
+        return self.filter(
+            models.Q(position__role__is_nco_role=True) | models.Q(position__role__is_command_role=True)
+        )
+
+    def served_days(self, *group_by, now=None):
+        """
+        Whole days served per group, e.g. served_days('user_id') or
+        served_days('user_id', 'position__role__category').
+
+        Open assignments run until `now`. Overlapping assignments within a
+        group are merged first, so concurrent billets are only counted once.
+        Returns {group value (or tuple of values): days}, in one query.
+        """
+        group_by = group_by or ('user_id',)
+        now = now or timezone.now()
+
+        intervals = self.order_by().annotate(
+            served_from=models.F('assignment_date'),
+            served_until=Greatest(Coalesce('end_date', models.Value(now)), models.F('assignment_date'))
+        ).values_list(*group_by, 'served_from', 'served_until')
+        intervals_sql, params = intervals.query.sql_with_params()
+
+        groups = ', '.join(f'g{index}' for index in range(len(group_by)))
+        # Gaps and islands: an assignment starts a new island unless it begins
+        # before an earlier one in its group has ended
+        sql = f"""
+            SELECT {groups}, FLOOR(SUM(EXTRACT(EPOCH FROM island_until - island_from)) / 86400)
+            FROM (
+                SELECT {groups}, MIN(served_from) AS island_from, MAX(served_until) AS island_until
+                FROM (
+                    SELECT {groups}, served_from, served_until,
+                           SUM(starts_island) OVER (
+                               PARTITION BY {groups} ORDER BY served_from, served_until
+                               ROWS UNBOUNDED PRECEDING
+                           ) AS island
+                    FROM (
+                        SELECT {groups}, served_from, served_until,
+                               CASE WHEN served_from <= MAX(served_until) OVER (
+                                   PARTITION BY {groups} ORDER BY served_from, served_until
+                                   ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+                               ) THEN 0 ELSE 1 END AS starts_island
+                        FROM ({intervals_sql}) AS intervals ({groups}, served_from, served_until)
+                    ) AS marked
+                ) AS numbered
+                GROUP BY {groups}, island
+            ) AS islands
+            GROUP BY {groups}
+        """
+
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+
+        if len(group_by) == 1:
+            return {row[0]: int(row[1]) for row in rows}
+        return {tuple(row[:-1]): int(row[-1]) for row in rows}
+
+
 class UserPosition(BaseModel):
     """Assignment of a User to a specific Position"""
 
@@ -513,6 +933,8 @@ class UserPosition(BaseModel):
     order_number = models.CharField(max_length=50, blank=True, null=True)
     notes = models.TextField(blank=True, null=True)
 
+    objects = UserPositionQuerySet.as_manager()
+
     class Meta:
         ordering = ['-assignment_date']
 
@@ -549,6 +971,73 @@ class UserPosition(BaseModel):
         return self.assignment_type == 'primary'
 
 
+class RecruitmentSlotManager(models.Manager):
+    """
+    Atomic slot bookkeeping. Each operation is a single conditional UPDATE
+    that only applies while the slot can take it, and returns the new counts.
+    """
+
+    COUNT_FIELDS = ['total_slots', 'filled_slots', 'reserved_slots']
+
+    # operation -> (change in reserved, change in filled) per place, and the
+    # condition the slot must meet to take `count` places
+    OPERATIONS = {
+        'reserve': (1, 0, 'slot.total_slots - slot.filled_slots - slot.reserved_slots >= %s'),
+        'release': (-1, 0, 'slot.reserved_slots >= %s'),
+        'fill': (0, 1, 'slot.total_slots - slot.filled_slots - slot.reserved_slots >= %s'),
+        'fill_reserved': (-1, 1, 'slot.reserved_slots >= %s'),
+    }
+
+    def apply(self, slot_id, operation, count=1):
+        """
+        Apply one operation ('reserve', 'release', 'fill' or 'fill_reserved')
+        to `count` places of a slot. Returns the slot's updated counts, or None
+        when the slot does not exist or cannot take the change; nothing is
+        written in that case.
+        """
+        from apps.core.cache import invalidate_tags_on_commit
+        from .recruitment import invalidate_branches
+
+        reserved_delta, filled_delta, guard = self.OPERATIONS[operation]
+        connection = connections[self.db]
+        slot_table = connection.ops.quote_name(self.model._meta.db_table)
+        unit_table = connection.ops.quote_name(Unit._meta.db_table)
+
+        sql = f"""
+            UPDATE {slot_table} AS slot
+            SET reserved_slots = slot.reserved_slots + %s,
+                filled_slots = slot.filled_slots + %s,
+                updated_at = %s
+            FROM {unit_table} AS unit
+            WHERE slot.id = %s AND unit.id = slot.unit_id AND {guard}
+            RETURNING slot.total_slots, slot.filled_slots, slot.reserved_slots, unit.branch_id
+        """
+        params = [reserved_delta * count, filled_delta * count, timezone.now(), slot_id, count]
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+
+        invalidate_branches({row[3]})
+        # The raw UPDATE sends no post_save
+        invalidate_tags_on_commit(self.model)
+        counts = dict(zip(self.COUNT_FIELDS, row[:3]))
+        counts['available_slots'] = counts['total_slots'] - counts['filled_slots'] - counts['reserved_slots']
+        return counts
+
+    def reserve(self, slot_id, count=1):
+        return self.apply(slot_id, 'reserve', count)
+
+    def release(self, slot_id, count=1):
+        return self.apply(slot_id, 'release', count)
+
+    def fill(self, slot_id, count=1, from_reserved=False):
+        return self.apply(slot_id, 'fill_reserved' if from_reserved else 'fill', count)
+
+
 class RecruitmentSlot(BaseModel):
     """
     Track recruitment slots at various unit levels
@@ -586,6 +1075,8 @@ class RecruitmentSlot(BaseModel):
 
     notes = models.TextField(blank=True, null=True)
 
+    objects = RecruitmentSlotManager()
+
     @property
     def available_slots(self):
         return self.total_slots - (self.filled_slots + self.reserved_slots)
@@ -595,9 +1086,101 @@ class RecruitmentSlot(BaseModel):
 
 
 
+class UnitStrengthReportManager(models.Manager):
+    """Writes the daily strength snapshot and reads it back as a time series"""
+
+    FIGURES = [
+        'authorized_strength', 'assigned_strength', 'present_strength',
+        'officer_count', 'warrant_count', 'enlisted_count'
+    ]
+    INTERVALS = {
+        'day': TruncDay,
+        'week': TruncWeek,
+        'month': TruncMonth,
+    }
+
+    def snapshot(self):
+        """
+        Record today's figures for every unit in one pass. Re-running on the
+        same day overwrites that day's rows. Returns the number of rows written.
+        """
+        authorized = dict(
+            Position.objects.filter(is_active=True).order_by().values('unit_id').annotate(
+                count=models.Count('id')
+            ).values_list('unit_id', 'count')
+        )
+
+        present = models.Q(status='active')
+        personnel = {
+            row['position__unit_id']: row
+            for row in UserPosition.objects.exclude(status='ended').order_by().values(
+                'position__unit_id'
+            ).annotate(
+                assigned_strength=models.Count('user', distinct=True),
+                present_strength=models.Count('user', distinct=True, filter=present),
+                officer_count=models.Count(
+                    'user', distinct=True, filter=present & models.Q(user__current_rank__is_officer=True)
+                ),
+                warrant_count=models.Count(
+                    'user', distinct=True, filter=present & models.Q(user__current_rank__is_warrant=True)
+                ),
+                enlisted_count=models.Count(
+                    'user', distinct=True, filter=present & models.Q(user__current_rank__is_enlisted=True)
+                ),
+            )
+        }
+
+        reports = []
+        for unit_id in Unit.objects.values_list('id', flat=True):
+            counts = personnel.get(unit_id, {})
+            reports.append(self.model(
+                unit_id=unit_id,
+                authorized_strength=authorized.get(unit_id, 0),
+                **{field: counts.get(field, 0) for field in self.FIGURES[1:]}
+            ))
+
+        self.bulk_create(
+            reports,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['unit', 'report_date'],
+            update_fields=self.FIGURES + ['updated_at']
+        )
+        return len(reports)
+
+    def history(self, unit, start_date, end_date, interval='day'):
+        """
+        Strength of `unit` and everything below it between two dates,
+        one point per interval. Each point averages the daily subtree totals
+        that fall in it, so gaps in the nightly runs do not skew the series.
+        """
+        trunc = self.INTERVALS[interval]
+        totals = {field: models.Sum(field) for field in self.FIGURES}
+
+        rows = self.filter(
+            unit__ancestor_links__ancestor=unit,
+            report_date__gte=start_date,
+            report_date__lte=end_date
+        ).annotate(
+            period=trunc('report_date')
+        ).order_by().values('period').annotate(
+            days=models.Count('report_date', distinct=True),
+            **totals
+        ).order_by('period')
+
+        return [
+            {
+                'date': row['period'],
+                **{field: round(row[field] / row['days'], 1) for field in self.FIGURES}
+            }
+            for row in rows
+        ]
+
+
 class UnitStrengthReport(BaseModel):
     """
-    Track unit strength over time for reporting
+    Track unit strength over time for reporting.
+    Rows hold the unit's own figures; written nightly by `snapshot_unit_strength`.
     """
     unit = models.ForeignKey(
         'Unit',
@@ -615,6 +1198,8 @@ class UnitStrengthReport(BaseModel):
     warrant_count = models.IntegerField(default=0)
     enlisted_count = models.IntegerField(default=0)
 
+    objects = UnitStrengthReportManager()
+
     class Meta:
         ordering = ['-report_date']
         unique_together = ['unit', 'report_date']
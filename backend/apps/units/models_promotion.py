@@ -2,11 +2,15 @@
 """
 Models for complex rank promotion requirements system
 """
+from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from apps.core.models import BaseModel
 from datetime import timedelta
 
+# Seconds a clean evaluation is trusted before time-based requirements are re-checked
+PROMOTION_PROGRESS_TTL = getattr(settings, 'PROMOTION_PROGRESS_TTL', 60 * 60 * 6)
+
 
 class PromotionRequirementType(BaseModel):
     """Types of requirements that can be defined for promotions"""
@@ -171,99 +175,17 @@ class RankPromotionRequirement(BaseModel):
         return f"{self.rank.abbreviation} - {self.requirement_type.name}"
 
     def evaluate_for_user(self, user):
-        """Evaluate if user meets this requirement"""
-        from apps.events.models import EventAttendance
-        from apps.training.models import UserCertificate
-
-        evaluation_type = self.requirement_type.evaluation_type
-
-        # Time in service
-        if evaluation_type == 'time_in_service':
-            if user.join_date:
-                days_in_service = (timezone.now() - user.join_date).days
-                return days_in_service >= self.value_required, days_in_service
-            return False, 0
-
-        # Time in current grade
-        elif evaluation_type == 'time_in_grade':
-            # This would require tracking when rank was assigned
-            # For now, we'll use a simplified version
-            if hasattr(user, 'rank_history'):
-                last_promotion = user.rank_history.filter(
-                    rank=user.current_rank
-                ).order_by('-date_assigned').first()
-                if last_promotion:
-                    days_in_grade = (timezone.now() - last_promotion.date_assigned).days
-                    return days_in_grade >= self.value_required, days_in_grade
-            return False, 0
-
-        # Time in current unit
-        elif evaluation_type == 'time_in_unit':
-            if user.unit_assignment_date:
-                days_in_unit = (timezone.now() - user.unit_assignment_date).days
-                return days_in_unit >= self.value_required, days_in_unit
-            return False, 0
-
-        # Time in specific position type
-        elif evaluation_type == 'time_in_position_type':
-            from apps.units.models import UserPosition
-
-            total_days = 0
-            positions = UserPosition.objects.filter(
-                user=user,
-                position__role__category=self.position_category
-            )
-
-            for position in positions:
-                start = position.assignment_date
-                end = position.end_date or timezone.now()
-                total_days += (end - start).days
-
-            return total_days >= self.value_required, total_days
-
-        # Required certification
-        elif evaluation_type == 'certification_required':
-            if self.required_certification:
-                has_cert = UserCertificate.objects.filter(
-                    user=user,
-                    certificate=self.required_certification,
-                    is_active=True
-                ).exists()
-                return has_cert, 1 if has_cert else 0
-            return False, 0
-
-        # Number of deployments
-        elif evaluation_type == 'deployments_count':
-            deployment_count = EventAttendance.objects.filter(
-                user=user,
-                event__event_type__in=['Fleet_Battle', 'Ground_Assault', 'Station_Defense'],
-                status='Attending',
-                check_in_time__isnull=False
-            ).count()
-            return deployment_count >= self.value_required, deployment_count
-
-        # Time in leadership positions
-        elif evaluation_type == 'leadership_time':
-            from apps.units.models import UserPosition
-
-            total_days = 0
-            positions = UserPosition.objects.filter(
-                user=user,
-                position__role__is_nco_role=True
-            ) | UserPosition.objects.filter(
-                user=user,
-                position__role__is_command_role=True
-            )
-
-            for position in positions.distinct():
-                start = position.assignment_date
-                end = position.end_date or timezone.now()
-                total_days += (end - start).days
-
-            return total_days >= self.value_required, total_days
-
-        # Default: requirement not met
-        return False, 0
+        """Evaluate if user meets this requirement; returns (met, current_value)"""
+        from .promotion_engine import PromotionMetrics
+
+        return PromotionMetrics([user]).evaluate(self, user.id)
+
+
+class UserPromotionProgressQuerySet(models.QuerySet):
+
+    def mark_stale(self):
+        """Flag rows for re-evaluation on their next read (one UPDATE, no re-evaluation)"""
+        return self.filter(is_stale=False).update(is_stale=True)
 
 
 class UserPromotionProgress(BaseModel):
@@ -285,6 +207,10 @@ class UserPromotionProgress(BaseModel):
 
     # Cached evaluation results
     last_evaluation_date = models.DateTimeField(null=True, blank=True)
+    is_stale = models.BooleanField(
+        default=True,
+        help_text="Set when an input to the evaluation changes; cleared by evaluation"
+    )
     requirements_met = models.JSONField(
         default=dict,
         help_text="Map of requirement IDs to (met, current_value) tuples"
@@ -318,20 +244,50 @@ class UserPromotionProgress(BaseModel):
     # Notes
     notes = models.TextField(blank=True, null=True)
 
+    objects = UserPromotionProgressQuerySet.as_manager()
+
+    @property
+    def needs_evaluation(self):
+        """Stale, never evaluated, or evaluated longer ago than PROMOTION_PROGRESS_TTL"""
+        if self.is_stale or not self.last_evaluation_date:
+            return True
+        return timezone.now() - self.last_evaluation_date > timedelta(seconds=PROMOTION_PROGRESS_TTL)
+
+    def refresh_if_stale(self):
+        """Re-evaluate only when needed, so reads do not write"""
+        if self.needs_evaluation:
+            self.evaluate_requirements()
+
     def evaluate_requirements(self):
         """Evaluate all requirements for next rank"""
+        from .promotion_engine import PromotionMetrics
+
         if not self.next_rank:
             return
 
-        requirements = self.next_rank.promotion_requirements.filter(
-            is_mandatory=True
-        ).select_related('requirement_type')
+        requirements = self.next_rank.promotion_requirements.select_related('requirement_type')
+        results = self.apply_evaluation(requirements, PromotionMetrics([self.user]))
+        self.save()
+
+        return results
 
+    def apply_evaluation(self, requirements, metrics):
+        """
+        Evaluate the next rank's requirements against precomputed PromotionMetrics
+        and update the cached results (without saving)
+        """
         results = {}
         met_count = 0
         total_count = 0
 
+        requirement_groups = {}
         for req in requirements:
+            if not req.is_mandatory:
+                # Handle OR requirement groups below
+                if req.requirement_group is not None:
+                    requirement_groups.setdefault(req.requirement_group, []).append(req)
+                continue
+
             # Skip waived requirements
             if str(req.id) in self.active_waivers:
                 results[str(req.id)] = (True, "Waived")
@@ -339,35 +295,23 @@ class UserPromotionProgress(BaseModel):
                 total_count += 1
                 continue
 
-            met, current_value = req.evaluate_for_user(self.user)
+            met, current_value = metrics.evaluate(req, self.user_id)
             results[str(req.id)] = (met, current_value)
 
             if met:
                 met_count += 1
             total_count += 1
 
-        # Handle OR requirement groups
-        requirement_groups = {}
-        for req in self.next_rank.promotion_requirements.filter(
-                is_mandatory=False,
-                requirement_group__isnull=False
-        ):
-            group = req.requirement_group
-            if group not in requirement_groups:
-                requirement_groups[group] = []
-
-            met, current_value = req.evaluate_for_user(self.user)
-            requirement_groups[group].append((req, met, current_value))
-
         # Check if at least one requirement in each group is met
         for group, group_reqs in requirement_groups.items():
-            group_met = any(met for _, met, _ in group_reqs)
+            evaluated = [(req, *metrics.evaluate(req, self.user_id)) for req in group_reqs]
+            group_met = any(met for _, met, _ in evaluated)
             if group_met:
                 met_count += 1
             total_count += 1
 
             # Store the best progress from the group
-            best_req = max(group_reqs, key=lambda x: x[2] if isinstance(x[2], (int, float)) else 0)
+            best_req = max(evaluated, key=lambda x: x[2] if isinstance(x[2], (int, float)) else 0)
             results[f"group_{group}"] = (group_met, best_req[2])
 
         # Update progress
@@ -376,7 +320,7 @@ class UserPromotionProgress(BaseModel):
         self.overall_eligible = met_count == total_count
         self.board_eligible = self.overall_eligible
         self.last_evaluation_date = timezone.now()
-        self.save()
+        self.is_stale = False
 
         return results
 
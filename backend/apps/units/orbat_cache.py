@@ -0,0 +1,82 @@
+# backend/apps/units/orbat_cache.py
+"""
+Snapshot cache for ORBAT payloads
+
+Each (unit, include_subunits) payload is rendered to JSON bytes once and kept
+until something in that unit's subtree changes. Snapshots are versioned like
+apps.core.cache entries: each one remembers the version token of its unit's
+tag from before it was built, and invalidation replaces the tokens of the
+changed units and their ancestor chain, which makes their snapshots stale.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.core.cache import invalidate_tags, tag_versions
+
+# Bump when the payload shape changes so old snapshots are never served
+SNAPSHOT_FORMAT_VERSION = 1
+
+SNAPSHOT_TIMEOUT = getattr(settings, 'ORBAT_SNAPSHOT_TIMEOUT', 60 * 60 * 24)
+
+
+def snapshot_key(unit_id, include_subunits):
+    return f"orbat:v{SNAPSHOT_FORMAT_VERSION}:{unit_id}:{int(bool(include_subunits))}"
+
+
+def snapshot_tag(unit_id, include_subunits):
+    """The tag of one unit's snapshots, with or without its subtree"""
+    scope = 'subtree' if include_subunits else 'unit'
+    return f"orbat.{scope}:{unit_id}"
+
+
+def snapshot_version(unit_id, include_subunits):
+    """The version token to read before building a snapshot and pass to the other calls"""
+    version, = tag_versions([snapshot_tag(unit_id, include_subunits)])
+    return version
+
+
+def get_snapshot(unit_id, include_subunits, version):
+    """Return the cached (etag, payload bytes) pair built at this version, or None"""
+    entry = cache.get(snapshot_key(unit_id, include_subunits))
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    return None
+
+
+def store_snapshot(unit_id, include_subunits, payload, version):
+    """
+    Cache rendered payload bytes and return the (etag, payload) pair.
+    Nothing is stored if the unit was invalidated since version was read,
+    as the payload may already be out of date.
+    """
+    snapshot = (f'"{hashlib.md5(payload).hexdigest()}"', payload)
+    if snapshot_version(unit_id, include_subunits) == version:
+        cache.set(snapshot_key(unit_id, include_subunits), (version, snapshot), SNAPSHOT_TIMEOUT)
+    return snapshot
+
+
+def invalidate_units(unit_ids):
+    """
+    Make the snapshots of the given units and of every unit above them stale.
+    Versions are replaced once the surrounding transaction commits, so a
+    request racing the write cannot re-cache the old state.
+    """
+    from .models import Unit
+
+    unit_ids = {unit_id for unit_id in unit_ids if unit_id}
+    if not unit_ids:
+        return
+
+    chain = set(
+        Unit.objects.filter(
+            descendant_links__descendant_id__in=unit_ids
+        ).values_list('id', flat=True)
+    ) | unit_ids
+
+    tags = [snapshot_tag(unit_id, True) for unit_id in chain]
+    tags.extend(snapshot_tag(unit_id, False) for unit_id in unit_ids)
+
+    transaction.on_commit(lambda: invalidate_tags(*tags))
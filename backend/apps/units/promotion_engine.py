@@ -0,0 +1,196 @@
+# backend/apps/units/promotion_engine.py
+"""
+Batch promotion eligibility
+
+PromotionMetrics gathers the figures behind every requirement type for a whole
+set of users with one grouped query per figure, loaded on first use.
+Requirements are then evaluated in memory, so evaluating a thousand members
+costs the same handful of queries as evaluating one.
+"""
+from collections import defaultdict
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F, Max
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from .models import UserPosition
+from .models_promotion import RankPromotionRequirement, UserPromotionProgress, UserRankHistory
+from .rank_ladder import get_ladder
+
+User = get_user_model()
+
+DEPLOYMENT_EVENT_TYPES = ['Fleet_Battle', 'Ground_Assault', 'Station_Defense']
+
+PROGRESS_FIELDS = [
+    'next_rank', 'requirements_met', 'eligibility_percentage',
+    'overall_eligible', 'board_eligible', 'last_evaluation_date', 'is_stale'
+]
+
+
+def get_next_rank(user):
+    """Next rank on the user's career track (see RankLadder.next_rank)"""
+    return get_ladder().next_rank(user)
+
+
+class PromotionMetrics:
+    """Per-user figures for evaluating promotion requirements"""
+
+    def __init__(self, users, now=None):
+        self.now = now or timezone.now()
+        self.users = {user.id: user for user in users}
+        self.user_ids = list(self.users)
+
+    @cached_property
+    def grade_start(self):
+        """When each user was assigned their current rank"""
+        return dict(
+            UserRankHistory.objects.filter(
+                user_id__in=self.user_ids,
+                rank_id=F('user__current_rank_id')
+            ).order_by().values('user_id').annotate(
+                started=Max('date_assigned')
+            ).values_list('user_id', 'started')
+        )
+
+    @cached_property
+    def position_type_days(self):
+        """{user_id: {role category: days}}"""
+        days = defaultdict(dict)
+        for (user_id, category), served in UserPosition.objects.filter(
+                user_id__in=self.user_ids
+        ).served_days('user_id', 'position__role__category', now=self.now).items():
+            days[user_id][category] = served
+        return days
+
+    @cached_property
+    def leadership_days(self):
+        return UserPosition.objects.filter(
+            user_id__in=self.user_ids
+        ).leadership().served_days('user_id', now=self.now)
+
+    @cached_property
+    def deployments(self):
+        from apps.events.models import EventAttendance
+
+        return dict(
+            EventAttendance.objects.filter(
+                user_id__in=self.user_ids,
+                event__event_type__in=DEPLOYMENT_EVENT_TYPES,
+                status='Attending',
+                check_in_time__isnull=False
+            ).order_by().values('user_id').annotate(
+                count=Count('id')
+            ).values_list('user_id', 'count')
+        )
+
+    @cached_property
+    def certificates(self):
+        """{user_id: set of held certificate ids}"""
+        from apps.training.models import UserCertificate
+
+        held = defaultdict(set)
+        for user_id, certificate_id in UserCertificate.objects.filter(
+                user_id__in=self.user_ids,
+                is_active=True
+        ).values_list('user_id', 'certificate_id'):
+            held[user_id].add(certificate_id)
+        return held
+
+    def _days_since(self, moment):
+        return (self.now - moment).days
+
+    def evaluate(self, requirement, user_id):
+        """Return (met, current_value) for one requirement, like RankPromotionRequirement.evaluate_for_user"""
+        user = self.users[user_id]
+        evaluation_type = requirement.requirement_type.evaluation_type
+        value_required = requirement.value_required
+
+        if evaluation_type == 'time_in_service':
+            if user.join_date:
+                days = self._days_since(user.join_date)
+                return days >= value_required, days
+            return False, 0
+
+        elif evaluation_type == 'time_in_grade':
+            started = self.grade_start.get(user_id)
+            if started:
+                days = self._days_since(started)
+                return days >= value_required, days
+            return False, 0
+
+        elif evaluation_type == 'time_in_unit':
+            if user.unit_assignment_date:
+                days = self._days_since(user.unit_assignment_date)
+                return days >= value_required, days
+            return False, 0
+
+        elif evaluation_type == 'time_in_position_type':
+            days = self.position_type_days[user_id].get(requirement.position_category, 0)
+            return days >= value_required, days
+
+        elif evaluation_type == 'certification_required':
+            if requirement.required_certification_id:
+                has_cert = requirement.required_certification_id in self.certificates[user_id]
+                return has_cert, 1 if has_cert else 0
+            return False, 0
+
+        elif evaluation_type == 'deployments_count':
+            count = self.deployments.get(user_id, 0)
+            return count >= value_required, count
+
+        elif evaluation_type == 'leadership_time':
+            days = self.leadership_days.get(user_id) or 0
+            return days >= value_required, days
+
+        # Default: requirement not met
+        return False, 0
+
+
+def evaluate_promotions(users=None):
+    """
+    Evaluate next-rank eligibility for many users at once and store the
+    results on their UserPromotionProgress rows (created where missing).
+    Defaults to every active member. Returns the progress rows.
+    """
+    if users is None:
+        users = User.objects.filter(is_active=True)
+    users = list(users)
+
+    progress_rows = {
+        progress.user_id: progress
+        for progress in UserPromotionProgress.objects.filter(user__in=users)
+    }
+
+    new_rows = []
+    for user in users:
+        progress = progress_rows.get(user.id)
+        if progress is None:
+            progress = UserPromotionProgress(user=user)
+            progress_rows[user.id] = progress
+            new_rows.append(progress)
+        if not progress.next_rank_id:
+            progress.next_rank = get_next_rank(user)
+
+    requirements = defaultdict(list)
+    for requirement in RankPromotionRequirement.objects.filter(
+            rank_id__in={progress.next_rank_id for progress in progress_rows.values()}
+    ).select_related('requirement_type'):
+        requirements[requirement.rank_id].append(requirement)
+
+    metrics = PromotionMetrics(users)
+    for progress in progress_rows.values():
+        if progress.next_rank_id:
+            progress.apply_evaluation(requirements[progress.next_rank_id], metrics)
+
+    new_ids = {id(progress) for progress in new_rows}
+    with transaction.atomic():
+        UserPromotionProgress.objects.bulk_create(new_rows, batch_size=500)
+        UserPromotionProgress.objects.bulk_update(
+            [progress for progress in progress_rows.values() if id(progress) not in new_ids],
+            PROGRESS_FIELDS,
+            batch_size=500
+        )
+
+    return list(progress_rows.values())
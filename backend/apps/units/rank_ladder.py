@@ -0,0 +1,119 @@
+# backend/apps/units/rank_ladder.py
+"""
+In-process rank ladder
+
+Ranks change a few times a year but are read on every promotion and career
+page. The ladder loads them once, indexed per branch and track by tier, and is
+dropped by the Rank/Branch signals. Other worker processes pick up changes
+when RANK_LADDER_TTL runs out.
+"""
+import threading
+import time
+
+from django.conf import settings
+
+RANK_LADDER_TTL = getattr(settings, 'RANK_LADDER_TTL', 60 * 5)
+
+TRACKS = ('enlisted', 'officer', 'warrant')
+
+_lock = threading.Lock()
+_state = {'ladder': None, 'built_at': 0.0, 'progression': None}
+
+
+class RankLadder:
+    """Ranks indexed by id and by (branch, track), each track ordered by tier"""
+
+    def __init__(self, ranks):
+        self.ranks = {rank.id: rank for rank in ranks}
+        self.tracks = {}
+        for rank in sorted(ranks, key=lambda rank: rank.tier):
+            for track in TRACKS:
+                if getattr(rank, f'is_{track}'):
+                    self.tracks.setdefault((rank.branch_id, track), []).append(rank)
+
+    def get(self, rank_id):
+        return self.ranks.get(rank_id)
+
+    def track(self, branch_id, track):
+        """Ranks of one branch on one track (enlisted, officer or warrant), lowest tier first"""
+        return self.tracks.get((branch_id, track), [])
+
+    def next_in_track(self, branch_id, track, above_tier=None):
+        for rank in self.track(branch_id, track):
+            if above_tier is None or rank.tier > above_tier:
+                return rank
+        return None
+
+    def next_rank(self, user):
+        """
+        Next rank on the user's career track: the lowest tier above their current
+        rank in their branch, or the entry-level enlisted rank if they have none
+        """
+        if not user.branch_id:
+            return None
+
+        current_rank = self.get(user.current_rank_id)
+        if current_rank is None:
+            return self.next_in_track(user.branch_id, 'enlisted')
+
+        if current_rank.is_enlisted:
+            # Enlisted candidates move onto the warrant or officer track
+            if user.warrant_officer_candidate:
+                track = 'warrant'
+            elif user.officer_candidate:
+                track = 'officer'
+            else:
+                track = 'enlisted'
+        elif current_rank.is_warrant:
+            track = 'warrant'
+        else:
+            track = 'officer'
+
+        return self.next_in_track(user.branch_id, track, above_tier=current_rank.tier)
+
+
+def get_ladder():
+    """The current ladder, rebuilt after invalidation or once RANK_LADDER_TTL has passed"""
+    ladder = _state['ladder']
+    if ladder is not None and time.monotonic() - _state['built_at'] < RANK_LADDER_TTL:
+        return ladder
+
+    from .models import Rank
+
+    with _lock:
+        if _state['ladder'] is ladder:
+            _state['ladder'] = RankLadder(list(Rank.objects.select_related('branch')))
+            _state['built_at'] = time.monotonic()
+            _state['progression'] = None
+        return _state['ladder']
+
+
+def get_progression():
+    """
+    Rank progression for every branch, as served by RankViewSet.progression.
+    Built from the ladder once and kept until the ladder is rebuilt.
+    """
+    ladder = get_ladder()
+    progression = _state['progression']
+    if progression is not None:
+        return progression
+
+    from .models import Branch
+    from .serializers import RankSerializer
+
+    progression = {
+        branch.name: {
+            track: RankSerializer(ladder.track(branch.id, track), many=True).data
+            for track in TRACKS
+        }
+        for branch in Branch.objects.all()
+    }
+    if _state['ladder'] is ladder:
+        _state['progression'] = progression
+    return progression
+
+
+def invalidate():
+    with _lock:
+        _state['ladder'] = None
+        _state['progression'] = None
@@ -0,0 +1,200 @@
+# backend/apps/units/recruitment.py
+"""
+Per-branch recruitment availability
+
+The application wizard asks, for many units at once, how many slots are open
+in each unit's whole subtree. BranchRecruitment loads a branch's units and
+active RecruitmentSlots in two queries and rolls availability up the tree in
+one pass. The result is cached per branch and dropped by the slot, unit and
+role signals.
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Bump when the cached structure changes so old entries are never read
+RECRUITMENT_FORMAT_VERSION = 1
+
+RECRUITMENT_CACHE_TIMEOUT = getattr(settings, 'RECRUITMENT_CACHE_TIMEOUT', 60 * 60)
+
+CAREER_TRACKS = ('enlisted', 'warrant', 'officer')
+
+
+def recruitment_key(branch_id):
+    if branch_id is not None:
+        # Raises ValueError for anything that is not a UUID
+        branch_id = uuid.UUID(str(branch_id))
+    return f"recruitment:v{RECRUITMENT_FORMAT_VERSION}:{branch_id}"
+
+
+def serialize_slot(slot):
+    """The slot entry shown in the position picker"""
+    role = slot.role
+    unit = slot.unit
+    return {
+        'id': slot.id,
+        'unit': {
+            'id': str(unit.id),
+            'name': unit.name,
+            'abbreviation': unit.abbreviation,
+            'level': unit.unit_level,
+            'type': unit.unit_type
+        },
+        'role': {
+            'id': str(role.id),
+            'name': role.name,
+            'abbreviation': role.abbreviation or role.name[:4],
+            'category': role.category,
+            'description': role.description or '',
+            'is_command_role': role.is_command_role,
+            'is_staff_role': role.is_staff_role,
+            'is_nco_role': role.is_nco_role,
+            'is_specialist_role': role.is_specialist_role,
+            'responsibilities': role.responsibilities,
+            'min_rank': role.min_rank.abbreviation if role.min_rank else None,
+            'typical_rank': role.typical_rank.abbreviation if role.typical_rank else None,
+        },
+        'career_track': slot.career_track,
+        'available_slots': slot.available_slots,
+        'total_slots': slot.total_slots,
+        'filled_slots': slot.filled_slots,
+        'reserved_slots': slot.reserved_slots,
+        'notes': slot.notes,
+
+        # Display info
+        'display_name': f"{role.name} - {unit.abbreviation}",
+        'display_code': f"{role.abbreviation or 'POS'}-{unit.abbreviation}",
+    }
+
+
+class BranchRecruitment:
+    """
+    Active recruitment slots of one branch, with availability rolled up per unit.
+
+    As with Unit.objects.subtree_ids, a unit's subtree skips inactive subunits
+    together with everything beneath them.
+    """
+
+    def __init__(self, units, slots):
+        self.units = {unit['id']: unit for unit in units}
+        self.children = {}
+        for unit in units:
+            if unit['parent_unit_id'] in self.units:
+                self.children.setdefault(unit['parent_unit_id'], []).append(unit['id'])
+
+        self.own_slots = {}
+        for slot in slots:
+            self.own_slots.setdefault(slot.unit_id, []).append(serialize_slot(slot))
+
+        self.rollups = {}
+        for unit_id in self._post_order():
+            self.rollups[unit_id] = self._rollup(unit_id)
+
+    def _post_order(self):
+        """Every unit, each after all of its subunits"""
+        roots = [unit_id for unit_id, unit in self.units.items()
+                 if unit['parent_unit_id'] not in self.units]
+        order = []
+        stack = [(unit_id, False) for unit_id in roots]
+        while stack:
+            unit_id, expanded = stack.pop()
+            if expanded:
+                order.append(unit_id)
+                continue
+            stack.append((unit_id, True))
+            stack.extend((child_id, False) for child_id in self.children.get(unit_id, []))
+        return order
+
+    def _active_children(self, unit_id):
+        return [child_id for child_id in self.children.get(unit_id, [])
+                if self.units[child_id]['is_active']]
+
+    def _rollup(self, unit_id):
+        """Totals for one unit, built from its own slots and its subunits' rollups"""
+        available = 0
+        by_track = dict.fromkeys(CAREER_TRACKS, 0)
+        roles = {}
+        units_included = 1
+
+        for slot in self.own_slots.get(unit_id, []):
+            available += slot['available_slots']
+            if slot['career_track'] in by_track:
+                by_track[slot['career_track']] += slot['available_slots']
+            role = slot['role']
+            roles[role['id']] = {'id': role['id'], 'name': role['name'], 'category': role['category']}
+
+        for child_id in self._active_children(unit_id):
+            child = self.rollups[child_id]
+            available += child['available_slots']
+            for track, count in child['slots_by_track'].items():
+                by_track[track] += count
+            roles.update(child['roles'])
+            units_included += child['units_included']
+
+        return {
+            'available_slots': available,
+            'slots_by_track': by_track,
+            'roles': roles,
+            'units_included': units_included,
+        }
+
+    def rollup(self, unit_id):
+        """
+        Availability across a unit's subtree: available_slots, slots_by_track,
+        roles ({role id: {id, name, category}}) and units_included
+        """
+        if unit_id in self.rollups:
+            return self.rollups[unit_id]
+        return self._rollup(unit_id)
+
+    def subtree(self, unit_id):
+        """IDs of the unit and its active subunits, unit first"""
+        unit_ids = [unit_id]
+        index = 0
+        while index < len(unit_ids):
+            unit_ids.extend(self._active_children(unit_ids[index]))
+            index += 1
+        return unit_ids
+
+    def slots(self, unit_id, career_track=None):
+        """Slot entries (see serialize_slot) across the unit's subtree"""
+        for subunit_id in self.subtree(unit_id):
+            for slot in self.own_slots.get(subunit_id, []):
+                if career_track is None or slot['career_track'] == career_track:
+                    yield slot
+
+
+def build(branch_id):
+    from .models import Unit, RecruitmentSlot
+
+    units = list(
+        Unit.objects.filter(branch_id=branch_id).values('id', 'parent_unit_id', 'is_active')
+    )
+    slots = RecruitmentSlot.objects.filter(
+        unit__branch_id=branch_id,
+        is_active=True
+    ).select_related('unit', 'role__min_rank', 'role__typical_rank')
+    return BranchRecruitment(units, slots)
+
+
+def get_branch_recruitment(branch_id):
+    """The branch's BranchRecruitment, built on a cache miss"""
+    key = recruitment_key(branch_id)
+    recruitment = cache.get(key)
+    if recruitment is None:
+        recruitment = build(branch_id)
+        cache.set(key, recruitment, RECRUITMENT_CACHE_TIMEOUT)
+    return recruitment
+
+
+def invalidate_branches(branch_ids=None):
+    """Drop the cached branches (all of them when branch_ids is None) once the transaction commits"""
+    if branch_ids is None:
+        from .models import Branch
+
+        branch_ids = list(Branch.objects.values_list('id', flat=True)) + [None]
+
+    keys = [recruitment_key(branch_id) for branch_id in set(branch_ids)]
+    transaction.on_commit(lambda: cache.delete_many(keys))
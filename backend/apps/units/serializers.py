@@ -10,6 +10,8 @@ from django.utils import timezone
 
 from django.conf import settings
 
+from apps.core.serializers import SparseFieldsetMixin
+
 User = get_user_model()
 
 
@@ -314,6 +316,58 @@ class RoleCreateUpdateSerializer(serializers.ModelSerializer):
             instance.allowed_branches.set(allowed_branches)
 
         return instance
+
+
+def group_by_parent(nodes, parent_field):
+    """Index tree rows by parent id so nested serializers can recurse in memory"""
+    children = {}
+    for node in nodes:
+        children.setdefault(getattr(node, parent_field), []).append(node)
+    return children
+
+
+def get_unit_commander(unit):
+    """
+    Summarize the holder of the unit's command position.
+    Uses command_positions from Unit.objects.with_summary() when loaded.
+    """
+    if hasattr(unit, 'command_positions'):
+        command_position = unit.command_positions[0] if unit.command_positions else None
+        active_assignment = None
+        if command_position and command_position.active_primary_assignments:
+            active_assignment = command_position.active_primary_assignments[0]
+    else:
+        command_position = unit.positions.filter(
+            role__is_command_role=True,
+            is_active=True
+        ).first()
+
+        active_assignment = None
+        if command_position:
+            active_assignment = command_position.assignments.filter(
+                status='active',
+                assignment_type='primary'
+            ).select_related('user', 'user__current_rank').first()
+
+    if active_assignment:
+        return {
+            'id': active_assignment.user.id,
+            'username': active_assignment.user.username,
+            'rank': active_assignment.user.current_rank.abbreviation if active_assignment.user.current_rank else None
+        }
+    return None
+
+
+def get_unit_personnel_count(unit):
+    """Active assignments in the unit, annotated by Unit.objects.with_summary() when loaded"""
+    if hasattr(unit, 'personnel_count'):
+        return unit.personnel_count
+    return UserPosition.objects.filter(
+        position__unit=unit,
+        status='active'
+    ).count()
+
+
 # Unit Serializers
 class UnitListSerializer(serializers.ModelSerializer):
     branch_name = serializers.ReadOnlyField(source='branch.name')
@@ -330,31 +384,10 @@ class UnitListSerializer(serializers.ModelSerializer):
         ]
 
     def get_commander(self, obj):
-        # Find command position for this unit
-        command_position = obj.positions.filter(
-            role__is_command_role=True,
-            is_active=True
-        ).first()
-
-        if command_position:
-            active_assignment = command_position.assignments.filter(
-                status='active',
-                assignment_type='primary'
-            ).select_related('user', 'user__current_rank').first()
-
-            if active_assignment:
-                return {
-                    'id': active_assignment.user.id,
-                    'username': active_assignment.user.username,
-                    'rank': active_assignment.user.current_rank.abbreviation if active_assignment.user.current_rank else None
-                }
-        return None
+        return get_unit_commander(obj)
 
     def get_personnel_count(self, obj):
-        return UserPosition.objects.filter(
-            position__unit=obj,
-            status='active'
-        ).count()
+        return get_unit_personnel_count(obj)
 
 
 # Position List Serializer (needed before UnitDetailSerializer)
@@ -375,10 +408,14 @@ class PositionListSerializer(serializers.ModelSerializer):
         ]
 
     def get_current_holder(self, obj):
-        active = obj.assignments.filter(
-            status='active',
-            assignment_type='primary'
-        ).select_related('user', 'user__current_rank').first()
+        if hasattr(obj, 'active_primary_assignments'):
+            assignments = obj.active_primary_assignments
+            active = assignments[0] if assignments else None
+        else:
+            active = obj.assignments.filter(
+                status='active',
+                assignment_type='primary'
+            ).select_related('user', 'user__current_rank').first()
 
         if active:
             return {
@@ -389,7 +426,7 @@ class PositionListSerializer(serializers.ModelSerializer):
         return None
 
 
-class UnitDetailSerializer(serializers.ModelSerializer):
+class UnitDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     branch = BranchSerializer(read_only=True)
     parent_unit_details = serializers.SerializerMethodField()
     subunits = serializers.SerializerMethodField()
@@ -403,6 +440,10 @@ class UnitDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = Unit
         fields = '__all__'
+        # Each costs queries per unit; ?expand= picks which are computed
+        expandable_fields = [
+            'subunits', 'positions', 'personnel', 'statistics', 'authorized_mos', 'mos_requirements'
+        ]
 
     def get_authorized_mos(self, obj):
         from .serializers_mos import MOSListSerializer
@@ -435,18 +476,30 @@ class UnitDetailSerializer(serializers.ModelSerializer):
         return None
 
     def get_subunits(self, obj):
-        subunits = obj.subunits.filter(is_active=True)
+        if hasattr(obj, 'active_subunits'):
+            subunits = obj.active_subunits
+        else:
+            subunits = Unit.objects.filter(parent_unit=obj, is_active=True).with_summary()
         return UnitListSerializer(subunits, many=True).data
 
     def get_positions(self, obj):
-        positions = obj.positions.filter(is_active=True).select_related('role')
+        if hasattr(obj, 'active_positions'):
+            positions = obj.active_positions
+        else:
+            positions = obj.positions.filter(is_active=True).with_holders()
         return PositionListSerializer(positions, many=True).data
 
     def get_personnel(self, obj):
-        assignments = UserPosition.objects.filter(
-            position__unit=obj,
-            status='active'
-        ).select_related('user', 'position', 'user__current_rank')
+        if hasattr(obj, 'staffed_positions'):
+            assignments = sorted(
+                (assignment for position in obj.staffed_positions for assignment in position.active_assignments),
+                key=lambda assignment: assignment.assignment_date, reverse=True
+            )
+        else:
+            assignments = UserPosition.objects.filter(
+                position__unit=obj,
+                status='active'
+            ).select_related('user', 'position__role', 'user__current_rank')
 
         return [{
             'id': assignment.user.id,
@@ -458,18 +511,16 @@ class UnitDetailSerializer(serializers.ModelSerializer):
         } for assignment in assignments]
 
     def get_statistics(self, obj):
-        total_positions = obj.positions.filter(is_active=True).count()
-        filled_positions = obj.positions.filter(is_active=True, is_vacant=False).count()
+        figures = obj.get_strength_figures()
+        total_positions = figures['total_positions']
+        filled_positions = figures['filled_positions']
 
         return {
             'total_positions': total_positions,
             'filled_positions': filled_positions,
-            'vacant_positions': total_positions - filled_positions,
+            'vacant_positions': figures['vacant_positions'],
             'fill_rate': round((filled_positions / total_positions * 100) if total_positions > 0 else 0, 1),
-            'personnel_count': UserPosition.objects.filter(
-                position__unit=obj,
-                status='active'
-            ).count()
+            'personnel_count': figures['active_personnel']
         }
 
 
@@ -758,9 +809,15 @@ class UnitHierarchySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'abbreviation', 'unit_type', 'emblem_url', 'subunits']
 
     def get_subunits(self, obj):
-        subunits = Unit.objects.filter(parent_unit=obj, is_active=True)
+        # Load the whole subtree once at the top level and hand it down
+        children_map = self.context.get('unit_children')
+        if children_map is None:
+            children_map = group_by_parent(Unit.objects.descendants(obj), 'parent_unit_id')
+
+        subunits = children_map.get(obj.id, [])
         if subunits:
-            return UnitHierarchySerializer(subunits, many=True).data
+            context = {**self.context, 'unit_children': children_map}
+            return UnitHierarchySerializer(subunits, many=True, context=context).data
         return []
 
 
@@ -773,19 +830,27 @@ class ChainOfCommandSerializer(serializers.ModelSerializer):
         fields = ['id', 'display_title', 'holder', 'subordinates']
 
     def get_subordinates(self, obj):
-        subordinates = Position.objects.filter(
-            parent_position=obj,
-            is_active=True
-        )
+        # Same pattern as UnitHierarchySerializer: one tree query, then recurse in memory
+        children_map = self.context.get('position_children')
+        if children_map is None:
+            positions = Position.objects.filter(pk=obj.pk).with_subordinates().with_holders()
+            children_map = group_by_parent(positions, 'parent_position_id')
+
+        subordinates = children_map.get(obj.id, [])
         if subordinates:
-            return ChainOfCommandSerializer(subordinates, many=True).data
+            context = {**self.context, 'position_children': children_map}
+            return ChainOfCommandSerializer(subordinates, many=True, context=context).data
         return []
 
     def get_holder(self, obj):
-        assignment = obj.assignments.filter(
-            status='active',
-            assignment_type='primary'
-        ).select_related('user', 'user__current_rank').first()
+        if hasattr(obj, 'active_primary_assignments'):
+            assignments = obj.active_primary_assignments
+            assignment = assignments[0] if assignments else None
+        else:
+            assignment = obj.assignments.filter(
+                status='active',
+                assignment_type='primary'
+            ).select_related('user', 'user__current_rank').first()
 
         if assignment:
             return {
@@ -840,36 +905,21 @@ class UnitNodeSerializer(serializers.ModelSerializer):
         ]
 
     def get_personnel_count(self, obj):
-        return UserPosition.objects.filter(
-            position__unit=obj,
-            status='active'
-        ).count()
+        return get_unit_personnel_count(obj)
 
     def get_commander(self, obj):
-        command_position = obj.positions.filter(
-            role__is_command_role=True,
-            is_active=True
-        ).first()
-
-        if command_position:
-            assignment = command_position.assignments.filter(
-                status='active',
-                assignment_type='primary'
-            ).select_related('user', 'user__current_rank').first()
-
-            if assignment:
-                return {
-                    'id': assignment.user.id,
-                    'username': assignment.user.username,
-                    'rank': assignment.user.current_rank.abbreviation if assignment.user.current_rank else None
-                }
-        return None
+        return get_unit_commander(obj)
 
     def get_subunits(self, obj):
+        if hasattr(obj, 'subunit_ids'):
+            return obj.subunit_ids
         return list(obj.subunits.filter(is_active=True).values_list('id', flat=True))
 
     def get_positions(self, obj):
-        positions = obj.positions.filter(is_active=True).select_related('role')
+        if hasattr(obj, 'active_positions'):
+            positions = obj.active_positions
+        else:
+            positions = obj.positions.filter(is_active=True).select_related('role')
         return [{
             'id': pos.id,
             'display_title': pos.display_title,
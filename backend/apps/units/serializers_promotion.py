@@ -9,6 +9,7 @@ from .models_promotion import (
 )
 from .models import Rank, Role
 from .serializers import RankSerializer, RoleDetailSerializer
+from .rank_ladder import get_ladder
 from apps.training.serializers import TrainingCertificateSerializer
 from django.utils import timezone
 
@@ -216,6 +217,22 @@ class PromotionProgressSerializer(serializers.ModelSerializer):
         return estimates
 
 
+class PromotionEligibilitySerializer(serializers.ModelSerializer):
+    """Row of the promotion board eligibility list"""
+
+    username = serializers.ReadOnlyField(source='user.username')
+    current_rank = serializers.ReadOnlyField(source='user.current_rank.abbreviation', default=None)
+    next_rank_abbreviation = serializers.ReadOnlyField(source='next_rank.abbreviation')
+
+    class Meta:
+        model = UserPromotionProgress
+        fields = [
+            'id', 'user', 'username', 'current_rank', 'next_rank',
+            'next_rank_abbreviation', 'overall_eligible', 'eligibility_percentage',
+            'board_eligible', 'last_evaluation_date'
+        ]
+
+
 class PromotionChecklistSerializer(serializers.Serializer):
     """Serializer for promotion checklist display"""
 
@@ -301,22 +318,26 @@ class PromoteUserSerializer(serializers.Serializer):
         except User.DoesNotExist:
             raise serializers.ValidationError("User not found")
 
-        # Validate rank
-        try:
-            rank = Rank.objects.get(id=data['new_rank_id'])
-            data['new_rank'] = rank
-        except Rank.DoesNotExist:
+        # Validate rank; a rank created in another process may not be on this
+        # process's ladder until it is rebuilt, so a miss is checked in the database
+        ladder = get_ladder()
+        rank = ladder.get(data['new_rank_id']) or Rank.objects.filter(id=data['new_rank_id']).first()
+        if rank is None:
             raise serializers.ValidationError("Rank not found")
+        data['new_rank'] = rank
 
         # Check if promotion is valid (going up in tiers)
-        if user.current_rank and rank.tier <= user.current_rank.tier:
+        current_rank = user.current_rank_id and (
+            ladder.get(user.current_rank_id) or Rank.objects.filter(id=user.current_rank_id).first()
+        )
+        if current_rank and rank.tier <= current_rank.tier:
             if not data.get('force'):
                 raise serializers.ValidationError(
                     "Cannot promote to same or lower rank without force flag"
                 )
 
         # Check branch compatibility
-        if user.branch and rank.branch != user.branch:
+        if user.branch_id and rank.branch_id != user.branch_id:
             raise serializers.ValidationError(
                 "Cannot promote to rank from different branch"
             )
@@ -0,0 +1,303 @@
+# backend/apps/units/signals.py
+"""
+Signal handlers that keep derived unit data in sync with the source models
+"""
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.conf import settings
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+
+from . import orbat_cache, rank_ladder, recruitment
+from .models import (
+    Branch, Rank, Unit, UnitClosure, UnitStrength, Role, Position, UserPosition, RecruitmentSlot
+)
+from .models_promotion import (
+    RankPromotionRequirement, UserPromotionProgress, UserRankHistory, PromotionWaiver
+)
+
+
+@receiver(pre_save, sender=Unit)
+def track_unit_parent(sender, instance, raw=False, **kwargs):
+    """Remember the stored parent so post_save can tell whether the unit moved"""
+    instance._previous_parent_unit_id = None
+    instance._previous_is_active = None
+    instance._previous_branch_id = None
+    if raw or instance._state.adding:
+        return
+
+    previous = Unit.objects.filter(pk=instance.pk).values('parent_unit_id', 'is_active', 'branch_id').first()
+    if previous:
+        instance._previous_parent_unit_id = previous['parent_unit_id']
+        instance._previous_is_active = previous['is_active']
+        instance._previous_branch_id = previous['branch_id']
+
+    if (instance.parent_unit_id
+            and instance.parent_unit_id != instance._previous_parent_unit_id
+            and UnitClosure.objects.filter(ancestor_id=instance.pk,
+                                           descendant_id=instance.parent_unit_id).exists()):
+        raise ValidationError("A unit cannot be placed under itself or one of its subunits.")
+
+
+@receiver(post_save, sender=Unit)
+def update_unit_closure(sender, instance, created, raw=False, **kwargs):
+    """Keep the ancestor/descendant index current"""
+    if raw:
+        return
+
+    with transaction.atomic():
+        if created:
+            UnitClosure.objects.insert_unit(instance)
+        elif instance.parent_unit_id != getattr(instance, '_previous_parent_unit_id', instance.parent_unit_id):
+            UnitClosure.objects.move_unit(instance)
+
+    orbat_cache.invalidate_units({instance.id, getattr(instance, '_previous_parent_unit_id', None)})
+
+
+@receiver(pre_delete, sender=Unit)
+def detach_unit_closure(sender, instance, **kwargs):
+    """
+    Subunits are orphaned (SET_NULL) when their parent is deleted,
+    so their subtrees must be cut loose from the deleted unit's ancestors.
+    """
+    orbat_cache.invalidate_units({instance.id})
+    UnitClosure.objects.detach_subtree(instance)
+    UnitStrength.objects.recount({instance.parent_unit_id})
+
+
+# Unit strength counters
+
+@receiver(post_save, sender=Unit)
+def update_unit_strength(sender, instance, created, raw=False, **kwargs):
+    """New units start at zero; moving or (de)activating a unit changes the totals above it"""
+    if raw:
+        return
+
+    if created:
+        UnitStrength.objects.create(unit=instance)
+        return
+
+    previous_parent_id = getattr(instance, '_previous_parent_unit_id', instance.parent_unit_id)
+    previous_is_active = getattr(instance, '_previous_is_active', instance.is_active)
+    if previous_parent_id != instance.parent_unit_id or previous_is_active != instance.is_active:
+        UnitStrength.objects.recount({instance.id, previous_parent_id})
+
+
+@receiver(post_save, sender=Position)
+@receiver(post_delete, sender=Position)
+def recount_position_strength(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    UnitStrength.objects.recount({instance.unit_id, getattr(instance, '_previous_unit_id', None)})
+
+
+@receiver(post_save, sender=UserPosition)
+@receiver(post_delete, sender=UserPosition)
+def recount_assignment_strength(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    UnitStrength.objects.recount({instance.position.unit_id})
+
+
+# ORBAT snapshot invalidation
+
+@receiver(pre_save, sender=Position)
+def track_position_unit(sender, instance, raw=False, **kwargs):
+    """Remember the stored unit so a position moved between units invalidates both"""
+    instance._previous_unit_id = None
+    if raw or instance._state.adding:
+        return
+
+    instance._previous_unit_id = Position.objects.filter(
+        pk=instance.pk
+    ).values_list('unit_id', flat=True).first()
+
+
+@receiver(post_save, sender=Position)
+@receiver(post_delete, sender=Position)
+def invalidate_position_orbat(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    orbat_cache.invalidate_units({instance.unit_id, getattr(instance, '_previous_unit_id', None)})
+
+
+@receiver(post_save, sender=UserPosition)
+@receiver(post_delete, sender=UserPosition)
+def invalidate_assignment_orbat(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    orbat_cache.invalidate_units({instance.position.unit_id})
+
+
+@receiver(post_save, sender=Role)
+@receiver(pre_delete, sender=Role)
+def invalidate_role_orbat(sender, instance, raw=False, **kwargs):
+    """On delete this runs before the role's positions are removed, while they can still be found"""
+    if raw:
+        return
+    orbat_cache.invalidate_units(
+        Position.objects.filter(role=instance).values_list('unit_id', flat=True).distinct()
+    )
+
+
+# Fields of ranks, branches and holders that appear in ORBAT payloads
+ORBAT_RANK_FIELDS = ('name', 'abbreviation', 'insignia_image_url', 'insignia_image')
+ORBAT_BRANCH_FIELDS = ('name',)
+ORBAT_HOLDER_FIELDS = ('username', 'avatar_url', 'service_number')
+
+
+def _remember_orbat_fields(instance, fields, update_fields=None):
+    """Store the saved values of fields so post_save can tell whether they changed"""
+    instance._previous_orbat_fields = None
+    if instance._state.adding or (update_fields is not None and not set(fields) & set(update_fields)):
+        return
+    instance._previous_orbat_fields = type(instance)._default_manager.filter(
+        pk=instance.pk
+    ).values(*fields).first()
+
+
+def _orbat_fields_changed(instance, fields):
+    previous = getattr(instance, '_previous_orbat_fields', None)
+    return previous is not None and any(previous[field] != getattr(instance, field) for field in fields)
+
+
+def _invalidate_rank_holder_orbat(rank):
+    orbat_cache.invalidate_units(
+        UserPosition.objects.filter(
+            user__current_rank=rank,
+            status='active'
+        ).values_list('position__unit_id', flat=True).distinct()
+    )
+
+
+@receiver(pre_save, sender=Rank)
+def track_rank_orbat_fields(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw:
+        _remember_orbat_fields(instance, ORBAT_RANK_FIELDS, update_fields)
+
+
+@receiver(post_save, sender=Rank)
+def invalidate_rank_orbat(sender, instance, raw=False, **kwargs):
+    """Rank names and insignia are shown on every position held at that rank"""
+    if raw or not _orbat_fields_changed(instance, ORBAT_RANK_FIELDS):
+        return
+    _invalidate_rank_holder_orbat(instance)
+
+
+@receiver(pre_delete, sender=Rank)
+def invalidate_deleted_rank_orbat(sender, instance, **kwargs):
+    """Runs before the holders' current_rank is cleared, while they can still be found"""
+    _invalidate_rank_holder_orbat(instance)
+
+
+@receiver(pre_save, sender=Branch)
+def track_branch_orbat_fields(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw:
+        _remember_orbat_fields(instance, ORBAT_BRANCH_FIELDS, update_fields)
+
+
+@receiver(post_save, sender=Branch)
+def invalidate_branch_orbat(sender, instance, raw=False, **kwargs):
+    """The branch name is shown on the branch's units and their positions"""
+    if raw or not _orbat_fields_changed(instance, ORBAT_BRANCH_FIELDS):
+        return
+    orbat_cache.invalidate_units(Unit.objects.filter(branch=instance).values_list('id', flat=True))
+
+
+@receiver(pre_save, sender=settings.AUTH_USER_MODEL)
+def track_holder_orbat_fields(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw:
+        _remember_orbat_fields(instance, ORBAT_HOLDER_FIELDS, update_fields)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_holder_orbat(sender, instance, raw=False, **kwargs):
+    """A promotion or profile change shows on every position the user holds"""
+    if raw:
+        return
+    if not (getattr(instance, '_rank_changed', False) or _orbat_fields_changed(instance, ORBAT_HOLDER_FIELDS)):
+        return
+    orbat_cache.invalidate_units(
+        UserPosition.objects.filter(
+            user=instance,
+            status='active'
+        ).values_list('position__unit_id', flat=True).distinct()
+    )
+
+
+# Promotion progress freshness
+
+@receiver(post_save, sender='events.EventAttendance')
+@receiver(post_delete, sender='events.EventAttendance')
+@receiver(post_save, sender='training.UserCertificate')
+@receiver(post_delete, sender='training.UserCertificate')
+@receiver(post_save, sender=UserPosition)
+@receiver(post_delete, sender=UserPosition)
+@receiver(post_save, sender=UserRankHistory)
+@receiver(post_delete, sender=UserRankHistory)
+@receiver(post_save, sender=PromotionWaiver)
+@receiver(post_delete, sender=PromotionWaiver)
+def mark_user_progress_stale(sender, instance, raw=False, **kwargs):
+    """An input to the user's promotion evaluation changed"""
+    if raw:
+        return
+    UserPromotionProgress.objects.filter(user_id=instance.user_id).mark_stale()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def mark_promoted_user_progress_stale(sender, instance, raw=False, **kwargs):
+    if raw or not getattr(instance, '_rank_changed', False):
+        return
+    UserPromotionProgress.objects.filter(user_id=instance.pk).mark_stale()
+
+
+@receiver(post_save, sender=RankPromotionRequirement)
+@receiver(post_delete, sender=RankPromotionRequirement)
+def mark_rank_progress_stale(sender, instance, raw=False, **kwargs):
+    """Requirement definitions changed for everyone working toward the rank"""
+    if raw:
+        return
+    UserPromotionProgress.objects.filter(next_rank_id=instance.rank_id).mark_stale()
+
+
+# Rank ladder
+
+@receiver(post_save, sender=Rank)
+@receiver(post_delete, sender=Rank)
+@receiver(post_save, sender=Branch)
+@receiver(post_delete, sender=Branch)
+def invalidate_rank_ladder(sender, raw=False, **kwargs):
+    if raw:
+        return
+    transaction.on_commit(rank_ladder.invalidate)
+
+
+# Recruitment availability
+
+@receiver(post_save, sender=RecruitmentSlot)
+@receiver(post_delete, sender=RecruitmentSlot)
+def invalidate_slot_recruitment(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    recruitment.invalidate_branches(
+        Unit.objects.filter(id=instance.unit_id).values_list('branch_id', flat=True)
+    )
+
+
+@receiver(post_save, sender=Unit)
+@receiver(post_delete, sender=Unit)
+def invalidate_unit_recruitment(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    recruitment.invalidate_branches(
+        {instance.branch_id, getattr(instance, '_previous_branch_id', instance.branch_id)}
+    )
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_save, sender=Rank)
+def invalidate_role_recruitment(sender, instance, raw=False, **kwargs):
+    """Role and rank names are shown on slots in every branch"""
+    if raw:
+        return
+    recruitment.invalidate_branches()
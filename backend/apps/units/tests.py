@@ -0,0 +1,536 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.core.testing import QueryBudgetTestMixin
+from apps.users.models import User
+
+from . import orbat_cache
+from .models import Branch, Position, Rank, RecruitmentSlot, Role, Unit, UnitClosure, UserPosition
+from .rank_ladder import get_ladder
+from .serializers_promotion import PromoteUserSerializer
+from .views import UnitViewSet
+from .views_positions import PositionViewSet
+
+
+class UnitClosureTests(TestCase):
+
+    def setUp(self):
+        self.branch = Branch.objects.create(name='Army', abbreviation='A')
+        # battalion > company > platoon > squad, and a second company
+        self.battalion = self.create_unit('Battalion')
+        self.company = self.create_unit('Company', self.battalion)
+        self.platoon = self.create_unit('Platoon', self.company)
+        self.squad = self.create_unit('Squad', self.platoon)
+        self.other = self.create_unit('Other Company', self.battalion)
+
+    def create_unit(self, name, parent=None):
+        return Unit.objects.create(name=name, abbreviation=name[:3].upper(), branch=self.branch, parent_unit=parent)
+
+    def links(self):
+        return set(UnitClosure.objects.values_list('ancestor_id', 'descendant_id', 'depth'))
+
+    def assertMatchesRebuild(self):
+        incremental = self.links()
+        UnitClosure.objects.rebuild()
+        self.assertEqual(incremental, self.links())
+
+    def ancestors(self, unit):
+        return set(UnitClosure.objects.filter(descendant=unit).values_list('ancestor_id', 'depth'))
+
+    def test_new_units_are_linked_to_every_ancestor(self):
+        self.assertEqual(self.ancestors(self.squad), {
+            (self.squad.id, 0), (self.platoon.id, 1), (self.company.id, 2), (self.battalion.id, 3)
+        })
+        self.assertMatchesRebuild()
+
+    def test_moving_a_unit_moves_its_subtree(self):
+        self.platoon.parent_unit = self.other
+        self.platoon.save()
+
+        self.assertEqual(self.ancestors(self.squad), {
+            (self.squad.id, 0), (self.platoon.id, 1), (self.other.id, 2), (self.battalion.id, 3)
+        })
+        self.assertEqual(set(Unit.objects.descendants(self.company)), set())
+        self.assertEqual(set(Unit.objects.descendants(self.other)), {self.platoon, self.squad})
+        self.assertMatchesRebuild()
+
+        self.platoon.parent_unit = None
+        self.platoon.save()
+        self.assertEqual(self.ancestors(self.squad), {(self.squad.id, 0), (self.platoon.id, 1)})
+        self.assertMatchesRebuild()
+
+    def test_unit_cannot_be_moved_under_its_own_subtree(self):
+        before = self.links()
+
+        for parent in (self.squad, self.company):
+            self.company.parent_unit = parent
+            with self.assertRaises(ValidationError):
+                self.company.save()
+
+        self.company.refresh_from_db()
+        self.assertEqual(self.company.parent_unit, self.battalion)
+        self.assertEqual(self.links(), before)
+
+    def test_deleting_a_unit_detaches_its_subunits(self):
+        self.company.delete()
+
+        self.platoon.refresh_from_db()
+        self.assertIsNone(self.platoon.parent_unit)
+        self.assertEqual(self.ancestors(self.squad), {(self.squad.id, 0), (self.platoon.id, 1)})
+        self.assertEqual(set(Unit.objects.descendants(self.battalion)), {self.other})
+        self.assertMatchesRebuild()
+
+    def test_rebuild_matches_incremental_maintenance(self):
+        extra = self.create_unit('Extra', self.squad)
+        self.squad.parent_unit = self.other
+        self.squad.save()
+        self.other.parent_unit = self.platoon
+        self.other.save()
+        self.platoon.delete()
+        self.create_unit('Late', extra)
+
+        self.assertMatchesRebuild()
+
+
+class TreeQueryCountTests(TestCase):
+    """The structure and chain-of-command trees are built in a fixed number of queries"""
+
+    # Session and user lookups made by the authentication middleware
+    AUTH_QUERIES = 2
+
+    def setUp(self):
+        self.branch = Branch.objects.create(name='Army', abbreviation='A')
+        self.command_role = Role.objects.create(name='CO', category='command', is_command_role=True)
+        self.leader_role = Role.objects.create(name='PL', category='command')
+        rank = Rank.objects.create(name='Captain', abbreviation='CPT', branch=self.branch, tier=3)
+        self.user = User.objects.create_user(discord_id='1', username='co', current_rank=rank)
+        self.client.force_login(self.user)
+
+        self.root = Unit.objects.create(name='Root', abbreviation='R', branch=self.branch)
+        self.top = Position.objects.create(unit=self.root, role=self.command_role)
+        UserPosition.objects.create(user=self.user, position=self.top)
+
+    def add_subtrees(self, count):
+        start = Unit.objects.filter(parent_unit=self.root).count()
+        for i in range(start, start + count):
+            unit = Unit.objects.create(
+                name=f'Unit {i}', abbreviation=f'U{i}', branch=self.branch, parent_unit=self.root
+            )
+            Unit.objects.create(name=f'Sub {i}', abbreviation=f'S{i}', branch=self.branch, parent_unit=unit)
+            leader = Position.objects.create(
+                unit=unit, role=self.leader_role, parent_position=self.top, identifier=f'L{i}'
+            )
+            Position.objects.create(
+                unit=unit, role=self.leader_role, parent_position=leader, identifier=f'A{i}'
+            )
+
+    def test_structure_query_count(self):
+        for count in (1, 10):
+            self.add_subtrees(count)
+            with self.assertNumQueries(self.AUTH_QUERIES + 1):
+                response = self.client.get('/api/units/structure/')
+            self.assertEqual(response.status_code, 200)
+
+        root = next(unit for unit in response.json() if unit['name'] == 'Root')
+        self.assertEqual(len(root['subunits']), 11)
+
+    def test_chain_of_command_query_count(self):
+        for count in (1, 10):
+            self.add_subtrees(count)
+            with self.assertNumQueries(self.AUTH_QUERIES + 2):
+                response = self.client.get('/api/units/positions/chain_of_command/')
+            self.assertEqual(response.status_code, 200)
+
+        top, = response.json()
+        self.assertEqual(top['holder']['rank'], 'CPT')
+        self.assertEqual(len(top['subordinates']), 11)
+
+
+class PositionListQueryBudgetTests(QueryBudgetTestMixin, TestCase):
+
+    def test_list_is_within_budget(self):
+        branch = Branch.objects.create(name='Army', abbreviation='A')
+        role = Role.objects.create(name='Rifleman', category='trooper')
+        rank = Rank.objects.create(name='Private', abbreviation='PVT', branch=branch, tier=1)
+        user = User.objects.create_user(discord_id='1', username='viewer')
+        self.client.force_login(user)
+        for i in range(6):
+            unit = Unit.objects.create(name=f'Squad {i}', abbreviation=f'S{i}', branch=branch)
+            position = Position.objects.create(unit=unit, role=role, identifier=str(i))
+            if i % 2:
+                holder = User.objects.create_user(discord_id=f'h{i}', username=f'holder{i}', current_rank=rank)
+                UserPosition.objects.create(user=holder, position=position)
+
+        with self.assertWithinQueryBudget(PositionViewSet, 'list'):
+            response = self.client.get('/api/units/positions/')
+        self.assertEqual(response.status_code, 200)
+
+        holders = [position['current_holder'] for position in response.json()['results']]
+        self.assertEqual(len(holders), 6)
+        self.assertEqual(sum(holder is not None for holder in holders), 3)
+        self.assertEqual({holder['rank'] for holder in holders if holder}, {'PVT'})
+
+
+class UnitListQueryBudgetTests(QueryBudgetTestMixin, TestCase):
+
+    def setUp(self):
+        self.branch = Branch.objects.create(name='Army', abbreviation='A')
+        self.role = Role.objects.create(name='Rifleman', category='trooper')
+        self.rank = Rank.objects.create(name='Private', abbreviation='PVT', branch=self.branch, tier=1)
+        self.client.force_login(User.objects.create_user(discord_id='1', username='viewer'))
+
+    def add_units(self, count):
+        start = Unit.objects.count()
+        for i in range(start, start + count):
+            unit = Unit.objects.create(name=f'Company {i}', abbreviation=f'C{i}', branch=self.branch)
+            Unit.objects.create(name=f'Platoon {i}', abbreviation=f'P{i}', branch=self.branch, parent_unit=unit)
+            filled = Position.objects.create(unit=unit, role=self.role, identifier='1')
+            Position.objects.create(unit=unit, role=self.role, identifier='2')
+            Position.objects.create(unit=unit, role=self.role, identifier='3', is_active=False)
+            holder = User.objects.create_user(discord_id=f'h{i}', username=f'holder{i}', current_rank=self.rank)
+            UserPosition.objects.create(user=holder, position=filled)
+
+    def test_list_is_within_budget(self):
+        for count in (1, 5):
+            self.add_units(count)
+            with self.assertWithinQueryBudget(UnitViewSet, 'list'):
+                response = self.client.get('/api/units/')
+            self.assertEqual(response.status_code, 200)
+
+        company = next(unit for unit in response.json()['results'] if unit['name'] == 'Company 0')
+        self.assertEqual(len(company['positions']), 2)
+        holders = {
+            position['display_title']: position['current_holder'] for position in company['positions']
+        }
+        self.assertEqual(holders['1 Rifleman']['username'], 'holder0')
+        self.assertIsNone(holders['2 Rifleman'])
+        self.assertEqual(
+            [(member['username'], member['rank'], member['position']) for member in company['personnel']],
+            [('holder0', 'PVT', '1 Rifleman')]
+        )
+        self.assertEqual(len(company['subunits']), 1)
+
+
+
+class ServedDaysTests(TestCase):
+
+    START = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+
+    def setUp(self):
+        branch = Branch.objects.create(name='Army', abbreviation='A')
+        self.unit = Unit.objects.create(name='Company', abbreviation='CO', branch=branch)
+        self.nco = Role.objects.create(name='Sergeant', category='nco', is_nco_role=True)
+        self.command = Role.objects.create(name='Commander', category='command', is_command_role=True)
+        self.trooper = Role.objects.create(name='Rifleman', category='trooper')
+        self.alice = User.objects.create_user(discord_id='1', username='alice')
+        self.bob = User.objects.create_user(discord_id='2', username='bob')
+
+    def day(self, number):
+        return self.START + timedelta(days=number)
+
+    def assign(self, user, role, start, end=None):
+        """An assignment from day start to day end (open when end is None)"""
+        position = Position.objects.create(unit=self.unit, role=role, identifier=str(Position.objects.count()))
+        assignment = UserPosition.objects.create(user=user, position=position)
+        # assignment_date is auto_now_add, so it can only be backdated with an update
+        UserPosition.objects.filter(pk=assignment.pk).update(
+            assignment_date=self.day(start), end_date=self.day(end) if end is not None else None
+        )
+
+    def served_days(self, *group_by, now=None):
+        return UserPosition.objects.all().served_days(*group_by, now=now or self.day(1000))
+
+    def test_overlapping_assignments_are_counted_once(self):
+        self.assign(self.alice, self.nco, 0, 10)
+        self.assign(self.alice, self.command, 5, 15)
+
+        self.assertEqual(self.served_days(), {self.alice.id: 15})
+
+    def test_nested_assignment_adds_nothing(self):
+        self.assign(self.alice, self.nco, 0, 30)
+        self.assign(self.alice, self.command, 10, 20)
+
+        self.assertEqual(self.served_days(), {self.alice.id: 30})
+
+    def test_back_to_back_and_separate_assignments_are_added(self):
+        self.assign(self.alice, self.nco, 0, 10)
+        self.assign(self.alice, self.command, 10, 20)
+        self.assign(self.alice, self.trooper, 30, 35)
+
+        self.assertEqual(self.served_days(), {self.alice.id: 25})
+
+    def test_open_assignment_runs_until_now(self):
+        self.assign(self.alice, self.nco, 0)
+        self.assign(self.alice, self.command, 5, 8)
+
+        self.assertEqual(self.served_days(now=self.day(40)), {self.alice.id: 40})
+        # Started after now: counts as nothing rather than negative time
+        self.assertEqual(self.served_days(now=self.day(-5)), {self.alice.id: 3})
+
+    def test_totals_are_grouped_by_each_key(self):
+        self.assign(self.alice, self.nco, 0, 10)
+        self.assign(self.alice, self.nco, 5, 20)
+        self.assign(self.alice, self.trooper, 0, 50)
+        self.assign(self.bob, self.nco, 0, 7)
+
+        self.assertEqual(self.served_days('user_id'), {self.alice.id: 50, self.bob.id: 7})
+        self.assertEqual(self.served_days('user_id', 'position__role__category'), {
+            (self.alice.id, 'nco'): 20,
+            (self.alice.id, 'trooper'): 50,
+            (self.bob.id, 'nco'): 7,
+        })
+
+    def test_leadership_days_match_the_per_assignment_sum_without_overlaps(self):
+        self.assign(self.alice, self.nco, 0, 10)
+        self.assign(self.alice, self.command, 20, 45)
+        self.assign(self.alice, self.trooper, 50, 100)
+        self.assign(self.bob, self.command, 3, 9)
+        self.assign(self.bob, self.nco, 100)
+
+        now = self.day(130)
+        leadership = UserPosition.objects.leadership()
+        # The Python loop served_days replaced: (end - start).days summed per assignment
+        expected = {}
+        for assignment in leadership:
+            end = assignment.end_date or now
+            expected[assignment.user_id] = expected.get(assignment.user_id, 0) + (end - assignment.assignment_date).days
+
+        self.assertEqual(expected, {self.alice.id: 35, self.bob.id: 36})
+        self.assertEqual(leadership.served_days('user_id', now=now), expected)
+
+
+class RecruitmentSlotTests(TestCase):
+
+    def setUp(self):
+        branch = Branch.objects.create(name='Army', abbreviation='A')
+        unit = Unit.objects.create(name='Company', abbreviation='CO', branch=branch)
+        self.riflemen = RecruitmentSlot.objects.create(
+            unit=unit, role=Role.objects.create(name='Rifleman', category='trooper'),
+            career_track='enlisted', total_slots=3
+        )
+        self.medics = RecruitmentSlot.objects.create(
+            unit=unit, role=Role.objects.create(name='Medic', category='specialist'),
+            career_track='enlisted', total_slots=1
+        )
+
+    def assertCounts(self, slot, filled, reserved):
+        slot.refresh_from_db()
+        self.assertEqual((slot.filled_slots, slot.reserved_slots), (filled, reserved))
+
+    def test_reserve_and_fill_stop_at_capacity(self):
+        self.assertEqual(RecruitmentSlot.objects.reserve(self.riflemen.id, 2), {
+            'total_slots': 3, 'filled_slots': 0, 'reserved_slots': 2, 'available_slots': 1
+        })
+        self.assertIsNone(RecruitmentSlot.objects.reserve(self.riflemen.id, 2))
+        self.assertEqual(RecruitmentSlot.objects.fill(self.riflemen.id)['available_slots'], 0)
+        self.assertIsNone(RecruitmentSlot.objects.fill(self.riflemen.id))
+        self.assertIsNone(RecruitmentSlot.objects.reserve(self.riflemen.id))
+        self.assertCounts(self.riflemen, filled=1, reserved=2)
+
+    def test_fill_from_reserved_needs_a_reservation(self):
+        self.assertIsNone(RecruitmentSlot.objects.fill(self.riflemen.id, from_reserved=True))
+        self.assertCounts(self.riflemen, filled=0, reserved=0)
+
+        RecruitmentSlot.objects.reserve(self.riflemen.id)
+        counts = RecruitmentSlot.objects.fill(self.riflemen.id, from_reserved=True)
+        self.assertEqual((counts['filled_slots'], counts['reserved_slots']), (1, 0))
+        self.assertIsNone(RecruitmentSlot.objects.release(self.riflemen.id))
+
+    def test_batch_rolls_back_every_slot_when_one_operation_fails(self):
+        self.client.force_login(User.objects.create_superuser(discord_id='1', username='admin'))
+
+        response = self.client.post('/api/units/recruitment/slots/batch/', {'operations': [
+            {'slot': str(self.riflemen.id), 'operation': 'reserve', 'count': 2},
+            {'slot': str(self.medics.id), 'operation': 'fill'},
+            {'slot': str(self.medics.id), 'operation': 'reserve'},
+        ]}, content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['index'], 2)
+        self.assertCounts(self.riflemen, filled=0, reserved=0)
+        self.assertCounts(self.medics, filled=0, reserved=0)
+
+        response = self.client.post('/api/units/recruitment/slots/batch/', {'operations': [
+            {'slot': str(self.riflemen.id), 'operation': 'reserve', 'count': 2},
+            {'slot': str(self.medics.id), 'operation': 'fill'},
+        ]}, content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result['available_slots'] for result in response.json()['results']], [1, 0]
+        )
+        self.assertCounts(self.riflemen, filled=0, reserved=2)
+        self.assertCounts(self.medics, filled=1, reserved=0)
+
+
+class UnitSparseFieldsetTests(TestCase):
+
+    # Session and user lookups made by the authentication middleware
+    AUTH_QUERIES = 2
+    EXPANDABLE = {'subunits', 'positions', 'personnel', 'statistics', 'authorized_mos', 'mos_requirements'}
+
+    def setUp(self):
+        branch = Branch.objects.create(name='Army', abbreviation='A')
+        role = Role.objects.create(name='Rifleman', category='trooper')
+        rank = Rank.objects.create(name='Private', abbreviation='PVT', branch=branch, tier=1)
+        self.client.force_login(User.objects.create_user(discord_id='1', username='viewer'))
+
+        self.unit = Unit.objects.create(name='Company', abbreviation='CO', branch=branch)
+        Unit.objects.create(name='Platoon', abbreviation='PLT', branch=branch, parent_unit=self.unit)
+        position = Position.objects.create(unit=self.unit, role=role, identifier='1')
+        holder = User.objects.create_user(discord_id='2', username='holder', current_rank=rank)
+        UserPosition.objects.create(user=holder, position=position)
+
+    def get_unit(self, query=''):
+        response = self.client.get(f'/api/units/{self.unit.id}/{query}')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_default_response_is_unchanged(self):
+        full = self.get_unit()
+
+        self.assertLessEqual(self.EXPANDABLE, set(full))
+        self.assertEqual(full, self.get_unit('?expand=' + ','.join(sorted(self.EXPANDABLE))))
+        self.assertEqual(full['personnel'][0]['username'], 'holder')
+
+    def test_bare_expand_skips_expensive_fields_and_their_queries(self):
+        with CaptureQueriesContext(connection) as full:
+            self.get_unit()
+        # The unit and its two MOS lists
+        with self.assertNumQueries(self.AUTH_QUERIES + 3):
+            data = self.get_unit('?expand=')
+
+        self.assertGreater(len(full), self.AUTH_QUERIES + 3)
+        self.assertFalse(self.EXPANDABLE & set(data))
+        self.assertEqual(data['name'], 'Company')
+        self.assertEqual(data['branch']['name'], 'Army')
+        self.assertEqual(self.EXPANDABLE & set(self.get_unit('?expand=positions')), {'positions'})
+
+    def test_unknown_names_are_ignored(self):
+        self.assertEqual(set(self.get_unit('?fields=name,bogus')), {'name'})
+        self.assertEqual(self.EXPANDABLE & set(self.get_unit('?expand=bogus,statistics')), {'statistics'})
+
+class PromoteUserSerializerTests(TestCase):
+
+    def test_rank_missing_from_ladder_is_found_in_database(self):
+        branch = Branch.objects.create(name='Army', abbreviation='A')
+        private = Rank.objects.create(name='Private', abbreviation='PVT', branch=branch, tier=1, is_enlisted=True)
+        user = User.objects.create_user(discord_id='1', username='pvt', branch=branch, current_rank=private)
+        ladder = get_ladder()
+        # Created behind the ladder's back, as another worker process would
+        corporal, = Rank.objects.bulk_create([
+            Rank(name='Corporal', abbreviation='CPL', branch=branch, tier=2, is_enlisted=True)
+        ])
+        self.assertIsNone(ladder.get(corporal.id))
+
+        serializer = PromoteUserSerializer(data={'user_id': user.id, 'new_rank_id': corporal.id})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data['new_rank'], corporal)
+
+
+class ORBATSnapshotTests(TestCase):
+
+    # Session and user lookups made by the authentication middleware
+    AUTH_QUERIES = 2
+
+    def setUp(self):
+        cache.clear()
+        self.branch = Branch.objects.create(name='Army', abbreviation='A')
+        self.role = Role.objects.create(name='Rifleman', category='trooper')
+        self.rank = Rank.objects.create(name='Private', abbreviation='PVT', branch=self.branch, tier=1)
+        self.client.force_login(User.objects.create_user(discord_id='1', username='viewer'))
+
+        self.root = Unit.objects.create(name='Battalion', abbreviation='BN', branch=self.branch)
+        self.company = Unit.objects.create(
+            name='Company', abbreviation='CO', branch=self.branch, parent_unit=self.root
+        )
+        self.platoon = Unit.objects.create(
+            name='Platoon', abbreviation='PLT', branch=self.branch, parent_unit=self.company
+        )
+        self.sibling = Unit.objects.create(
+            name='Other Company', abbreviation='OC', branch=self.branch, parent_unit=self.root
+        )
+        self.holder = User.objects.create_user(discord_id='2', username='holder', current_rank=self.rank)
+        position = Position.objects.create(unit=self.platoon, role=self.role, identifier='1')
+        UserPosition.objects.create(user=self.holder, position=position)
+
+    def get_orbat(self, unit, include_subunits=True, etag=None):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return self.client.get(
+            '/api/units/orbat/unit_orbat/',
+            {'unit_id': str(unit.id), 'include_subunits': str(include_subunits).lower()},
+            **headers
+        )
+
+    def etags(self, *requests):
+        return [self.get_orbat(*request)['ETag'] for request in requests]
+
+    def test_matching_etag_gets_not_modified(self):
+        response = self.get_orbat(self.root)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['statistics']['units_included'], 4)
+        etag = response['ETag']
+
+        with self.assertNumQueries(self.AUTH_QUERIES):
+            cached = self.get_orbat(self.root)
+        self.assertEqual((cached.status_code, cached['ETag']), (200, etag))
+        self.assertEqual(cached.content, response.content)
+
+        with self.assertNumQueries(self.AUTH_QUERIES):
+            not_modified = self.get_orbat(self.root, etag=etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], etag)
+        self.assertEqual(not_modified.content, b'')
+
+        self.assertEqual(self.get_orbat(self.root, etag='"stale"').status_code, 200)
+
+    def test_change_invalidates_the_ancestor_chain_only(self):
+        requests = [(self.root,), (self.company,), (self.platoon,), (self.sibling,), (self.root, False)]
+        before = self.etags(*requests)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Position.objects.create(unit=self.platoon, role=self.role, identifier='2')
+
+        after = self.etags(*requests)
+        changed = [old != new for old, new in zip(before, after)]
+        self.assertEqual(changed, [True, True, True, False, False])
+
+    def test_display_changes_invalidate_the_holders_units(self):
+        etag = self.get_orbat(self.platoon)['ETag']
+
+        def assertInvalidated(edit, expected=True):
+            nonlocal etag
+            with self.captureOnCommitCallbacks(execute=True):
+                edit()
+            new_etag = self.get_orbat(self.platoon)['ETag']
+            self.assertEqual(new_etag != etag, expected)
+            etag = new_etag
+
+        self.rank.abbreviation = 'PV1'
+        assertInvalidated(self.rank.save)
+        self.rank.tier = 2
+        assertInvalidated(self.rank.save, expected=False)
+        self.branch.name = 'Land Forces'
+        assertInvalidated(self.branch.save)
+        self.holder.avatar_url = 'https://example.com/avatar.png'
+        assertInvalidated(self.holder.save)
+        self.holder.username = 'renamed'
+        assertInvalidated(self.holder.save)
+        self.assertEqual(self.get_orbat(self.platoon).json()['nodes'][0]['current_holder']['username'], 'renamed')
+
+    def test_snapshot_built_across_an_invalidation_is_not_stored(self):
+        version = orbat_cache.snapshot_version(self.platoon.id, True)
+        with self.captureOnCommitCallbacks(execute=True):
+            orbat_cache.invalidate_units({self.platoon.id})
+
+        orbat_cache.store_snapshot(self.platoon.id, True, b'{}', version)
+
+        current = orbat_cache.snapshot_version(self.platoon.id, True)
+        self.assertNotEqual(current, version)
+        self.assertIsNone(orbat_cache.get_snapshot(self.platoon.id, True, current))
+        self.assertIsNone(orbat_cache.get_snapshot(self.platoon.id, True, version))
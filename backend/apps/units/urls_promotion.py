@@ -10,6 +10,7 @@ from .views_promotion import (
     UserPromotionProgressView,
     PromotionChecklistView,
     PromoteUserView,
+    PromotionEligibilityView,
     RankHistoryViewSet,
     PromotionWaiverViewSet
 )
@@ -32,6 +33,9 @@ urlpatterns = [
 
     # Promote user
     path('promote/', PromoteUserView.as_view(), name='promote-user'),
+
+    # Bulk eligibility list for promotion boards
+    path('eligibility/', PromotionEligibilityView.as_view(), name='promotion-eligibility'),
 ]
 
 # Add this to backend/config/urls.py:
@@ -1,21 +1,29 @@
+from datetime import date, timedelta
+
 from rest_framework import viewsets, permissions, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from django.db.models import Prefetch, Q
 from django.shortcuts import get_object_or_404
-from .models import Branch, Rank, Unit, Position, UserPosition
+from django.utils import timezone
+from .models import Branch, Rank, Unit, Position, UserPosition, UnitStrengthReport
 from .serializers import (
     BranchSerializer, RankSerializer, UnitListSerializer, UnitDetailSerializer,
     PositionSerializer, UserPositionSerializer, UnitMemberSerializer,
-    UnitHierarchySerializer, ChainOfCommandSerializer
+    UnitHierarchySerializer, group_by_parent
 )
+from .rank_ladder import get_progression
 from apps.users.views import IsAdminOrReadOnly
 from django.contrib.auth import get_user_model
 from django.core.files.storage import default_storage  # Add this import
 import traceback  # Add this for better error handling
 from rest_framework import viewsets, permissions, status
-from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from apps.core.cache import cached_response
+from apps.core.renderers import ORJSONParser
+from apps.core.serializers import requested_fields
 from apps.core.views import MediaContextMixin
 from .models import Rank
 from .serializers import RankSerializer, RankCreateUpdateSerializer
@@ -29,10 +37,18 @@ class BranchViewSet(viewsets.ModelViewSet):
     serializer_class = BranchSerializer
     permission_classes = [IsAdminOrReadOnly]
 
+    @cached_response(tags=[Branch])
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cached_response(tags=[Branch])
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     @action(detail=True, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def units(self, request, pk=None):
         branch = self.get_object()
-        units = Unit.objects.filter(branch=branch)
+        units = Unit.objects.with_summary().filter(branch=branch)
         serializer = UnitListSerializer(units, many=True)
         return Response(serializer.data)
 
@@ -58,7 +74,7 @@ class RankViewSet(MediaContextMixin, viewsets.ModelViewSet):
     queryset = Rank.objects.all().order_by('branch', 'tier')
     permission_classes = [IsAdminOrReadOnly]
     filterset_fields = ['branch', 'is_officer', 'is_enlisted', 'is_warrant']
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, ORJSONParser]
 
     def get_serializer_class(self):
         """Use different serializers for different actions"""
@@ -66,6 +82,14 @@ class RankViewSet(MediaContextMixin, viewsets.ModelViewSet):
             return RankCreateUpdateSerializer
         return RankSerializer
 
+    @cached_response(tags=[Rank, Branch])
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cached_response(tags=[Rank, Branch])
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAdminUser])
     def upload_insignia(self, request, pk=None):
         """Upload insignia image for a specific rank"""
@@ -106,26 +130,63 @@ class RankViewSet(MediaContextMixin, viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def progression(self, request):
         """Get rank progression path for all branches."""
-        branches = Branch.objects.all()
-        result = {}
-
-        for branch in branches:
-            enlisted_ranks = Rank.objects.filter(branch=branch, is_enlisted=True).order_by('tier')
-            officer_ranks = Rank.objects.filter(branch=branch, is_officer=True).order_by('tier')
-            warrant_ranks = Rank.objects.filter(branch=branch, is_warrant=True).order_by('tier')
-
-            result[branch.name] = {
-                'enlisted': RankSerializer(enlisted_ranks, many=True).data,
-                'officer': RankSerializer(officer_ranks, many=True).data,
-                'warrant': RankSerializer(warrant_ranks, many=True).data
-            }
-
-        return Response(result)
+        return Response(get_progression())
 
 class UnitViewSet(viewsets.ModelViewSet):
     queryset = Unit.objects.all()
     permission_classes = [IsAdminOrReadOnly]
     filterset_fields = ['branch', 'parent_unit', 'is_active']
+    query_budgets = {'list': 13}
+    mos_fields = ['authorized_mos', 'primary_mos', 'mos_training_capability']
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ['list', 'retrieve']:
+            queryset = queryset.select_related('branch', 'parent_unit')
+            # Only load what the requested fields need
+            selected = requested_fields(
+                self.request,
+                ['statistics', 'subunits', 'positions', 'personnel', 'mos_requirements', *self.mos_fields],
+                UnitDetailSerializer.Meta.expandable_fields
+            )
+            if 'mos_requirements' in selected:
+                selected.update(self.mos_fields)
+            queryset = queryset.prefetch_related(*[field for field in self.mos_fields if field in selected])
+            if 'statistics' in selected:
+                queryset = queryset.select_related('strength')
+            if 'subunits' in selected:
+                queryset = queryset.prefetch_related(
+                    Prefetch(
+                        'subunits',
+                        queryset=Unit.objects.filter(is_active=True).with_summary(),
+                        to_attr='active_subunits'
+                    )
+                )
+            if 'positions' in selected:
+                queryset = queryset.prefetch_related(
+                    Prefetch(
+                        'positions',
+                        queryset=Position.objects.filter(is_active=True).with_holders(),
+                        to_attr='active_positions'
+                    )
+                )
+            if 'personnel' in selected:
+                queryset = queryset.prefetch_related(
+                    Prefetch(
+                        'positions',
+                        queryset=Position.objects.select_related('role').prefetch_related(
+                            Prefetch(
+                                'assignments',
+                                queryset=UserPosition.objects.filter(
+                                    status='active'
+                                ).select_related('user', 'user__current_rank'),
+                                to_attr='active_assignments'
+                            )
+                        ),
+                        to_attr='staffed_positions'
+                    )
+                )
+        return queryset
 
     def get_serializer_class(self):
         if self.action in ['list', 'retrieve']:
@@ -154,6 +215,43 @@ class UnitViewSet(viewsets.ModelViewSet):
         serializer = EventListSerializer(events, many=True)
         return Response(serializer.data)
 
+    @action(detail=True, methods=['get'], permission_classes=[permissions.IsAuthenticated])
+    def strength_history(self, request, pk=None):
+        """
+        Strength of the unit and its subunits over time, from the nightly reports.
+        Query params: start, end (YYYY-MM-DD, default last 90 days) and
+        interval (day, week or month; default day).
+        """
+        unit = self.get_object()
+
+        interval = request.query_params.get('interval', 'day')
+        if interval not in UnitStrengthReport.objects.INTERVALS:
+            return Response(
+                {'error': 'interval must be one of: day, week, month'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        end_date = timezone.localdate()
+        start_date = end_date - timedelta(days=90)
+        try:
+            if request.query_params.get('end'):
+                end_date = date.fromisoformat(request.query_params['end'])
+            if request.query_params.get('start'):
+                start_date = date.fromisoformat(request.query_params['start'])
+        except ValueError:
+            return Response(
+                {'error': 'start and end must be dates in YYYY-MM-DD format'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response({
+            'unit': unit.id,
+            'start': start_date,
+            'end': end_date,
+            'interval': interval,
+            'series': UnitStrengthReport.objects.history(unit, start_date, end_date, interval)
+        })
+
     @action(detail=True, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def hierarchy(self, request, pk=None):
         unit = self.get_object()
@@ -162,9 +260,12 @@ class UnitViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def structure(self, request):
-        # Get all top-level units (those without parent units)
-        top_units = Unit.objects.filter(parent_unit=None)
-        serializer = UnitHierarchySerializer(top_units, many=True)
+        # Top-level units (those without parent units) and every active unit, in one query
+        units = Unit.objects.filter(Q(parent_unit=None) | Q(is_active=True))
+        children = group_by_parent(units, 'parent_unit_id')
+        serializer = UnitHierarchySerializer(
+            children.get(None, []), many=True, context={'unit_children': children}
+        )
         return Response(serializer.data)
 
 
@@ -180,10 +281,3 @@ class PositionViewSet(viewsets.ModelViewSet):
         user_positions = UserPosition.objects.filter(position=position)
         serializer = UserPositionSerializer(user_positions, many=True)
         return Response(serializer.data)
-
-    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
-    def chain_of_command(self, request):
-        # Get top-level positions (those without parent positions)
-        top_positions = Position.objects.filter(parent_position=None, is_command_position=True)
-        serializer = ChainOfCommandSerializer(top_positions, many=True)
-        return Response(serializer.data)
\ No newline at end of file
@@ -29,6 +29,7 @@ class UnitHierarchyViewViewSet(viewsets.ModelViewSet):
             units = hierarchy_view.included_units.filter(is_active=True)
         else:
             units = Unit.objects.filter(is_active=True)
+        units = units.with_summary().with_positions()
 
         # Apply filters from view configuration
         if hierarchy_view.filter_config:
@@ -49,6 +50,9 @@ class UnitHierarchyViewViewSet(viewsets.ModelViewSet):
 
         custom_node_map = {cn.unit_id: cn for cn in custom_nodes}
 
+        units = list(units)
+        unit_ids = {unit.id for unit in units}
+
         for unit in units:
             # Use custom position if available
             if unit.id in custom_node_map:
@@ -61,7 +65,7 @@ class UnitHierarchyViewViewSet(viewsets.ModelViewSet):
             nodes.append(unit)
 
             # Create edges for parent-child relationships
-            if unit.parent_unit and unit.parent_unit in units:
+            if unit.parent_unit_id and unit.parent_unit_id in unit_ids:
                 edges.append({
                     'id': f'e{unit.parent_unit.id}-{unit.id}',
                     'source': str(unit.parent_unit.id),
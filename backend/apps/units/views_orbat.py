@@ -4,11 +4,18 @@ Complete ORBAT implementation for Django backend
 This provides the endpoints that the React ORBAT page expects
 """
 
+import uuid
+
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
-from django.db.models import Prefetch, Q, Count
+from django.db.models import Prefetch
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from apps.core.renderers import ORJSONRenderer
+from . import orbat_cache
 from .models import Unit, Position, UserPosition, Role
 from .serializers_orbat import ORBATNodeSerializer, ORBATUnitSerializer
 
@@ -47,10 +54,9 @@ class ORBATViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Get the unit
         try:
-            unit = Unit.objects.select_related('branch').get(id=unit_id)
-        except Unit.DoesNotExist:
+            unit_id = uuid.UUID(unit_id)
+        except ValueError:
             return Response(
                 {'error': 'Unit not found'},
                 status=status.HTTP_404_NOT_FOUND
@@ -58,19 +64,37 @@ class ORBATViewSet(viewsets.ViewSet):
 
         include_subunits = request.query_params.get('include_subunits', 'true').lower() == 'true'
 
+        # Serve the cached snapshot when the org chart hasn't changed
+        version = orbat_cache.snapshot_version(unit_id, include_subunits)
+        snapshot = orbat_cache.get_snapshot(unit_id, include_subunits, version)
+        if snapshot is None:
+            try:
+                unit = Unit.objects.select_related('branch').get(id=unit_id)
+            except Unit.DoesNotExist:
+                return Response(
+                    {'error': 'Unit not found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+            payload = ORJSONRenderer().render(self._build_unit_orbat(unit, include_subunits))
+            snapshot = orbat_cache.store_snapshot(unit_id, include_subunits, payload, version)
+
+        etag, payload = snapshot
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(payload, content_type='application/json')
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def _build_unit_orbat(self, unit, include_subunits):
+        """Build the nodes/edges/statistics payload for a unit"""
         # Get all units to include
         units_to_include = [unit]
         if include_subunits:
-            # Get all subunits recursively
-            def get_all_subunits(parent_unit):
-                subunits = list(Unit.objects.filter(parent_unit=parent_unit, is_active=True))
-                all_subunits = []
-                for subunit in subunits:
-                    all_subunits.append(subunit)
-                    all_subunits.extend(get_all_subunits(subunit))
-                return all_subunits
-
-            units_to_include.extend(get_all_subunits(unit))
+            # Get all subunits from the hierarchy index in one query
+            units_to_include.extend(Unit.objects.descendants(unit))
 
         # Get all positions for these units
         positions = Position.objects.filter(
@@ -198,7 +222,7 @@ class ORBATViewSet(viewsets.ViewSet):
             }
         }
 
-        return Response(response_data)
+        return response_data
 
     @action(detail=False, methods=['get'])
     def units_list(self, request):
@@ -211,20 +235,12 @@ class ORBATViewSet(viewsets.ViewSet):
         """
         units = Unit.objects.filter(
             is_active=True
-        ).select_related('branch').order_by('name')
-
-        # Annotate with position counts
-        units = units.annotate(
-            position_count=Count('positions', filter=Q(positions__is_active=True)),
-            filled_count=Count('positions', filter=Q(
-                positions__is_active=True,
-                positions__is_vacant=False
-            ))
-        )
+        ).select_related('branch', 'strength').order_by('name')
 
         # Serialize the data
         units_data = []
         for unit in units:
+            figures = unit.get_strength_figures()
             units_data.append({
                 'id': str(unit.id),
                 'name': unit.name,
@@ -232,9 +248,9 @@ class ORBATViewSet(viewsets.ViewSet):
                 'unit_type': unit.unit_type,
                 'branch_name': unit.branch.name if unit.branch else None,
                 'emblem_url': unit.emblem_url,
-                'position_count': unit.position_count,
-                'filled_count': unit.filled_count,
-                'parent_unit_id': str(unit.parent_unit.id) if unit.parent_unit else None
+                'position_count': figures['total_positions'],
+                'filled_count': figures['filled_positions'],
+                'parent_unit_id': str(unit.parent_unit_id) if unit.parent_unit_id else None
             })
 
         return Response(units_data)
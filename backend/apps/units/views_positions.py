@@ -11,7 +11,7 @@ from .models import Position, UserPosition
 from .serializers import (
     PositionListSerializer, PositionDetailSerializer,
     UserPositionSerializer, UserPositionCreateSerializer,
-    PositionCreateUpdateSerializer
+    PositionCreateUpdateSerializer, ChainOfCommandSerializer, group_by_parent
 )
 from apps.users.views import IsAdminOrReadOnly
 from datetime import datetime
@@ -29,6 +29,14 @@ class PositionViewSet(viewsets.ModelViewSet):
     ]
     search_fields = ['title', 'role__name', 'unit__name']
     ordering = ['unit__name', 'role__sort_order']
+    # Queries per request, authentication included (see apps.core.instrumentation)
+    query_budgets = {'list': 5}
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = queryset.select_related('unit').with_holders()
+        return queryset
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -337,6 +345,19 @@ class PositionViewSet(viewsets.ModelViewSet):
         serializer = UserPositionSerializer(assignments, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'], url_path='chain_of_command',
+            url_name='chain-of-command-tree', permission_classes=[permissions.IsAuthenticated])
+    def chain_of_command_tree(self, request):
+        """Get the full chain of command tree from the top-level command positions"""
+        positions = Position.objects.filter(
+            parent_position=None, role__is_command_role=True
+        ).with_subordinates().with_holders()
+        children = group_by_parent(positions, 'parent_position_id')
+        serializer = ChainOfCommandSerializer(
+            children.get(None, []), many=True, context={'position_children': children}
+        )
+        return Response(serializer.data)
+
     @action(detail=True, methods=['get'])
     def chain_of_command(self, request, pk=None):
         """Get chain of command for this position"""
@@ -15,11 +15,11 @@ from .models_promotion import (
 )
 from .serializers_promotion import (
     PromotionRequirementTypeSerializer, RankPromotionRequirementSerializer,
-    PromotionProgressSerializer, PromotionChecklistSerializer,
+    PromotionProgressSerializer, PromotionChecklistSerializer, PromotionEligibilitySerializer,
     UserRankHistorySerializer, PromotionWaiverSerializer,
     CreatePromotionWaiverSerializer, PromoteUserSerializer
 )
-from .models import Rank
+from .promotion_engine import evaluate_promotions, get_next_rank
 from apps.users.views import IsAdminOrReadOnly
 from django.contrib.auth import get_user_model
 
@@ -84,12 +84,14 @@ class UserPromotionProgressView(APIView):
         )
 
         # Update next rank if needed
-        if not progress.next_rank or created:
-            progress.next_rank = self._get_next_rank(user)
-            progress.save()
+        if not progress.next_rank and not created:
+            next_rank = self._get_next_rank(user)
+            if next_rank:
+                progress.next_rank = next_rank
+                progress.is_stale = True
 
-        # Evaluate requirements
-        progress.evaluate_requirements()
+        # Evaluate requirements only when inputs changed or the TTL ran out
+        progress.refresh_if_stale()
 
         # Serialize and return with context
         serializer = PromotionProgressSerializer(progress, context={'request': request})
@@ -97,54 +99,7 @@ class UserPromotionProgressView(APIView):
 
     def _get_next_rank(self, user):
         """Determine next eligible rank for user"""
-        if not user.current_rank:
-            # Get entry-level rank for user's branch
-            if user.branch:
-                return Rank.objects.filter(
-                    branch=user.branch,
-                    is_enlisted=True
-                ).order_by('tier').first()
-            return None
-
-        # Get next rank in progression
-        current_tier = user.current_rank.tier
-
-        # Determine career track
-        if user.current_rank.is_enlisted:
-            # Check if eligible for warrant or officer
-            if user.warrant_officer_candidate:
-                next_rank = Rank.objects.filter(
-                    branch=user.branch,
-                    is_warrant=True,
-                    tier__gt=current_tier
-                ).order_by('tier').first()
-            elif user.officer_candidate:
-                next_rank = Rank.objects.filter(
-                    branch=user.branch,
-                    is_officer=True,
-                    tier__gt=current_tier
-                ).order_by('tier').first()
-            else:
-                # Continue enlisted progression
-                next_rank = Rank.objects.filter(
-                    branch=user.branch,
-                    is_enlisted=True,
-                    tier__gt=current_tier
-                ).order_by('tier').first()
-        else:
-            # Continue in current track
-            filters = {
-                'branch': user.branch,
-                'tier__gt': current_tier
-            }
-            if user.current_rank.is_warrant:
-                filters['is_warrant'] = True
-            else:
-                filters['is_officer'] = True
-
-            next_rank = Rank.objects.filter(**filters).order_by('tier').first()
-
-        return next_rank
+        return get_next_rank(user)
 
 
 class PromotionChecklistView(APIView):
@@ -166,8 +121,8 @@ class PromotionChecklistView(APIView):
                 'message': 'You have reached the highest rank available'
             })
 
-        # Evaluate requirements
-        progress.evaluate_requirements()
+        # Evaluate requirements only when inputs changed or the TTL ran out
+        progress.refresh_if_stale()
 
         # Build checklist
         checklist = []
@@ -378,6 +333,42 @@ class PromoteUserView(APIView):
         })
 
 
+class PromotionEligibilityView(APIView):
+    """
+    Eligibility list for promotion boards.
+    GET lists the stored results; POST re-evaluates members in bulk first.
+    Both accept branch_id; GET also accepts eligible_only=true.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        progress = UserPromotionProgress.objects.select_related(
+            'user', 'user__current_rank', 'next_rank'
+        ).filter(next_rank__isnull=False).order_by('-eligibility_percentage', 'user__username')
+
+        branch_id = request.query_params.get('branch_id')
+        if branch_id:
+            progress = progress.filter(user__branch_id=branch_id)
+        if request.query_params.get('eligible_only') == 'true':
+            progress = progress.filter(overall_eligible=True)
+
+        return Response(PromotionEligibilitySerializer(progress, many=True).data)
+
+    def post(self, request):
+        users = User.objects.filter(is_active=True)
+        branch_id = request.data.get('branch_id')
+        if branch_id:
+            users = users.filter(branch_id=branch_id)
+
+        progress = evaluate_promotions(users)
+
+        return Response({
+            'message': f'Evaluated {len(progress)} members',
+            'evaluated': len(progress),
+            'eligible': sum(1 for row in progress if row.overall_eligible)
+        })
+
+
 class RankHistoryViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for viewing rank history"""
     queryset = UserRankHistory.objects.all()
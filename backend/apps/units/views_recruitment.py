@@ -6,7 +6,7 @@ from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.db.models import Sum, F, Q
-from .models import Position, UserPosition, Unit, RecruitmentSlot
+from .models import Position, Unit, RecruitmentSlot
 from .serializers import (
     PositionListSerializer, PositionDetailSerializer,
     UserPositionSerializer, UserPositionCreateSerializer
@@ -205,7 +205,7 @@ class RecruitmentStatusViewSet(viewsets.ViewSet):
                 parent_unit=unit,
                 unit_level=subunit_type,
                 is_active=True
-            ).select_related('parent_unit').prefetch_related('recruitment_slots')
+            ).select_related('parent_unit', 'strength').prefetch_related('recruitment_slots')
 
             print(f"Found {subunits.count()} subunits with exact level match")
 
@@ -216,7 +216,7 @@ class RecruitmentStatusViewSet(viewsets.ViewSet):
                     parent_unit=unit,
                     unit_level__icontains=subunit_type,
                     is_active=True
-                ).select_related('parent_unit').prefetch_related('recruitment_slots')
+                ).select_related('parent_unit', 'strength').prefetch_related('recruitment_slots')
                 print(f"Found {subunits.count()} subunits with partial match")
         else:
             # Fallback - get any direct children
@@ -224,7 +224,7 @@ class RecruitmentStatusViewSet(viewsets.ViewSet):
             subunits = Unit.objects.filter(
                 parent_unit=unit,
                 is_active=True
-            ).select_related('parent_unit').prefetch_related('recruitment_slots')
+            ).select_related('parent_unit', 'strength').prefetch_related('recruitment_slots')
             print(f"Found {subunits.count()} direct child units")
 
         data = []
@@ -238,10 +238,7 @@ class RecruitmentStatusViewSet(viewsets.ViewSet):
             print(f"  - Available slots: {total_available}")
 
             # Get current strength
-            current_strength = UserPosition.objects.filter(
-                position__unit=subunit,
-                status='active'
-            ).count()
+            current_strength = subunit.get_strength_figures()['active_personnel']
             print(f"  - Current strength: {current_strength}")
 
             # Get unit leader
@@ -296,22 +293,6 @@ class RecruitmentStatusViewSet(viewsets.ViewSet):
 
     def _get_all_descendant_unit_ids(self, unit):
         """
-        Recursively get all descendant unit IDs
+        Get the unit and all of its descendant unit IDs
         """
-        descendant_ids = [unit.id]
-
-        # Get all descendants in a more efficient way
-        children = Unit.objects.filter(parent_unit=unit, is_active=True).values_list('id', flat=True)
-        descendant_ids.extend(children)
-
-        # Get grandchildren and beyond
-        current_level = list(children)
-        while current_level:
-            next_level = Unit.objects.filter(
-                parent_unit__id__in=current_level,
-                is_active=True
-            ).values_list('id', flat=True)
-            descendant_ids.extend(next_level)
-            current_level = list(next_level)
-
-        return descendant_ids
\ No newline at end of file
+        return Unit.objects.subtree_ids(unit)
@@ -3,6 +3,8 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import DataError, transaction
 from django.db.models import Sum, F, Q
 from .models import RecruitmentSlot, Unit
 from .serializers import (
@@ -72,6 +74,13 @@ class RecruitmentSlotViewSet(viewsets.ModelViewSet):
             }
         }, status=status.HTTP_201_CREATED if created_slots else status.HTTP_400_BAD_REQUEST)
 
+    def _slot_counts_response(self, slot, counts):
+        """Serialize `slot` with the counts returned by an atomic update"""
+        for field, value in counts.items():
+            if field != 'available_slots':
+                setattr(slot, field, value)
+        return Response(RecruitmentSlotSerializer(slot).data)
+
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAdminUser])
     def reserve_slots(self, request, pk=None):
         """Reserve slots for incoming personnel"""
@@ -84,16 +93,15 @@ class RecruitmentSlotViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        if count > slot.available_slots:
+        counts = RecruitmentSlot.objects.reserve(slot.id, count)
+        if counts is None:
+            slot.refresh_from_db(fields=['total_slots', 'filled_slots', 'reserved_slots'])
             return Response(
                 {'error': f'Cannot reserve {count} slots. Only {slot.available_slots} available'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        slot.reserved_slots += count
-        slot.save()
-
-        return Response(RecruitmentSlotSerializer(slot).data)
+        return self._slot_counts_response(slot, counts)
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAdminUser])
     def fill_slots(self, request, pk=None):
@@ -108,23 +116,66 @@ class RecruitmentSlotViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        if from_reserved:
-            if count > slot.reserved_slots:
-                return Response(
-                    {'error': f'Cannot fill {count} slots from reserved. Only {slot.reserved_slots} reserved'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            slot.reserved_slots -= count
-        elif count > slot.available_slots:
+        counts = RecruitmentSlot.objects.fill(slot.id, count, from_reserved=from_reserved)
+        if counts is None:
+            slot.refresh_from_db(fields=['total_slots', 'filled_slots', 'reserved_slots'])
+            if from_reserved:
+                error = f'Cannot fill {count} slots from reserved. Only {slot.reserved_slots} reserved'
+            else:
+                error = f'Cannot fill {count} slots. Only {slot.available_slots} available'
+            return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+
+        return self._slot_counts_response(slot, counts)
+
+    @action(detail=False, methods=['post'], permission_classes=[permissions.IsAdminUser])
+    def batch(self, request):
+        """
+        Apply several slot operations in one transaction, all or nothing.
+
+        Body: {"operations": [{"slot": id, "operation": "reserve" | "release" |
+        "fill" | "fill_reserved", "count": 1}, ...]}
+        """
+        operations = request.data.get('operations', [])
+        if not operations or not isinstance(operations, list):
             return Response(
-                {'error': f'Cannot fill {count} slots. Only {slot.available_slots} available'},
+                {'error': 'operations must be a non-empty list'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        slot.filled_slots += count
-        slot.save()
+        for idx, operation in enumerate(operations):
+            if (not isinstance(operation, dict)
+                    or operation.get('operation') not in RecruitmentSlot.objects.OPERATIONS
+                    or not operation.get('slot')
+                    or not isinstance(operation.get('count', 1), int)
+                    or operation.get('count', 1) <= 0):
+                return Response(
+                    {'error': 'Invalid operation', 'index': idx},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
 
-        return Response(RecruitmentSlotSerializer(slot).data)
+        # Lock slots in a fixed order so concurrent batches cannot deadlock
+        order = sorted(range(len(operations)), key=lambda idx: str(operations[idx]['slot']))
+        results = [None] * len(operations)
+
+        with transaction.atomic():
+            for idx in order:
+                operation = operations[idx]
+                try:
+                    counts = RecruitmentSlot.objects.apply(
+                        operation['slot'], operation['operation'], operation.get('count', 1)
+                    )
+                except (ValueError, DjangoValidationError, DataError):
+                    counts = None
+
+                if counts is None:
+                    transaction.set_rollback(True)
+                    return Response(
+                        {'error': f"Cannot {operation['operation']} slot {operation['slot']}", 'index': idx},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                results[idx] = {'id': operation['slot'], **counts}
+
+        return Response({'results': results})
 
 
 class UnitRecruitmentViewSet(viewsets.ViewSet):
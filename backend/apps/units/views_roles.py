@@ -7,11 +7,12 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from django.db.models import Count, Q
-from .models import Role, Position, UserPosition
+from .models import Branch, Rank, Role, Unit, Position, UserPosition
 from .serializers import (
     RoleListSerializer, RoleDetailSerializer,
     PositionListSerializer, UserPositionSerializer, RoleCreateUpdateSerializer
 )
+from apps.core.cache import cached_response
 from apps.users.views import IsAdminOrReadOnly
 from django.contrib.auth import get_user_model
 
@@ -39,6 +40,15 @@ class RoleViewSet(viewsets.ModelViewSet):
             return RoleCreateUpdateSerializer
         return RoleDetailSerializer
 
+    # Both serializers read the role's positions, and detail their units and ranks
+    @cached_response(tags=[Role, Position, UserPosition, Unit, Rank, Branch])
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cached_response(tags=[Role, Position, UserPosition, Unit, Rank, Branch])
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     @action(detail=True, methods=['get'])
     def positions(self, request, pk=None):
         """Get all positions of this role"""
@@ -1,7 +1,7 @@
 # backend/apps/users/models.py
 
 import uuid
-from datetime import timezone
+from django.utils import timezone
 
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
@@ -153,32 +153,23 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
 
     @property
     def total_leadership_days(self):
-        """Calculate total days in leadership positions"""
+        """Calculate total days in leadership positions (overlapping assignments counted once)"""
         from apps.units.models import UserPosition
 
-        leadership_positions = UserPosition.objects.filter(
-            user=self,
-            position__role__is_nco_role=True
-        ) | UserPosition.objects.filter(
-            user=self,
-            position__role__is_command_role=True
-        )
-
-        total_days = 0
-        for position in leadership_positions.distinct():
-            start = position.assignment_date
-            end = position.end_date or timezone.now()
-            total_days += (end - start).days
-
-        return total_days
+        return UserPosition.objects.filter(user=self).leadership().served_days('user_id').get(self.id, 0)
 
     def save(self, *args, **kwargs):
         """Override save to track rank changes"""
+        # Flag read by post_save handlers that depend on the holder's rank
+        self._rank_changed = False
+
         # Check if rank is changing
         if self.pk and self.current_rank:
             try:
                 old_user = User.objects.get(pk=self.pk)
                 if old_user.current_rank != self.current_rank:
+                    self._rank_changed = True
+
                     # Import here to avoid circular imports
                     from apps.units.models_promotion import UserRankHistory
 
@@ -0,0 +1,65 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.ships.models import Ship
+from apps.training.models import TrainingCertificate, UserCertificate
+from apps.units.models import Branch, Rank
+
+from .models import User
+
+
+class ProfileSparseFieldsetTests(TestCase):
+
+    # Session and user lookups made by the authentication middleware
+    AUTH_QUERIES = 2
+    SECTIONS = {'user', 'rank_history', 'positions', 'certificates', 'events', 'ships', 'statistics'}
+
+    def setUp(self):
+        branch = Branch.objects.create(name='Army', abbreviation='A')
+        rank = Rank.objects.create(name='Private', abbreviation='PVT', branch=branch, tier=1)
+        self.user = User.objects.create_user(discord_id='1', username='member', current_rank=rank)
+        issuer = User.objects.create_user(discord_id='2', username='instructor')
+        self.client.force_login(self.user)
+
+        certificate = TrainingCertificate.objects.create(name='Basic', abbreviation='BCT', branch=branch)
+        UserCertificate.objects.create(user=self.user, certificate=certificate, issuer=issuer)
+        UserCertificate.objects.create(user=self.user, certificate=certificate, issuer=issuer, is_active=False)
+        for name, approval_status in [('Lancer', 'Approved'), ('Skiff', 'Pending')]:
+            Ship.objects.create(
+                name=name, class_type='Frigate', manufacturer='Yard', owner=self.user,
+                primary_role='Escort', approval_status=approval_status
+            )
+
+    def get_profile(self, query=''):
+        response = self.client.get(f'/api/users/profile/{self.user.id}/{query}')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_default_response_has_every_section(self):
+        data = self.get_profile()
+
+        self.assertEqual(set(data), self.SECTIONS)
+        self.assertEqual(len(data['certificates']), 2)
+        self.assertEqual(len(data['ships']), 2)
+
+    def test_bare_expand_skips_expensive_sections_and_their_queries(self):
+        with CaptureQueriesContext(connection) as full:
+            self.get_profile()
+        # The user twice, its mentor, the rank history with its branch and four statistics counts
+        with self.assertNumQueries(self.AUTH_QUERIES + 9):
+            data = self.get_profile('?expand=')
+
+        self.assertEqual(set(data), {'user', 'statistics'})
+        self.assertGreater(len(full), self.AUTH_QUERIES + 9)
+
+    def test_unknown_names_are_ignored(self):
+        self.assertEqual(set(self.get_profile('?fields=ships,bogus')), {'ships'})
+
+    def test_counted_statistics_match_loaded_sections(self):
+        loaded = self.get_profile()['statistics']
+        counted = self.get_profile('?fields=statistics')['statistics']
+
+        self.assertEqual(counted, loaded)
+        self.assertEqual((counted['total_certificates'], counted['active_certificates']), (2, 1))
+        self.assertEqual((counted['total_ships'], counted['approved_ships']), (2, 1))
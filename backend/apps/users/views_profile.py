@@ -13,8 +13,9 @@ from apps.training.serializers import UserCertificateSerializer
 from apps.events.serializers import EventAttendanceSerializer
 from apps.ships.serializers import ShipListSerializer
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import Count, Q
 
+from apps.core.serializers import requested_fields
 from .serializers import UserProfileSerializer
 
 # Try to import UserRankHistory, but don't fail if it doesn't exist yet
@@ -31,10 +32,16 @@ User = get_user_model()
 
 class UserProfileDetailView(APIView):
     """
-    Get comprehensive user profile data with all related objects expanded
+    Get comprehensive user profile data with all related objects expanded.
+
+    ?fields= and ?expand= (see apps.core.serializers.requested_fields) select
+    sections; sections left out are not queried.
     """
     permission_classes = [permissions.IsAuthenticated]
 
+    sections = ['user', 'rank_history', 'positions', 'certificates', 'events', 'ships', 'statistics']
+    expandable_sections = ['rank_history', 'positions', 'certificates', 'events', 'ships']
+
     def get(self, request, pk=None):
         # If no pk provided, use current user
         if pk is None or pk == 'me':
@@ -49,9 +56,59 @@ class UserProfileDetailView(APIView):
             'branch',
         ).get(pk=user.pk)
 
-        # Get user data with expanded relations - pass request context
-        user_data = UserProfileDetailSerializer(user, context={'request': request}).data
+        selected = requested_fields(request, self.sections, self.expandable_sections)
+        response_data = {}
+
+        if 'user' in selected:
+            # Get user data with expanded relations - pass request context
+            response_data['user'] = UserProfileDetailSerializer(user, context={'request': request}).data
+
+        # Statistics are summarised from the rank history, certificates and ships
+        rank_history_data = None
+        if selected & {'rank_history', 'statistics'}:
+            rank_history_data = self.get_rank_history(user)
+        if 'rank_history' in selected:
+            response_data['rank_history'] = rank_history_data
+
+        if 'positions' in selected:
+            # Get user positions with full details
+            positions = UserPosition.objects.filter(user=user).select_related(
+                'position', 'position__role', 'position__unit', 'position__unit__branch'
+            ).order_by('-assignment_date')
+            response_data['positions'] = UserPositionSerializer(
+                positions, many=True, context={'request': request}
+            ).data
+
+        certificates_data = None
+        if 'certificates' in selected:
+            # Get user certificates with full details
+            certificates = UserCertificate.objects.filter(
+                user=user
+            ).select_related(
+                'certificate', 'issuer', 'training_event'
+            ).order_by('-issue_date')
+            certificates_data = UserCertificateSerializer(certificates, many=True, context={'request': request}).data
+            response_data['certificates'] = certificates_data
+
+        if 'events' in selected:
+            response_data['events'] = self.get_events(user)
+
+        ships_data = None
+        if 'ships' in selected:
+            # Get user ships
+            ships = Ship.objects.filter(owner=user).select_related('assigned_unit')
+            ships_data = ShipListSerializer(ships, many=True, context={'request': request}).data
+            response_data['ships'] = ships_data
+
+        if 'statistics' in selected:
+            response_data['statistics'] = self.get_statistics(
+                user, rank_history_data, certificates_data, ships_data
+            )
+
+        return Response(response_data)
 
+    def get_rank_history(self, user):
+        """Rank history entries, newest first"""
         # Get user's rank history if available
         rank_history_data = []
         if RANK_HISTORY_AVAILABLE:
@@ -122,20 +179,10 @@ class UserProfileDetailView(APIView):
                 'is_current': True
             })
 
-        # Get user positions with full details
-        positions = UserPosition.objects.filter(user=user).select_related(
-            'position', 'position__role', 'position__unit', 'position__unit__branch'
-        ).order_by('-assignment_date')
-        positions_data = UserPositionSerializer(positions, many=True, context={'request': request}).data
-
-        # Get user certificates with full details
-        certificates = UserCertificate.objects.filter(
-            user=user
-        ).select_related(
-            'certificate', 'issuer', 'training_event'
-        ).order_by('-issue_date')
-        certificates_data = UserCertificateSerializer(certificates, many=True, context={'request': request}).data
+        return rank_history_data
 
+    def get_events(self, user):
+        """The user's event attendance with event details, newest first"""
         # Get user event attendance with event details
         event_attendances = EventAttendance.objects.filter(
             user=user
@@ -168,9 +215,27 @@ class UserProfileDetailView(APIView):
             }
             events_data.append(event_dict)
 
-        # Get user ships
-        ships = Ship.objects.filter(owner=user).select_related('assigned_unit')
-        ships_data = ShipListSerializer(ships, many=True, context={'request': request}).data
+        return events_data
+
+    def get_statistics(self, user, rank_history_data, certificates_data, ships_data):
+        """Service statistics; certificates and ships are counted in the database when not loaded"""
+        if certificates_data is not None:
+            total_certificates = len(certificates_data)
+            active_certificates = len([c for c in certificates_data if c['is_active']])
+        else:
+            counts = UserCertificate.objects.filter(user=user).aggregate(
+                total=Count('id'), active=Count('id', filter=Q(is_active=True))
+            )
+            total_certificates, active_certificates = counts['total'], counts['active']
+
+        if ships_data is not None:
+            total_ships = len(ships_data)
+            approved_ships = len([s for s in ships_data if s['approval_status'] == 'Approved'])
+        else:
+            counts = Ship.objects.filter(owner=user).aggregate(
+                total=Count('id'), approved=Count('id', filter=Q(approval_status='Approved'))
+            )
+            total_ships, approved_ships = counts['total'], counts['approved']
 
         # Calculate statistics
         days_in_service = (timezone.now() - user.join_date).days if user.join_date else 0
@@ -183,30 +248,20 @@ class UserProfileDetailView(APIView):
             event__start_time__gt=timezone.now()
         ).count()
 
-        response_data = {
-            'user': user_data,
-            'rank_history': rank_history_data,
-            'positions': positions_data,
-            'certificates': certificates_data,
-            'events': events_data,
-            'ships': ships_data,
-            'statistics': {
-                'days_in_service': days_in_service,
-                'completed_operations': completed_ops,
-                'upcoming_operations': upcoming_ops,
-                'total_certificates': len(certificates_data),
-                'active_certificates': len([c for c in certificates_data if c['is_active']]),
-                'total_ships': len(ships_data),
-                'approved_ships': len([s for s in ships_data if s['approval_status'] == 'Approved']),
-                'total_ranks_held': len(rank_history_data),
-                'days_at_current_rank': rank_history_data[0]['duration_days'] if rank_history_data and
-                                                                                 rank_history_data[0][
-                                                                                     'is_current'] else 0
-            }
+        return {
+            'days_in_service': days_in_service,
+            'completed_operations': completed_ops,
+            'upcoming_operations': upcoming_ops,
+            'total_certificates': total_certificates,
+            'active_certificates': active_certificates,
+            'total_ships': total_ships,
+            'approved_ships': approved_ships,
+            'total_ranks_held': len(rank_history_data),
+            'days_at_current_rank': rank_history_data[0]['duration_days'] if rank_history_data and
+                                                                             rank_history_data[0][
+                                                                                 'is_current'] else 0
         }
 
-        return Response(response_data)
-
 
 class UserRankProgressionView(APIView):
     """
@@ -42,6 +42,7 @@ urlpatterns = [
     path('api/vehicles/', include('apps.vehicles.urls')),
     path('api/roles/', include('apps.units.urls_roles')),  # Can remove this duplicate
     path('api/positions/', include('apps.units.urls_positions')),  # Can remove this duplicate
+    path('api/core/', include('apps.core.urls')),
 ]
 # Add static files handling
 if settings.DEBUG: